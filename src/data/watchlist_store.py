@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sqlite3
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 DEFAULT_WATCHLIST_DB = Path(__file__).resolve().parent / "watchlists.db"
 
@@ -86,5 +86,15 @@ class WatchlistStore:
             conn.execute("DELETE FROM watchlist_symbols WHERE watchlist_id=? AND symbol=?;", (watchlist_id, symbol))
             conn.commit()
 
+    def remove_symbols(self, watchlist_id: int, symbols: Sequence[str]) -> None:
+        if not symbols:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "DELETE FROM watchlist_symbols WHERE watchlist_id=? AND symbol=?;",
+                [(watchlist_id, sym) for sym in symbols],
+            )
+            conn.commit()
+
 
 __all__ = ["WatchlistStore", "DEFAULT_WATCHLIST_DB"]
@@ -72,6 +72,9 @@ except Exception:
     render_echarts_demo = None
     ECHARTS_TEMPLATE_PATH = Path(__file__).parent / "rendering" / "templates" / "echarts_demo.html"
 
+# Path -> resolved display string; entries are dropped when data_dir/db_path change.
+_PATH_CACHE: Dict[Path, str] = {}
+
 
 class DebuggableWebEnginePage(QWebEnginePage):
     consoleMessage = QtCore.pyqtSignal(str)
@@ -209,6 +212,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._init_kline_controller()
         self._init_workbench_controller()
+        if self.quotes_view:
+            self.quotes_view.rebind_host()
 
         self.statusBar().showMessage("就绪")
         # 导入进度条(用于导入过程的可视反馈)
@@ -376,12 +381,17 @@ class MainWindow(QtWidgets.QMainWindow):
         center_width = max(total_width - left_width, 600)
         splitter.setSizes([left_width, center_width, 0])
 
-    def _format_path(self, path_value: Optional[Path]) -> str:
+    @staticmethod
+    def _format_path(path_value: Optional[Path]) -> str:
         if isinstance(path_value, Path):
-            try:
-                return str(path_value.resolve())
-            except Exception:
-                return str(path_value)
+            cached = _PATH_CACHE.get(path_value)
+            if cached is None:
+                try:
+                    cached = str(path_value.resolve())
+                except Exception:
+                    cached = str(path_value)
+                _PATH_CACHE[path_value] = cached
+            return cached
         return "未选择"
 
     def _refresh_data_page_labels(self) -> None:
@@ -398,6 +408,22 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.import_status_label is not None:
             self.import_status_label.setText(text)
 
+    def _set_data_progress(self, *, visible: bool, maximum: int = 1, value: int = 0) -> None:
+        """Update the data-page progress bar, touching Qt only for values that changed."""
+        progress = self.data_page_progress
+        if progress is None:
+            return
+        if progress.minimum() != 0 or progress.maximum() != maximum:
+            progress.setRange(0, maximum)
+        if maximum > 0 and progress.value() != value:
+            progress.setValue(value)
+        if progress.isHidden() == visible:
+            # Toggle without an intermediate paint, then schedule a single update().
+            progress.setUpdatesEnabled(False)
+            progress.setVisible(visible)
+            progress.setUpdatesEnabled(True)
+            progress.update()
+
     def _set_symbol_panel_visible(self, visible: bool) -> None:
         if self.stock_panel:
             self.stock_panel.setVisible(visible)
@@ -533,6 +559,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.watchlist_store.add_symbols(wid, items)
             self.append_log(f"已加入自选: {', '.join(sym for sym, _ in items)}")
             if self.quotes_view:
+                self.quotes_view.invalidate_watchlist_cache(wid)
                 self.quotes_view.refresh_watchlist_view(wid)
         except Exception as exc:
             self.append_log(f"加入自选失败: {exc}")
@@ -589,6 +616,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if not directory:
             return
 
+        if self.data_dir is not None:
+            _PATH_CACHE.pop(self.data_dir, None)
         self.data_dir = Path(directory)
         self.append_log(f"已选择数据目录: {self.data_dir}")
         self.statusBar().showMessage(f"数据目录: {self.data_dir}")
@@ -607,6 +636,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not file_path:
             return
 
+        _PATH_CACHE.pop(self.db_path, None)
         self.db_path = Path(file_path)
         self.append_log(f"数据库路径已更新为: {self.db_path}")
         self._refresh_data_page_labels()
@@ -676,9 +706,7 @@ class MainWindow(QtWidgets.QMainWindow):
             start_date = self.tushare_start_date.date().toString("yyyyMMdd")
         if self.tushare_end_date:
             end_date = self.tushare_end_date.date().toString("yyyyMMdd")
-        if self.data_page_progress:
-            self.data_page_progress.setRange(0, 0)
-            self.data_page_progress.setVisible(True)
+        self._set_data_progress(visible=True, maximum=0)
         if self.import_status_label:
             self.import_status_label.setText("Tushare 更新中...")
         if self.tushare_status_label:
@@ -722,9 +750,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not token:
             QtWidgets.QMessageBox.information(self, "缺少 Token", "请先粘贴 Tushare Token")
             return
-        if self.data_page_progress:
-            self.data_page_progress.setRange(0, 0)
-            self.data_page_progress.setVisible(True)
+        self._set_data_progress(visible=True, maximum=0)
         if self.tushare_status_label:
             self.tushare_status_label.setText("测试中...")
 
@@ -744,10 +770,7 @@ class MainWindow(QtWidgets.QMainWindow):
         thread.start()
 
     def _on_tushare_finished(self, stats: object) -> None:
-        if self.data_page_progress:
-            self.data_page_progress.setVisible(False)
-            self.data_page_progress.setRange(0, 1)
-            self.data_page_progress.setValue(0)
+        self._set_data_progress(visible=False)
         summary = getattr(stats, "__dict__", {}) if hasattr(stats, "__dict__") else {}
         success = summary.get("succeeded", "?")
         failed = summary.get("failed", 0)
@@ -761,10 +784,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.refresh_symbols_async()
 
     def _on_tushare_failed(self, message: str) -> None:
-        if self.data_page_progress:
-            self.data_page_progress.setVisible(False)
-            self.data_page_progress.setRange(0, 1)
-            self.data_page_progress.setValue(0)
+        self._set_data_progress(visible=False)
         self.append_log(f"[Tushare] 失败: {message}", force_show=True)
         QtWidgets.QMessageBox.critical(self, "Tushare 同步失败", message)
         if self.import_status_label:
@@ -773,30 +793,20 @@ class MainWindow(QtWidgets.QMainWindow):
             self.tushare_status_label.setText("同步失败")
 
     def _on_tushare_progress(self, current: int, total: int) -> None:
-        if not self.data_page_progress:
-            return
-        self.data_page_progress.setVisible(True)
         if total <= 0:
-            self.data_page_progress.setRange(0, 0)
+            self._set_data_progress(visible=True, maximum=0)
             return
-        self.data_page_progress.setRange(0, total)
-        self.data_page_progress.setValue(max(0, min(current, total)))
+        self._set_data_progress(visible=True, maximum=total, value=max(0, min(current, total)))
 
     def _on_tushare_test_finished(self, message: str) -> None:
-        if self.data_page_progress:
-            self.data_page_progress.setVisible(False)
-            self.data_page_progress.setRange(0, 1)
-            self.data_page_progress.setValue(0)
+        self._set_data_progress(visible=False)
         self.append_log(f"[Tushare测试] {message}", force_show=True)
         QtWidgets.QMessageBox.information(self, "Tushare 测试", message)
         if self.tushare_status_label:
             self.tushare_status_label.setText("测试通过")
 
     def _on_tushare_test_failed(self, message: str) -> None:
-        if self.data_page_progress:
-            self.data_page_progress.setVisible(False)
-            self.data_page_progress.setRange(0, 1)
-            self.data_page_progress.setValue(0)
+        self._set_data_progress(visible=False)
         self.append_log(f"[Tushare测试] {message}", force_show=True)
         QtWidgets.QMessageBox.warning(self, "Tushare 测试失败", message)
         if self.tushare_status_label:
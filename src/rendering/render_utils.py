@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import random
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -32,6 +33,12 @@ ECHARTS_PREVIEW_TEMPLATE_PATH = Path(__file__).parent / "templates" / "echarts_p
 BACKTEST_EQUITY_TEMPLATE_PATH = Path(__file__).parent / "templates" / "backtest_equity.html"
 
 
+@lru_cache(maxsize=8)
+def _read_template(path: Path) -> str:
+    """模板文件在进程内只读一次；文件缺失时抛出 FileNotFoundError（异常不会被缓存）。"""
+    return path.read_text(encoding="utf-8")
+
+
 class SafeJSONEncoder(json.JSONEncoder):
     """
     JSON Encoder that handles:
@@ -60,7 +67,7 @@ def render_html(
     overlays: Optional[List[Dict[str, Any]]] = None,
 ) -> str:
     try:
-        template = TEMPLATE_PATH.read_text(encoding="utf-8")
+        template = _read_template(TEMPLATE_PATH)
     except FileNotFoundError as exc:
         raise RuntimeError(f"未找到模板文件 {TEMPLATE_PATH}. 请确认 {TEMPLATE_FILENAME} 与脚本位于同一目录。") from exc
 
@@ -101,7 +108,7 @@ def render_echarts_demo(
     overlays: Optional[List[Dict[str, Any]]] = None,
 ) -> str:
     try:
-        template = ECHARTS_TEMPLATE_PATH.read_text(encoding="utf-8")
+        template = _read_template(ECHARTS_TEMPLATE_PATH)
     except FileNotFoundError as exc:
         raise RuntimeError(f"未找到模板文件 {ECHARTS_TEMPLATE_PATH}。") from exc
 
@@ -122,7 +129,7 @@ def render_echarts_preview(
     title: str = "ECharts 策略预览",
 ) -> str:
     try:
-        template = ECHARTS_PREVIEW_TEMPLATE_PATH.read_text(encoding="utf-8")
+        template = _read_template(ECHARTS_PREVIEW_TEMPLATE_PATH)
     except FileNotFoundError as exc:
         raise RuntimeError(f"未找到模板文件 {ECHARTS_PREVIEW_TEMPLATE_PATH}。") from exc
 
@@ -166,7 +173,7 @@ def render_backtest_equity(
     title: str = "收益曲线",
 ) -> str:
     try:
-        template = BACKTEST_EQUITY_TEMPLATE_PATH.read_text(encoding="utf-8")
+        template = _read_template(BACKTEST_EQUITY_TEMPLATE_PATH)
     except FileNotFoundError as exc:
         raise RuntimeError(f"未找到模板文件 {BACKTEST_EQUITY_TEMPLATE_PATH}。") from exc
 
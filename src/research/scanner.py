@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional
 
 from PyQt5 import QtCore  # type: ignore[import-not-found]
 
@@ -13,6 +13,18 @@ from .models import ScanRequest, ScanResult, StrategyContext
 from .strategy_registry import StrategyRegistry
 
 
+# 未显式指定 max_workers 时的线程数：'io' 适合以数据库读取为主的扫描，
+# 'cpu' 适合计算密集型策略（线程数不超过核数，避免争抢 GIL）。
+WorkerMode = Literal['io', 'cpu']
+
+
+def default_max_workers(worker_mode: WorkerMode = 'io') -> int:
+    cpu_count = os.cpu_count() or 4
+    if worker_mode == 'cpu':
+        return max(1, cpu_count)
+    return max(1, min(64, cpu_count * 4))
+
+
 class ScanCancelled(RuntimeError):
     """Raised when a scan task is cancelled mid-way."""
 
@@ -70,16 +82,20 @@ class StrategyScanner(QtCore.QObject):
         batch_size: int = 32,
         max_workers: Optional[int] = None,
         rows_per_symbol: Optional[int] = 1500,
+        worker_mode: WorkerMode = 'io',
     ) -> None:
         super().__init__(parent)
         self.registry = registry
         self._worker_thread: Optional[QtCore.QThread] = None
         self._worker: Optional[StrategyScanWorker] = None
         self.batch_size = max(1, batch_size)
-        cpu_default = os.cpu_count() or 4
-        self.max_workers = max(1, max_workers or min(32, cpu_default * 4))
+        self.max_workers = max(1, max_workers or default_max_workers(worker_mode))
         self.rows_per_symbol = rows_per_symbol
 
+    def set_batch_size(self, batch_size: int) -> None:
+        """调整每批预加载的股票数；仅影响之后启动的扫描。"""
+        self.batch_size = max(1, int(batch_size))
+
     def run(self, request: ScanRequest, db_path) -> List[ScanResult]:
         try:
             results = self._execute(request, db_path, progress_callback=self.progress.emit, result_callback=self.result.emit)
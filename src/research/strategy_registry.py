@@ -17,6 +17,19 @@ class StrategyRegistry:
             raise ValueError(f"重复的策略 key: {definition.key}")
         self._strategies[definition.key] = definition
 
+    def register_many(self, definitions: Iterable[StrategyDefinition], *, skip_existing: bool = False) -> int:
+        """批量注册；skip_existing=True 时跳过已注册的 key。返回新注册的数量。"""
+        strategies = self._strategies
+        added = 0
+        for definition in definitions:
+            if definition.key in strategies:
+                if skip_existing:
+                    continue
+                raise ValueError(f"重复的策略 key: {definition.key}")
+            strategies[definition.key] = definition
+            added += 1
+        return added
+
     def unregister(self, key: str) -> None:
         self._strategies.pop(key, None)
 
@@ -391,19 +391,34 @@ class DonchianBreakoutStrategy:
         }
 
 
+def _param_int(params: Dict[str, Any], key: str, default: int) -> int:
+    value = params.get(key, default)
+    # 面板数值控件传来的通常已是 int，直接返回，省去 float->int 往返转换
+    if type(value) is int:
+        return value
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _param_float(params: Dict[str, Any], key: str, default: float) -> float:
+    value = params.get(key, default)
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
 def run_ma_workbench(context: "StrategyContext") -> "StrategyRunResult":
     if StrategyContext is None or StrategyRunResult is None:
         raise RuntimeError("Strategy runtime not available.")
     params = context.params or {}
 
-    def _get_int(key: str, default: int) -> int:
-        try:
-            return int(float(params.get(key, default)))
-        except (TypeError, ValueError):
-            return default
-
-    short_window = max(3, _get_int("short_window", 20))
-    long_window = max(short_window + 1, _get_int("long_window", 50))
+    short_window = max(3, _param_int(params, "short_window", 20))
+    long_window = max(short_window + 1, _param_int(params, "long_window", 50))
 
     strategy = MovingAverageCrossoverStrategy(short_window=short_window, long_window=long_window)
     raw_result = strategy.scan_current_symbol(context.db_path, context.table_name)
@@ -415,21 +430,9 @@ def run_rsi_workbench(context: "StrategyContext") -> "StrategyRunResult":
         raise RuntimeError("Strategy runtime not available.")
     params = context.params or {}
 
-    def _get_int(key: str, default: int) -> int:
-        try:
-            return int(float(params.get(key, default)))
-        except (TypeError, ValueError):
-            return default
-
-    def _get_float(key: str, default: float) -> float:
-        try:
-            return float(params.get(key, default))
-        except (TypeError, ValueError):
-            return default
-
-    period = max(2, _get_int("period", 14))
-    oversold = max(0.0, min(_get_float("oversold", 30.0), 99.0))
-    overbought = max(oversold + 1.0, min(_get_float("overbought", 70.0), 100.0))
+    period = max(2, _param_int(params, "period", 14))
+    oversold = max(0.0, min(_param_float(params, "oversold", 30.0), 99.0))
+    overbought = max(oversold + 1.0, min(_param_float(params, "overbought", 70.0), 100.0))
 
     strategy = RSIMeanReversionStrategy(period=period, oversold=oversold, overbought=overbought)
     raw_result = strategy.scan_current_symbol(context.db_path, context.table_name)
@@ -441,13 +444,7 @@ def run_donchian_workbench(context: "StrategyContext") -> "StrategyRunResult":
         raise RuntimeError("Strategy runtime not available.")
     params = context.params or {}
 
-    def _get_int(key: str, default: int) -> int:
-        try:
-            return int(float(params.get(key, default)))
-        except (TypeError, ValueError):
-            return default
-
-    lookback = max(5, _get_int("lookback", 20))
+    lookback = max(5, _param_int(params, "lookback", 20))
 
     strategy = DonchianBreakoutStrategy(lookback=lookback)
     raw_result = strategy.scan_current_symbol(context.db_path, context.table_name)
@@ -9,6 +9,10 @@ except Exception:  # pragma: no cover - optional dependency
 
 from ..research import StrategyRunResult
 
+# 交易补充标记的公共字段，逐笔只需复制后填入 id/time/text
+_BUY_MARKER_BASE: Dict[str, Any] = {"position": "belowBar", "color": "#22c55e", "shape": "triangle"}
+_SELL_MARKER_BASE: Dict[str, Any] = {"position": "aboveBar", "color": "#f87171", "shape": "triangle"}
+
 
 def serialize_run_result(strategy_name: str, raw_result: Any) -> StrategyRunResult:
     """将策略的原始运行结果统一转换为 StrategyRunResult。"""
@@ -51,51 +55,52 @@ def augment_markers_with_trade_signals(
         return markers
 
     enriched = list(markers)
-    def _is_buy(text: str) -> bool:
-        upper = text.upper()
-        return "BUY" in upper or "买" in text
-
-    def _is_sell(text: str) -> bool:
+    # 单次遍历完成买/卖分类，每条标记只做一次 upper()
+    buy_times: Set[Any] = set()
+    sell_times: Set[Any] = set()
+    # 循环内频繁调用的方法提前绑定为局部变量
+    buy_add = buy_times.add
+    sell_add = sell_times.add
+    enriched_append = enriched.append
+    safe_float = _safe_float
+    for marker in markers:
+        text = marker.get("text")
+        if not isinstance(text, str):
+            continue
         upper = text.upper()
-        return "SELL" in upper or "卖" in text
-
-    buy_times: Set[Any] = {m.get("time") for m in markers if isinstance(m.get("text"), str) and _is_buy(m["text"])}
-    sell_times: Set[Any] = {m.get("time") for m in markers if isinstance(m.get("text"), str) and _is_sell(m["text"])}
+        if "BUY" in upper or "买" in text:
+            buy_add(marker.get("time"))
+        if "SELL" in upper or "卖" in text:
+            sell_add(marker.get("time"))
 
     for idx, trade in enumerate(trades):
-        entry_time = trade.get("entry_time") or trade.get("entryTime")
-        entry_price = _safe_float(trade.get("entry_price") or trade.get("entryPrice"))
-        entry_label = trade.get("entry_reason") or trade.get("entryReason")
+        get = trade.get
+        entry_time = get("entry_time") or get("entryTime")
         if entry_time and entry_time not in buy_times:
-            text = entry_label or (f"买入 {entry_price:.2f}" if entry_price is not None else "买入")
-            enriched.append(
-                {
-                    "id": f"{strategy_key}_buy_{idx}",
-                    "time": entry_time,
-                    "position": "belowBar",
-                    "color": "#22c55e",
-                    "shape": "triangle",
-                    "text": text,
-                }
-            )
-            buy_times.add(entry_time)
+            # 价格只在没有进场说明时才用于生成文字，按需解析
+            text = get("entry_reason") or get("entryReason")
+            if not text:
+                entry_price = safe_float(get("entry_price") or get("entryPrice"))
+                text = f"买入 {entry_price:.2f}" if entry_price is not None else "买入"
+            marker = _BUY_MARKER_BASE.copy()
+            marker["id"] = f"{strategy_key}_buy_{idx}"
+            marker["time"] = entry_time
+            marker["text"] = text
+            enriched_append(marker)
+            buy_add(entry_time)
 
-        exit_time = trade.get("exit_time") or trade.get("exitTime")
-        exit_price = _safe_float(trade.get("exit_price") or trade.get("exitPrice"))
-        exit_label = trade.get("exit_reason") or trade.get("exitReason")
+        exit_time = get("exit_time") or get("exitTime")
         if exit_time and exit_time not in sell_times:
-            text = exit_label or (f"卖出 {exit_price:.2f}" if exit_price is not None else "卖出")
-            enriched.append(
-                {
-                    "id": f"{strategy_key}_sell_{idx}",
-                    "time": exit_time,
-                    "position": "aboveBar",
-                    "color": "#f87171",
-                    "shape": "triangle",
-                    "text": text,
-                }
-            )
-            sell_times.add(exit_time)
+            text = get("exit_reason") or get("exitReason")
+            if not text:
+                exit_price = safe_float(get("exit_price") or get("exitPrice"))
+                text = f"卖出 {exit_price:.2f}" if exit_price is not None else "卖出"
+            marker = _SELL_MARKER_BASE.copy()
+            marker["id"] = f"{strategy_key}_sell_{idx}"
+            marker["time"] = exit_time
+            marker["text"] = text
+            enriched_append(marker)
+            sell_add(exit_time)
     return enriched
 
 
@@ -1,11 +1,31 @@
 """UI helper widgets and controllers."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .controllers.kline_controller import KLineController
-from .controllers.strategy_menu_controller import StrategyMenuController
 from .controllers.workbench_controller import StrategyWorkbenchController
-from .panels import StrategyWorkbenchPanel
 from .echarts_preview_dialog import EChartsPreviewDialog
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .controllers.strategy_menu_controller import StrategyMenuController
+    from .panels import StrategyWorkbenchPanel
+
+# 这两个模块会连带导入全部内置策略/research 包，首次访问时再导入 (PEP 562)
+_LAZY_EXPORTS = {
+    "StrategyMenuController": ".controllers.strategy_menu_controller",
+    "StrategyWorkbenchPanel": ".panels",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     "KLineController",
     "StrategyMenuController",
@@ -1,13 +1,32 @@
 """UI controller helpers."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .import_controller import ImportController
 from .kline_controller import KLineController
 from .log_console import LogConsole
-from .strategy_menu_controller import StrategyMenuController
 from .strategy_panel_controller import StrategyPanelController
 from .symbol_list_manager import SymbolListManager
 from .workbench_controller import StrategyWorkbenchController
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .strategy_menu_controller import StrategyMenuController
+
+# 菜单控制器在模块级导入全部内置策略，首次访问时再导入 (PEP 562)
+_LAZY_EXPORTS = {
+    "StrategyMenuController": ".strategy_menu_controller",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
 	"SymbolListManager",
 	"ImportController",
@@ -142,5 +142,8 @@ class ImportController(QtCore.QObject):
         progress = self._data_progress_getter()
         if progress is None:
             return
-        progress.setVisible(visible)
-        progress.setRange(0, 0 if indeterminate else 1)
\ No newline at end of file
+        maximum = 0 if indeterminate else 1
+        if progress.maximum() != maximum:
+            progress.setRange(0, maximum)
+        if progress.isHidden() == visible:
+            progress.setVisible(visible)
\ No newline at end of file
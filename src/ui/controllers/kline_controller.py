@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import array
 import json
 import sqlite3
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from PyQt5 import QtCore, QtWidgets  # type: ignore[import-not-found]
 from PyQt5.QtWebEngineWidgets import QWebEngineView  # type: ignore[import-not-found]
@@ -37,28 +38,43 @@ else:  # pragma: no cover
 
 
 class SymbolFilterWorker(QtCore.QObject):
-    """Background worker that filters large symbol datasets."""
+    """Background worker that filters large symbol datasets.
+
+    The master entry list is pushed once via :meth:`set_entries`; each filter
+    request then only carries ``(request_id, query)`` and the result is an
+    ``array.array('i')`` of matching positions into that list.
+    """
 
     result_ready = QtCore.pyqtSignal(int, object, str)
     error = QtCore.pyqtSignal(int, str)
 
-    @QtCore.pyqtSlot(int, object, str)
-    def apply_filter(self, request_id: int, entries: object, query: str) -> None:
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._haystacks: List[List[str]] = []
+
+    @QtCore.pyqtSlot(object)
+    def set_entries(self, entries: object) -> None:
+        haystacks: List[List[str]] = []
+        for entry in list(entries or []):
+            if not isinstance(entry, dict):
+                haystacks.append([])
+                continue
+            values = [entry.get("symbol", ""), entry.get("name", ""), entry.get("table", "")]
+            haystacks.append([str(value).lower() for value in values if value])
+        self._haystacks = haystacks
+
+    @QtCore.pyqtSlot(int, str)
+    def apply_filter(self, request_id: int, query: str) -> None:
         try:
-            dataset = list(entries or [])
             query_lower = (query or "").strip().lower()
             if not query_lower:
-                filtered = dataset
+                indices = array.array("i", range(len(self._haystacks)))
             else:
-                filtered: List[Dict[str, Any]] = []
-                for entry in dataset:
-                    if not isinstance(entry, dict):
-                        continue
-                    haystacks = [entry.get("symbol", ""), entry.get("name", ""), entry.get("table", "")]
-                    haystacks = [str(value).lower() for value in haystacks if value]
+                indices = array.array("i")
+                for idx, haystacks in enumerate(self._haystacks):
                     if any(query_lower in text for text in haystacks):
-                        filtered.append(entry)
-            self.result_ready.emit(request_id, filtered, query_lower)
+                        indices.append(idx)
+            self.result_ready.emit(request_id, indices, query_lower)
         except Exception as exc:  # pragma: no cover - defensive fallback
             self.error.emit(request_id, str(exc))
 
@@ -68,7 +84,8 @@ class KLineController(QtCore.QObject):
 
     symbol_changed = QtCore.pyqtSignal(str)
     symbols_updated = QtCore.pyqtSignal(list)
-    filter_requested = QtCore.pyqtSignal(int, object, str)
+    entries_pushed = QtCore.pyqtSignal(object)
+    filter_requested = QtCore.pyqtSignal(int, str)
 
     def __init__(
         self,
@@ -108,11 +125,15 @@ class KLineController(QtCore.QObject):
         self._symbol_loader: Optional[QtCore.QObject] = None
         self._candle_load_thread: Optional[QtCore.QThread] = None
         self._candle_loader: Optional[QtCore.QObject] = None
+        self._candle_request_counter = 0
+        self._candle_jobs: Dict[int, Tuple[QtCore.QThread, QtCore.QObject]] = {}
         self._filter_thread: Optional[QtCore.QThread] = None
         self._filter_worker: Optional[SymbolFilterWorker] = None
         self._filter_request_counter = 0
         self._latest_filter_result_id = 0
         self._filter_request_meta: Dict[int, Dict[str, Any]] = {}
+        self._pushed_entries_source: Optional[List[Dict[str, Any]]] = None
+        self._pushed_entries: List[Dict[str, Any]] = []
         self.destroyed.connect(self._cleanup_filter_worker)
 
         self.symbol_combo.currentIndexChanged.connect(self._on_symbol_index_changed)
@@ -312,15 +333,11 @@ class KLineController(QtCore.QObject):
             if table_to_load:
                 self._start_candle_load_worker(table_to_load, chosen)
 
-    def _on_candle_load_finished(self, data: object, chosen: Dict[str, Any]) -> None:
-        if self._candle_load_thread:
-            try:
-                self._candle_load_thread.quit()
-                self._candle_load_thread.wait(2000)
-            except Exception:
-                pass
-            self._candle_load_thread = None
-            self._candle_loader = None
+    def _on_candle_load_finished(self, data: object, chosen: Dict[str, Any], request_id: int) -> None:
+        self._release_candle_job(request_id)
+        if request_id < self._candle_request_counter:
+            # A newer selection superseded this load; its worker will render instead.
+            return
 
         if data is None:
             symbol_label = chosen.get("symbol") or chosen.get("table") or "?"
@@ -356,14 +373,6 @@ class KLineController(QtCore.QObject):
         table_name = entry.get("table")
         if not table_name or CandleLoadWorker is None:
             return
-        if self._candle_load_thread:
-            try:
-                self._candle_load_thread.quit()
-                self._candle_load_thread.wait(2000)
-            except Exception:
-                pass
-            self._candle_load_thread = None
-            self._candle_loader = None
 
         self.loading_progress.setVisible(True)
         self._log(f"启动后台加载 K 线数据: {entry.get('display')}")
@@ -386,13 +395,37 @@ class KLineController(QtCore.QObject):
         self.status_bar.showMessage(message)
 
     def _start_candle_load_worker(self, table_name: str, chosen: Dict[str, Any]) -> None:
-        self._candle_load_thread = QtCore.QThread(self)
-        self._candle_loader = CandleLoadWorker(self.db_path, table_name)
-        self._candle_loader.moveToThread(self._candle_load_thread)
-        self._candle_load_thread.started.connect(self._candle_loader.run)
-        self._candle_loader.finished.connect(lambda data, c=chosen: self._on_candle_load_finished(data, c))
-        self._candle_loader.failed.connect(lambda e: self._log(f"加载 K 线失败: {e}"))
-        self._candle_load_thread.start()
+        self._candle_request_counter += 1
+        request_id = self._candle_request_counter
+        thread = QtCore.QThread(self)
+        loader = CandleLoadWorker(self.db_path, table_name)
+        loader.moveToThread(thread)
+        thread.started.connect(loader.run)
+        loader.finished.connect(
+            lambda data, c=chosen, rid=request_id: self._on_candle_load_finished(data, c, rid)
+        )
+        loader.failed.connect(lambda e, rid=request_id: self._on_candle_load_failed(e, rid))
+        thread.finished.connect(loader.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._candle_jobs[request_id] = (thread, loader)
+        self._candle_load_thread = thread
+        self._candle_loader = loader
+        thread.start()
+
+    def _on_candle_load_failed(self, message: str, request_id: int) -> None:
+        self._release_candle_job(request_id)
+        self._log(f"加载 K 线失败: {message}")
+
+    def _release_candle_job(self, request_id: int) -> None:
+        job = self._candle_jobs.pop(request_id, None)
+        if not job:
+            return
+        thread, _loader = job
+        # Non-blocking: the thread winds down on its own and deleteLater cleans up.
+        thread.quit()
+        if self._candle_load_thread is thread:
+            self._candle_load_thread = None
+            self._candle_loader = None
 
     def _ensure_filter_worker(self) -> None:
         if self._filter_worker is not None and self._filter_thread is not None:
@@ -402,7 +435,9 @@ class KLineController(QtCore.QObject):
         worker.moveToThread(thread)
         worker.result_ready.connect(self._on_filter_result)
         worker.error.connect(self._on_filter_error)
+        self.entries_pushed.connect(worker.set_entries)
         self.filter_requested.connect(worker.apply_filter)
+        self._pushed_entries_source = None
         thread.start()
         self._filter_thread = thread
         self._filter_worker = worker
@@ -415,6 +450,10 @@ class KLineController(QtCore.QObject):
                 self.filter_requested.disconnect(worker.apply_filter)
             except Exception:
                 pass
+            try:
+                self.entries_pushed.disconnect(worker.set_entries)
+            except Exception:
+                pass
             try:
                 worker.result_ready.disconnect(self._on_filter_result)
             except Exception:
@@ -430,8 +469,9 @@ class KLineController(QtCore.QObject):
             thread.deleteLater()
         self._filter_worker = None
         self._filter_thread = None
+        self._pushed_entries_source = None
 
-    def _on_filter_result(self, request_id: int, filtered_entries: object, query: str) -> None:
+    def _on_filter_result(self, request_id: int, indices: object, query: str) -> None:
         meta = self._filter_request_meta.pop(request_id, None)
         if request_id < self._latest_filter_result_id:
             return
@@ -439,7 +479,8 @@ class KLineController(QtCore.QObject):
         select = meta.get("select") if meta else None
         maintain = meta.get("maintain") if meta else False
         query_text = meta.get("query", query) if meta else query
-        dataset = list(filtered_entries or [])
+        source = meta.get("entries", self._pushed_entries) if meta else self._pushed_entries
+        dataset = [source[i] for i in (indices or ()) if 0 <= i < len(source)]
         self._update_filter_ui(dataset, select=select, maintain_selection=maintain, query=query_text)
 
     def _on_filter_error(self, request_id: int, message: str) -> None:
@@ -517,19 +558,24 @@ class KLineController(QtCore.QObject):
 
     def _apply_symbol_filter(self, *, select: Optional[str] = None, maintain_selection: bool) -> None:
         query = self.symbol_search.text().strip().lower()
-        entries_snapshot = list(self.symbol_entries)
-        if not entries_snapshot:
+        if not self.symbol_entries:
             self._update_filter_ui([], select=select, maintain_selection=maintain_selection, query=query)
             return
         self._ensure_filter_worker()
+        if self._pushed_entries_source is not self.symbol_entries:
+            # Ship the master list to the worker once per refresh; requests only carry the query.
+            self._pushed_entries_source = self.symbol_entries
+            self._pushed_entries = list(self.symbol_entries)
+            self.entries_pushed.emit(self._pushed_entries)
         self._filter_request_counter += 1
         request_id = self._filter_request_counter
         self._filter_request_meta[request_id] = {
             "select": select,
             "maintain": maintain_selection,
             "query": query,
+            "entries": self._pushed_entries,
         }
-        self.filter_requested.emit(request_id, entries_snapshot, query)
+        self.filter_requested.emit(request_id, query)
 
     def _reset_combo(self, placeholder: str) -> None:
         self.symbol_combo.blockSignals(True)
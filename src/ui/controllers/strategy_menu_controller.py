@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from PyQt5 import QtCore, QtWidgets  # type: ignore[import-not-found]
 
@@ -54,6 +54,9 @@ class StrategyMenuController(QtCore.QObject):
         self._selector_available = selector_available
         self._strategy_definitions: List[Dict[str, Any]] = []
         self._actions: List[QtWidgets.QAction] = []
+        # 按策略 key 缓存已创建的 QAction 及其处理函数，重建菜单时复用而不是重新创建和连接。
+        self._action_by_key: Dict[str, Tuple[Callable[[], None], QtWidgets.QAction]] = {}
+        self._placeholder_action: Optional[QtWidgets.QAction] = None
         self._echarts_dialog: Optional[EChartsPreviewDialog] = None
 
     def clear(self) -> None:
@@ -106,24 +109,46 @@ class StrategyMenuController(QtCore.QObject):
         return True
 
     def _rebuild_menu(self) -> None:
+        # QAction 的父对象是主窗口，menu.clear() 只移除不销毁，可安全复用。
         self.menu.clear()
         self._actions.clear()
 
+        wanted_keys = set()
         for definition in self._strategy_definitions:
-            action = QtWidgets.QAction(definition["title"], self.parent_window)
-            action.triggered.connect(definition["handler"])
+            key = definition["key"]
+            wanted_keys.add(key)
+            action = self._action_for(definition)
             action.setEnabled(self._strategy_enabled(definition))
-            description = definition.get("description")
-            if description:
-                action.setStatusTip(description)
-                action.setToolTip(description)
             self.menu.addAction(action)
             self._actions.append(action)
 
+        for key in [key for key in self._action_by_key if key not in wanted_keys]:
+            _, stale = self._action_by_key.pop(key)
+            stale.deleteLater()
+
         if not self._actions:
-            placeholder = QtWidgets.QAction("暂无可用策略", self.parent_window)
-            placeholder.setEnabled(False)
-            self.menu.addAction(placeholder)
+            if self._placeholder_action is None:
+                self._placeholder_action = QtWidgets.QAction("暂无可用策略", self.parent_window)
+                self._placeholder_action.setEnabled(False)
+            self.menu.addAction(self._placeholder_action)
+
+    def _action_for(self, definition: Dict[str, Any]) -> QtWidgets.QAction:
+        key = definition["key"]
+        handler = definition["handler"]
+        cached = self._action_by_key.get(key)
+        if cached is not None and cached[0] == handler:
+            action = cached[1]
+        else:
+            if cached is not None:
+                cached[1].deleteLater()
+            action = QtWidgets.QAction(self.parent_window)
+            action.triggered.connect(handler)
+            self._action_by_key[key] = (handler, action)
+        action.setText(definition["title"])
+        description = definition.get("description") or ""
+        action.setStatusTip(description)
+        action.setToolTip(description or definition["title"])
+        return action
 
     # ------------------------------------------------------------------
     # 策略实现
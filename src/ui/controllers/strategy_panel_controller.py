@@ -43,6 +43,8 @@ class StrategyPanelController(QtCore.QObject):
         if self._initialized:
             return
         host = self._host
+        if host.strategy_sidebar is None and host.quotes_view is not None:
+            host.quotes_view.ensure_strategy_sidebar()
         if host.workbench_controller is None:
             host._init_workbench_controller()
         controller = host.workbench_controller
@@ -4,6 +4,8 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+_LAYOUT_BATCH_SIZE = 64
+
 
 class SymbolListManager(QtCore.QObject):
     """集中管理股票列表渲染、点击以及示例数据填充。"""
@@ -33,13 +35,23 @@ class SymbolListManager(QtCore.QObject):
         self._view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
         self._view.setSpacing(2)
         self._view.setUniformItemSizes(True)
+        # 大列表分批布局，首批行先绘制，其余在后续事件循环中补齐。
+        self._view.setLayoutMode(QtWidgets.QListView.Batched)
+        self._view.setBatchSize(_LAYOUT_BATCH_SIZE)
+        self._view.setViewportUpdateMode(QtWidgets.QAbstractItemView.MinimalViewportUpdate)
         self._view.clicked.connect(self._handle_index_clicked)
 
     # ------------------------------------------------------------------
     def populate(self, entries: Iterable[Dict[str, Any]], *, is_sample: bool = False) -> None:
         dataset = entries if isinstance(entries, list) else list(entries)
-        self._model.set_entries(dataset)
-        self._view.setVisible(True)
+        # 模型一次 reset 替换全部行；重置期间暂停绘制，结束后只重绘一次。
+        self._view.setUpdatesEnabled(False)
+        try:
+            self._model.set_entries(dataset)
+            self._view.setVisible(True)
+        finally:
+            self._view.setUpdatesEnabled(True)
+        self._view.viewport().update()
         if is_sample:
             self._sample_rendered = True
 
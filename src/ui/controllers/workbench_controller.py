@@ -1,60 +1,133 @@
 from __future__ import annotations
 
+import importlib
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from PyQt5 import QtCore, QtWidgets  # type: ignore[import-not-found]
 
 from .kline_controller import KLineController
-from ..panels import StrategyWorkbenchPanel
-from ...strategies.helpers import augment_markers_with_trade_signals
 
-try:
-    from ...strategies.zigzag_wave_peaks_valleys import (
-        ZIGZAG_STRATEGY_PARAMETERS,
-        run_zigzag_workbench,
-    )
-    from ...strategies.zigzag_double_retest import (
-        ZIGZAG_DOUBLE_RETEST_PARAMETERS,
-        run_zigzag_double_retest_workbench,
-    )
-    from ...strategies.zigzag_volume_double_long import (
-        ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS,
-        run_zigzag_volume_double_long_workbench,
-    )
-except Exception:  # pragma: no cover - optional import
-    ZIGZAG_STRATEGY_PARAMETERS = []
-    run_zigzag_workbench = None
-    ZIGZAG_DOUBLE_RETEST_PARAMETERS = []
-    run_zigzag_double_retest_workbench = None
-    ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS = []
-    run_zigzag_volume_double_long_workbench = None
-
-try:
-    from ...strategies.chan_theory_strategy import (
-        CHAN_STRATEGY_PARAMETERS,
-        run_chan_workbench,
-    )
-except Exception:  # pragma: no cover - optional import
-    CHAN_STRATEGY_PARAMETERS = []
-    run_chan_workbench = None
-
-try:
-    from ...strategies.global_trading_strategies import (
-        PARAMETERS_BY_STRATEGY,
-        run_ma_workbench,
-        run_rsi_workbench,
-        run_donchian_workbench,
-    )
-except Exception:  # pragma: no cover - optional import
-    PARAMETERS_BY_STRATEGY = {
-        "ma": [],
-        "rsi": [],
-        "donchian": [],
+if TYPE_CHECKING:  # pragma: no cover
+    from ..panels import StrategyWorkbenchPanel
+    from ...research import StrategyDefinition, StrategyRegistry, StrategyRunResult
+
+# 预览结果缓存条数：相同策略/参数/标的/数据库版本再次预览时直接复用
+_PREVIEW_CACHE_SIZE = 16
+
+# 工作台面板与 research 包会连带导入 pandas/numpy 等重依赖，首次访问时再解析 (PEP 562)
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    "StrategyWorkbenchPanel": ("..panels", "StrategyWorkbenchPanel"),
+    "StrategyContext": ("...research", "StrategyContext"),
+    "StrategyDefinition": ("...research", "StrategyDefinition"),
+    "StrategyParameter": ("...research", "StrategyParameter"),
+    "StrategyRegistry": ("...research", "StrategyRegistry"),
+    "StrategyRunResult": ("...research", "StrategyRunResult"),
+    "global_strategy_registry": ("...research", "global_strategy_registry"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    spec = _LAZY_IMPORTS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = spec
+    try:
+        value = getattr(importlib.import_module(module_name, __package__), attr)
+    except Exception:  # pragma: no cover - optional import
+        value = None
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    # 模块内部的全局名查找不会触发 __getattr__，统一经由此处解析并缓存
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+# 内置策略模块较重(pandas/numpy 等)，首次注册时再导入，避免拖慢启动
+_builtin_strategy_exports: Optional[Dict[str, Any]] = None
+
+
+def _load_builtin_strategy_exports() -> Dict[str, Any]:
+    """Import the builtin strategy modules on first use and cache their exports."""
+    global _builtin_strategy_exports
+    if _builtin_strategy_exports is not None:
+        return _builtin_strategy_exports
+    exports: Dict[str, Any] = {
+        "ZIGZAG_STRATEGY_PARAMETERS": [],
+        "run_zigzag_workbench": None,
+        "ZIGZAG_DOUBLE_RETEST_PARAMETERS": [],
+        "run_zigzag_double_retest_workbench": None,
+        "ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS": [],
+        "run_zigzag_volume_double_long_workbench": None,
+        "CHAN_STRATEGY_PARAMETERS": [],
+        "run_chan_workbench": None,
+        "PARAMETERS_BY_STRATEGY": {"ma": [], "rsi": [], "donchian": []},
+        "run_ma_workbench": None,
+        "run_rsi_workbench": None,
+        "run_donchian_workbench": None,
     }
-    run_ma_workbench = None
-    run_rsi_workbench = None
-    run_donchian_workbench = None
+    try:
+        from ...strategies.zigzag_wave_peaks_valleys import (
+            ZIGZAG_STRATEGY_PARAMETERS,
+            run_zigzag_workbench,
+        )
+        from ...strategies.zigzag_double_retest import (
+            ZIGZAG_DOUBLE_RETEST_PARAMETERS,
+            run_zigzag_double_retest_workbench,
+        )
+        from ...strategies.zigzag_volume_double_long import (
+            ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS,
+            run_zigzag_volume_double_long_workbench,
+        )
+    except Exception:  # pragma: no cover - optional import
+        pass
+    else:
+        exports.update(
+            ZIGZAG_STRATEGY_PARAMETERS=ZIGZAG_STRATEGY_PARAMETERS,
+            run_zigzag_workbench=run_zigzag_workbench,
+            ZIGZAG_DOUBLE_RETEST_PARAMETERS=ZIGZAG_DOUBLE_RETEST_PARAMETERS,
+            run_zigzag_double_retest_workbench=run_zigzag_double_retest_workbench,
+            ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS=ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS,
+            run_zigzag_volume_double_long_workbench=run_zigzag_volume_double_long_workbench,
+        )
+    try:
+        from ...strategies.chan_theory_strategy import (
+            CHAN_STRATEGY_PARAMETERS,
+            run_chan_workbench,
+        )
+    except Exception:  # pragma: no cover - optional import
+        pass
+    else:
+        exports.update(
+            CHAN_STRATEGY_PARAMETERS=CHAN_STRATEGY_PARAMETERS,
+            run_chan_workbench=run_chan_workbench,
+        )
+    try:
+        from ...strategies.global_trading_strategies import (
+            PARAMETERS_BY_STRATEGY,
+            run_ma_workbench,
+            run_rsi_workbench,
+            run_donchian_workbench,
+        )
+    except Exception:  # pragma: no cover - optional import
+        pass
+    else:
+        exports.update(
+            PARAMETERS_BY_STRATEGY=PARAMETERS_BY_STRATEGY,
+            run_ma_workbench=run_ma_workbench,
+            run_rsi_workbench=run_rsi_workbench,
+            run_donchian_workbench=run_donchian_workbench,
+        )
+    _builtin_strategy_exports = exports
+    return exports
+
 
 try:
     from ...rendering import (  # type: ignore[import-not-found]
@@ -70,22 +143,199 @@ try:
 except Exception:  # pragma: no cover - optional import
     EChartsPreviewDialog = None
 
-try:
-    from ...research import (  # type: ignore[import-not-found]
-        StrategyContext,
-        StrategyDefinition,
-        StrategyParameter,
-        StrategyRegistry,
-        StrategyRunResult,
-        global_strategy_registry,
-    )
-except Exception:  # pragma: no cover - optional import
-    StrategyContext = None
-    StrategyDefinition = None
-    StrategyParameter = None
-    StrategyRegistry = None
-    StrategyRunResult = None
-    global_strategy_registry = None
+
+def _freeze_params(params: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, str], ...]:
+    # 参数值可能是 list 等不可哈希类型，用 repr 生成稳定的缓存键
+    return tuple(sorted((str(key), repr(value)) for key, value in (params or {}).items()))
+
+
+def _fallback_strategy_parameters(strategy_key: str) -> Tuple[Any, ...]:
+    """策略模块未导出参数表时使用的默认参数；只由已缓存的 _builtin_strategy_definitions 调用。"""
+    StrategyParameter = _lazy("StrategyParameter")
+    if StrategyParameter is None:
+        return ()
+    if strategy_key == "zigzag_wave_peaks_valleys":
+        return (
+            StrategyParameter(
+                key="min_reversal",
+                label="最小反转(%)",
+                type="number",
+                default=5.0,
+                description="忽略幅度低于该百分比的价格波动",
+            ),
+        )
+    if strategy_key == "chan_theory":
+        return (
+            StrategyParameter(
+                key="swing_window",
+                label="分型窗口",
+                type="number",
+                default=3,
+                description="检测分型时向前向后比较的K线数量",
+            ),
+        )
+    return ()
+
+
+@lru_cache(maxsize=1)
+def _builtin_strategy_definitions() -> Tuple["StrategyDefinition", ...]:
+    """内置策略定义只依赖模块级常量与处理函数，进程内构建一次，各控制器共享。"""
+    StrategyDefinition = _lazy("StrategyDefinition")
+    StrategyParameter = _lazy("StrategyParameter")
+    if not (StrategyDefinition and StrategyParameter):
+        return ()
+    exports = _load_builtin_strategy_exports()
+    ZIGZAG_STRATEGY_PARAMETERS = exports["ZIGZAG_STRATEGY_PARAMETERS"]
+    run_zigzag_workbench = exports["run_zigzag_workbench"]
+    ZIGZAG_DOUBLE_RETEST_PARAMETERS = exports["ZIGZAG_DOUBLE_RETEST_PARAMETERS"]
+    run_zigzag_double_retest_workbench = exports["run_zigzag_double_retest_workbench"]
+    ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS = exports["ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS"]
+    run_zigzag_volume_double_long_workbench = exports["run_zigzag_volume_double_long_workbench"]
+    CHAN_STRATEGY_PARAMETERS = exports["CHAN_STRATEGY_PARAMETERS"]
+    run_chan_workbench = exports["run_chan_workbench"]
+    PARAMETERS_BY_STRATEGY = exports["PARAMETERS_BY_STRATEGY"]
+    run_ma_workbench = exports["run_ma_workbench"]
+    run_rsi_workbench = exports["run_rsi_workbench"]
+    run_donchian_workbench = exports["run_donchian_workbench"]
+    definitions: List[StrategyDefinition] = []
+
+    if run_zigzag_workbench is not None:
+        zigzag_parameters: List[StrategyParameter] = []
+        if ZIGZAG_STRATEGY_PARAMETERS:
+            zigzag_parameters = list(ZIGZAG_STRATEGY_PARAMETERS)
+        else:
+            zigzag_parameters = list(_fallback_strategy_parameters("zigzag_wave_peaks_valleys"))
+        definitions.append(
+            StrategyDefinition(
+                key="zigzag_wave_peaks_valleys",
+                title="ZigZag波峰波谷",
+                description="识别 ZigZag 波动形态, 输出波峰/波谷标记与状态信息",
+                handler=run_zigzag_workbench,
+                category="形态识别",
+                parameters=zigzag_parameters,
+                tags=["形态识别", "波动策略"],
+            )
+        )
+
+    if run_zigzag_double_retest_workbench is not None:
+        double_params: List[StrategyParameter] = []
+        if ZIGZAG_DOUBLE_RETEST_PARAMETERS:
+            double_params = list(ZIGZAG_DOUBLE_RETEST_PARAMETERS)
+        definitions.append(
+            StrategyDefinition(
+                key="zigzag_double_retest",
+                title="ZigZag双回踩再上车",
+                description="大波段回踩后，再出现二次回踩并反弹的买入版本。",
+                handler=run_zigzag_double_retest_workbench,
+                category="形态识别",
+                parameters=double_params,
+                tags=["形态识别", "双回踩"],
+            )
+        )
+
+    if run_zigzag_volume_double_long_workbench is not None:
+        vol_params: List[StrategyParameter] = []
+        if ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS:
+            vol_params = list(ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS)
+        definitions.append(
+            StrategyDefinition(
+                key="zigzag_volume_double_long",
+                title="ZigZag倍量二次入场",
+                description="主波段回踩后出现首根倍量阳线，再回调后二次倍量阳线买入。",
+                handler=run_zigzag_volume_double_long_workbench,
+                category="形态识别",
+                parameters=vol_params,
+                tags=["形态识别", "成交量"],
+            )
+        )
+
+    if run_chan_workbench is not None:
+        chan_parameters: List[StrategyParameter] = []
+        if CHAN_STRATEGY_PARAMETERS:
+            chan_parameters = list(CHAN_STRATEGY_PARAMETERS)
+        else:
+            chan_parameters = list(_fallback_strategy_parameters("chan_theory"))
+        definitions.append(
+            StrategyDefinition(
+                key="chan_theory",
+                title="缠论买卖点",
+                description="基于缠论分型/笔/中枢识别一买、二买、一卖、二卖信号",
+                handler=run_chan_workbench,
+                category="形态识别",
+                parameters=chan_parameters,
+                tags=["形态识别", "趋势跟踪"],
+            )
+        )
+
+    if run_ma_workbench is not None:
+        ma_params = list(PARAMETERS_BY_STRATEGY.get("ma", []))
+        definitions.append(
+            StrategyDefinition(
+                key="ma_crossover",
+                title="MA 金叉/死叉",
+                description="经典均线金叉死叉策略, 在全球市场广泛使用的趋势跟踪方法。",
+                handler=run_ma_workbench,
+                category="趋势跟踪",
+                parameters=ma_params,
+                tags=["趋势", "全球策略"],
+            )
+        )
+
+    if run_rsi_workbench is not None:
+        rsi_params = list(PARAMETERS_BY_STRATEGY.get("rsi", []))
+        definitions.append(
+            StrategyDefinition(
+                key="rsi_reversion",
+                title="RSI 超买超卖",
+                description="RSI 反转策略, 在强势/弱势区间提供买卖提示。",
+                handler=run_rsi_workbench,
+                category="动量/反转",
+                parameters=rsi_params,
+                tags=["动量", "全球策略"],
+            )
+        )
+
+    if run_donchian_workbench is not None:
+        donchian_params = list(PARAMETERS_BY_STRATEGY.get("donchian", []))
+        definitions.append(
+            StrategyDefinition(
+                key="donchian_breakout",
+                title="唐奇安通道",
+                description="唐奇安价格通道突破策略, CTA 与海龟交易的核心逻辑。",
+                handler=run_donchian_workbench,
+                category="趋势跟踪",
+                parameters=donchian_params,
+                tags=["趋势", "全球策略"],
+            )
+        )
+
+    return tuple(definitions)
+
+
+class _PreviewRenderSignals(QtCore.QObject):
+    """线程池渲染任务回传结果用；QRunnable 本身不能发信号。"""
+
+    finished = QtCore.pyqtSignal(int, str, str)
+    failed = QtCore.pyqtSignal(int, str)
+
+
+class _EChartsRenderTask(QtCore.QRunnable):
+    """在线程池中生成 ECharts 预览 HTML；参数在 UI 线程准备好，任务内不访问界面对象。"""
+
+    def __init__(self, epoch: int, title: str, render_kwargs: Dict[str, Any], signals: _PreviewRenderSignals) -> None:
+        super().__init__()
+        self.epoch = epoch
+        self.title = title
+        self.render_kwargs = render_kwargs
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            html = render_echarts_preview(**self.render_kwargs)
+        except Exception as exc:  # pragma: no cover - diagnostics only
+            self.signals.failed.emit(self.epoch, str(exc))
+            return
+        self.signals.finished.emit(self.epoch, self.title, html)
 
 
 class StrategyWorkbenchController(QtCore.QObject):
@@ -115,48 +365,57 @@ class StrategyWorkbenchController(QtCore.QObject):
         self.workbench_dock: Optional[QtWidgets.QDockWidget] = None
         self.toggle_action: Optional[QtWidgets.QAction] = None
         self._echarts_dialog: Optional[EChartsPreviewDialog] = None
+        # ECharts 预览依赖是否可用：首次预览时判定一次，之后直接复用
+        self._echarts_available: Optional[bool] = None
+        # 每次预览递增；渲染结果回到 UI 线程时丢弃过期的（用户已再次预览）
+        self._preview_epoch = 0
         self._symbol_listener_attached = False
+        self._preview_cache: "OrderedDict[Tuple[Any, ...], StrategyRunResult]" = OrderedDict()
 
     def bind_toggle_action(self, action: QtWidgets.QAction) -> None:
         self.toggle_action = action
         self.toggle_action.triggered.connect(self.toggle_visibility)
-        self.toggle_action.setEnabled(False)
+        # Dock 在首次勾选时才由 toggle_visibility 懒加载创建，动作无需等待面板
+        self.toggle_action.setEnabled(True)
 
     def initialize(self) -> None:
         if self.workbench_dock is not None:
             return
         if not self._ensure_registry():
             return
+        # 这里只建 Dock 外壳；面板控件树在 Dock 真正显示时才由 _ensure_panel_in_dock 构建
         dock = QtWidgets.QDockWidget("策略工作台", self.parent_window)
         dock.setObjectName("strategy_workbench_dock")
-        panel = self._create_panel(dock)
-        if panel is None:
-            dock.deleteLater()
-            return
-        dock.setWidget(panel)
         dock.setAllowedAreas(QtCore.Qt.LeftDockWidgetArea | QtCore.Qt.RightDockWidgetArea)
         dock.setMinimumWidth(560)
         dock.setMaximumWidth(max(960, int(self.parent_window.width() * 0.7)))
         dock.setFeatures(dock.features() | QtWidgets.QDockWidget.DockWidgetFloatable)
+        dock.visibilityChanged.connect(self._on_visibility_changed)
+        self.workbench_dock = dock
         self.parent_window.addDockWidget(QtCore.Qt.RightDockWidgetArea, dock)
         try:
             target_width = max(700, int(self.parent_window.width() * 0.5))
             self.parent_window.resizeDocks([dock], [target_width], QtCore.Qt.Horizontal)
         except Exception:
             dock.resize(max(720, dock.width()), dock.height())
-        dock.visibilityChanged.connect(self._on_visibility_changed)
-
-        self.workbench_dock = dock
 
         if self.toggle_action:
             self.toggle_action.setEnabled(True)
-            self.toggle_action.blockSignals(True)
-            self.toggle_action.setChecked(True)
-            self.toggle_action.blockSignals(False)
+        self._sync_toggle_checked(True)
 
+    def _ensure_panel_in_dock(self) -> None:
+        dock = self.workbench_dock
+        if dock is None or dock.widget() is not None:
+            return
+        panel = self._create_panel(dock)
+        if panel is None:
+            self._log("策略工作台面板创建失败")
+            return
+        dock.setWidget(panel)
         self._attach_symbol_listener()
         self._update_panel_selection()
 
+    @QtCore.pyqtSlot(bool)
     def toggle_visibility(self, checked: bool) -> None:
         if checked and self.workbench_dock is None:
             self.initialize()
@@ -164,10 +423,8 @@ class StrategyWorkbenchController(QtCore.QObject):
             self.workbench_dock.setVisible(checked)
             if checked:
                 self.workbench_dock.raise_()
-        elif self.toggle_action:
-            self.toggle_action.blockSignals(True)
-            self.toggle_action.setChecked(False)
-            self.toggle_action.blockSignals(False)
+        else:
+            self._sync_toggle_checked(False)
 
     def create_embedded_panel(self, parent: QtWidgets.QWidget) -> Optional[StrategyWorkbenchPanel]:
         if not self._ensure_registry():
@@ -182,7 +439,8 @@ class StrategyWorkbenchController(QtCore.QObject):
     def _ensure_registry(self) -> bool:
         if self.strategy_registry is not None:
             return True
-        if StrategyWorkbenchPanel is None or global_strategy_registry is None:
+        global_strategy_registry = _lazy("global_strategy_registry")
+        if _lazy("StrategyWorkbenchPanel") is None or global_strategy_registry is None:
             return False
         try:
             self.strategy_registry = global_strategy_registry()
@@ -197,7 +455,7 @@ class StrategyWorkbenchController(QtCore.QObject):
         if not self.strategy_registry:
             return None
         if self.workbench_panel is None:
-            self.workbench_panel = StrategyWorkbenchPanel(
+            self.workbench_panel = _lazy("StrategyWorkbenchPanel")(
                 registry=self.strategy_registry,
                 universe_provider=self.kline_controller.current_universe,
                 selected_symbol_provider=lambda: self.kline_controller.current_table,
@@ -226,46 +484,77 @@ class StrategyWorkbenchController(QtCore.QObject):
         if current:
             self.workbench_panel.update_selected_symbol(current)
 
+    @QtCore.pyqtSlot(bool)
     def _on_visibility_changed(self, visible: bool) -> None:
-        if self.toggle_action:
-            self.toggle_action.blockSignals(True)
-            self.toggle_action.setChecked(visible)
-            self.toggle_action.blockSignals(False)
+        if visible:
+            self._ensure_panel_in_dock()
+        self._sync_toggle_checked(visible)
+
+    def _sync_toggle_checked(self, checked: bool) -> None:
+        action = self.toggle_action
+        if action is None or action.isChecked() == checked:
+            return
+        action.blockSignals(True)
+        try:
+            action.setChecked(checked)
+        finally:
+            action.blockSignals(False)
 
+    @QtCore.pyqtSlot(str)
     def _on_symbol_changed(self, table_name: str) -> None:
+        self._preview_cache.clear()
         if not self.workbench_panel:
             return
         symbol = self.kline_controller.current_symbol or table_name
         self.workbench_panel.update_selected_symbol(symbol)
 
     def _run_workbench_preview(self, strategy_key: str, params: Dict[str, Any]) -> "Optional[StrategyRunResult]":
+        StrategyContext = _lazy("StrategyContext")
         if not self.strategy_registry or StrategyContext is None:
             raise RuntimeError("策略工作台不可用")
         table = self.kline_controller.current_table
         if not table:
             raise RuntimeError("请先选择标的")
         db_path = self._db_path_getter()
-        if not db_path.exists():
-            raise RuntimeError("数据库文件不存在")
-
-        context = StrategyContext(
-            db_path=db_path,
-            table_name=table,
-            symbol=self.kline_controller.current_symbol or table,
-            params=params,
-            current_only=True,
-            start_date=None,
-            end_date=None,
-            mode="preview",
-        )
-        # 先清空旧标记，避免策略切换时残留。
-        self.kline_controller.set_markers([], [])
-        self.kline_controller.render_from_database(table, [], [])
-
-        result = self.strategy_registry.run_strategy(strategy_key, context)
+        # 一次 stat 同时完成存在性校验和取 mtime（预览缓存键需要），不再单独 exists()
+        try:
+            db_mtime = db_path.stat().st_mtime_ns
+        except OSError:
+            raise RuntimeError("数据库文件不存在") from None
+        cache_key = (strategy_key, table, _freeze_params(params), str(db_path), db_mtime)
+        result = self._preview_cache.get(cache_key)
+        if result is not None:
+            self._preview_cache.move_to_end(cache_key)
+        else:
+            context = StrategyContext(
+                db_path=db_path,
+                table_name=table,
+                symbol=self.kline_controller.current_symbol or table,
+                params=params,
+                current_only=True,
+                start_date=None,
+                end_date=None,
+                mode="preview",
+            )
+            # 先清空旧标记，避免策略切换时残留。策略在 UI 线程同步执行，清空后的中间态
+            # 不会被绘制，因此只在没有新结果可画时才重绘空图，省去一次读库+渲染。
+            self.kline_controller.set_markers([], [])
+            try:
+                result = self.strategy_registry.run_strategy(strategy_key, context)
+            except Exception:
+                self.kline_controller.render_from_database(table, [], [])
+                raise
+            if result:
+                self._preview_cache[cache_key] = result
+                while len(self._preview_cache) > _PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
+            else:
+                self.kline_controller.render_from_database(table, [], [])
         if result:
-            self.kline_controller.set_markers(list(result.markers), list(result.overlays))
-            self.kline_controller.render_from_database(table, list(result.markers), list(result.overlays))
+            markers = list(result.markers)
+            overlays = list(result.overlays)
+            self.kline_controller.set_markers(markers, overlays)
+            self.kline_controller.render_from_database(table, markers, overlays)
             if result.status_message:
                 self.status_bar.showMessage(result.status_message)
             self._show_echarts_preview(strategy_key, result)
@@ -279,23 +568,32 @@ class StrategyWorkbenchController(QtCore.QObject):
     ) -> None:
         if not self.kline_controller or not table:
             return
-        self.kline_controller.set_markers(list(markers), list(overlays or []))
-        self.kline_controller.render_from_database(table, list(markers), list(overlays or []))
+        marker_list = list(markers)
+        overlay_list = list(overlays or [])
+        self.kline_controller.set_markers(marker_list, overlay_list)
+        self.kline_controller.render_from_database(table, marker_list, overlay_list)
 
     def _ensure_echarts_dialog(self) -> Optional[EChartsPreviewDialog]:
-        if EChartsPreviewDialog is None or render_echarts_preview is None:
+        if self._echarts_dialog is not None:
+            return self._echarts_dialog
+        if self._echarts_available is None:
+            self._echarts_available = (
+                EChartsPreviewDialog is not None
+                and render_echarts_preview is not None
+                and ECHARTS_PREVIEW_TEMPLATE_PATH is not None
+            )
+        if not self._echarts_available:
             return None
-        if self._echarts_dialog is None:
-            template_path = ECHARTS_PREVIEW_TEMPLATE_PATH
-            if template_path is None:
-                return None
-            self._echarts_dialog = EChartsPreviewDialog(template_path, self.parent_window)
+        self._echarts_dialog = EChartsPreviewDialog(ECHARTS_PREVIEW_TEMPLATE_PATH, self.parent_window)
         return self._echarts_dialog
 
     def _show_echarts_preview(self, strategy_key: str, result: "StrategyRunResult") -> None:
         dialog = self._ensure_echarts_dialog()
         if dialog is None:
             return
+        # strategies 包的 __init__ 会导入全部内置策略，这里延迟到真正预览时
+        from ...strategies.helpers import augment_markers_with_trade_signals
+
         candles = getattr(self.kline_controller, "current_candles", None)
         if not candles:
             return
@@ -309,161 +607,50 @@ class StrategyWorkbenchController(QtCore.QObject):
         title = definition_title or strategy_key
         # 过多标注会让预览卡顿/无法切换，做适度截断
         max_markers = 500
-        base_markers = list(result.markers)
+        extra = result.extra_data or {}
+        # 下游只做 JSON 序列化、不会修改序列，直接传递避免逐次拷贝
         preview_markers = augment_markers_with_trade_signals(
-            base_markers,
-            result.extra_data,
+            result.markers,
+            extra,
             strategy_key=strategy_key,
         )
         if len(preview_markers) > max_markers:
             preview_markers = preview_markers[-max_markers:]
-        try:
-            html = render_echarts_preview(
-                candles=candles,
-                volumes=list(volumes or []),
-                markers=preview_markers,
-                overlays=list(result.overlays),
-                instrument=instrument,
-                strokes=list((result.extra_data or {}).get('strokes', []) or []),
-                title=title,
-            )
-        except Exception as exc:  # pragma: no cover - diagnostics only
-            self._log(f"ECharts 预览渲染失败: {exc}")
-            return
-        dialog.show_html(f"{title} · ECharts", html)
+        render_kwargs = dict(
+            candles=candles,
+            volumes=volumes or [],
+            markers=preview_markers,
+            overlays=result.overlays,
+            instrument=instrument,
+            strokes=extra.get('strokes') or [],
+            title=title,
+        )
+        # HTML 模板渲染放到线程池，完成/失败通过信号回到 UI 线程。
+        self._preview_epoch += 1
+        signals = _PreviewRenderSignals(self)
+        signals.finished.connect(self._on_echarts_rendered)
+        signals.failed.connect(self._on_echarts_render_failed)
+        signals.finished.connect(signals.deleteLater)
+        signals.failed.connect(signals.deleteLater)
+        QtCore.QThreadPool.globalInstance().start(
+            _EChartsRenderTask(self._preview_epoch, title, render_kwargs, signals)
+        )
 
-    def _register_builtin_strategies(self) -> None:
-        if not (self.strategy_registry and StrategyDefinition and StrategyParameter):
+    @QtCore.pyqtSlot(int, str, str)
+    def _on_echarts_rendered(self, epoch: int, title: str, html: str) -> None:
+        if epoch != self._preview_epoch or self._echarts_dialog is None:
             return
-        definitions: List[StrategyDefinition] = []
-
-        if run_zigzag_workbench is not None and not self.strategy_registry.get("zigzag_wave_peaks_valleys"):
-            zigzag_parameters: List[StrategyParameter] = []
-            if ZIGZAG_STRATEGY_PARAMETERS:
-                zigzag_parameters = list(ZIGZAG_STRATEGY_PARAMETERS)
-            elif StrategyParameter is not None:
-                zigzag_parameters = [
-                    StrategyParameter(
-                        key="min_reversal",
-                        label="最小反转(%)",
-                        type="number",
-                        default=5.0,
-                        description="忽略幅度低于该百分比的价格波动",
-                    )
-                ]
-            definitions.append(
-                StrategyDefinition(
-                    key="zigzag_wave_peaks_valleys",
-                    title="ZigZag波峰波谷",
-                    description="识别 ZigZag 波动形态, 输出波峰/波谷标记与状态信息",
-                    handler=run_zigzag_workbench,
-                    category="形态识别",
-                    parameters=zigzag_parameters,
-                    tags=["形态识别", "波动策略"],
-                )
-            )
-
-        if run_zigzag_double_retest_workbench is not None and not self.strategy_registry.get("zigzag_double_retest"):
-            double_params: List[StrategyParameter] = []
-            if ZIGZAG_DOUBLE_RETEST_PARAMETERS:
-                double_params = list(ZIGZAG_DOUBLE_RETEST_PARAMETERS)
-            definitions.append(
-                StrategyDefinition(
-                    key="zigzag_double_retest",
-                    title="ZigZag双回踩再上车",
-                    description="大波段回踩后，再出现二次回踩并反弹的买入版本。",
-                    handler=run_zigzag_double_retest_workbench,
-                    category="形态识别",
-                    parameters=double_params,
-                    tags=["形态识别", "双回踩"],
-                )
-            )
+        self._echarts_dialog.show_html(f"{title} · ECharts", html)
 
-        if run_zigzag_volume_double_long_workbench is not None and not self.strategy_registry.get("zigzag_volume_double_long"):
-            vol_params: List[StrategyParameter] = []
-            if ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS:
-                vol_params = list(ZIGZAG_VOLUME_DOUBLE_LONG_PARAMETERS)
-            definitions.append(
-                StrategyDefinition(
-                    key="zigzag_volume_double_long",
-                    title="ZigZag倍量二次入场",
-                    description="主波段回踩后出现首根倍量阳线，再回调后二次倍量阳线买入。",
-                    handler=run_zigzag_volume_double_long_workbench,
-                    category="形态识别",
-                    parameters=vol_params,
-                    tags=["形态识别", "成交量"],
-                )
-            )
-
-        if run_chan_workbench is not None and not self.strategy_registry.get("chan_theory"):
-            chan_parameters: List[StrategyParameter] = []
-            if CHAN_STRATEGY_PARAMETERS:
-                chan_parameters = list(CHAN_STRATEGY_PARAMETERS)
-            elif StrategyParameter is not None:
-                chan_parameters = [
-                    StrategyParameter(
-                        key="swing_window",
-                        label="分型窗口",
-                        type="number",
-                        default=3,
-                        description="检测分型时向前向后比较的K线数量",
-                    )
-                ]
-            definitions.append(
-                StrategyDefinition(
-                    key="chan_theory",
-                    title="缠论买卖点",
-                    description="基于缠论分型/笔/中枢识别一买、二买、一卖、二卖信号",
-                    handler=run_chan_workbench,
-                    category="形态识别",
-                    parameters=chan_parameters,
-                    tags=["形态识别", "趋势跟踪"],
-                )
-            )
-
-        if run_ma_workbench is not None and not self.strategy_registry.get("ma_crossover"):
-            ma_params = list(PARAMETERS_BY_STRATEGY.get("ma", []))
-            definitions.append(
-                StrategyDefinition(
-                    key="ma_crossover",
-                    title="MA 金叉/死叉",
-                    description="经典均线金叉死叉策略, 在全球市场广泛使用的趋势跟踪方法。",
-                    handler=run_ma_workbench,
-                    category="趋势跟踪",
-                    parameters=ma_params,
-                    tags=["趋势", "全球策略"],
-                )
-            )
-
-        if run_rsi_workbench is not None and not self.strategy_registry.get("rsi_reversion"):
-            rsi_params = list(PARAMETERS_BY_STRATEGY.get("rsi", []))
-            definitions.append(
-                StrategyDefinition(
-                    key="rsi_reversion",
-                    title="RSI 超买超卖",
-                    description="RSI 反转策略, 在强势/弱势区间提供买卖提示。",
-                    handler=run_rsi_workbench,
-                    category="动量/反转",
-                    parameters=rsi_params,
-                    tags=["动量", "全球策略"],
-                )
-            )
-
-        if run_donchian_workbench is not None and not self.strategy_registry.get("donchian_breakout"):
-            donchian_params = list(PARAMETERS_BY_STRATEGY.get("donchian", []))
-            definitions.append(
-                StrategyDefinition(
-                    key="donchian_breakout",
-                    title="唐奇安通道",
-                    description="唐奇安价格通道突破策略, CTA 与海龟交易的核心逻辑。",
-                    handler=run_donchian_workbench,
-                    category="趋势跟踪",
-                    parameters=donchian_params,
-                    tags=["趋势", "全球策略"],
-                )
-            )
+    @QtCore.pyqtSlot(int, str)
+    def _on_echarts_render_failed(self, epoch: int, message: str) -> None:
+        if epoch != self._preview_epoch:
+            return
+        self._log(f"ECharts 预览渲染失败: {message}")
 
-        for definition in definitions:
-            self.strategy_registry.register(definition)
+    def _register_builtin_strategies(self) -> None:
+        if not self.strategy_registry:
+            return
+        self.strategy_registry.register_many(_builtin_strategy_definitions(), skip_existing=True)
 
 __all__ = ["StrategyWorkbenchController"]
@@ -1,35 +1,25 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import html
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtCore, QtGui, QtWidgets
 
 if TYPE_CHECKING:  # pragma: no cover
     from ...main_ui import MainWindow
 
 
-class SnowDataPage(QtWidgets.QWidget):
-    """Snow 风格的数据管理页。"""
+# 页面构建时反复用到的 Qt 枚举值，模块加载时解析一次。
+_ALIGN_LEFT_VCENTER = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+_ALIGN_CENTER = QtCore.Qt.AlignCenter
+_CURSOR_HAND = QtCore.Qt.PointingHandCursor
+_RICH_TEXT = QtCore.Qt.RichText
+_TEXT_SELECTABLE = QtCore.Qt.TextSelectableByMouse
+_TOOL_BUTTON_TEXT_ONLY = QtCore.Qt.ToolButtonTextOnly
 
-    def __init__(self, *, host: "MainWindow", parent: Optional[QtWidgets.QWidget] = None) -> None:
-        super().__init__(parent)
-        self._host = host
-        self._apply_styles()
-        layout = QtWidgets.QHBoxLayout(self)
-        layout.setContentsMargins(24, 24, 24, 24)
-        layout.setSpacing(20)
-
-        controls = self._build_controls_panel()
-        layout.addWidget(controls, 0)
-
-        content = self._build_content_panel()
-        layout.addWidget(content, 1)
 
-    def _apply_styles(self) -> None:
-        # 给数据页单独的卡片和按钮样式，避免影响其他页面。
-        self.setStyleSheet(
-            """
-QFrame#snowDataControls {
+# 数据页样式在模块加载时构建一次，各实例共享同一字符串。
+_SNOW_DATA_QSS = """QFrame#snowDataControls {
     background: transparent;
     max-width: 300px;
 }
@@ -89,7 +79,65 @@ QToolButton[class~="snowAction"]:hover {
     border-color: #d2dcff;
 }
 """
-        )
+
+# 页面上的静态提示文案。
+_HEADER_SUBTITLE = "选择数据目录与数据库，启动导入并跟踪进度；导入完成后刷新标的列表。"
+_CONTROLS_HINT = "操作前先确认目录与数据库路径，导入过程可随时打开日志查看详情。"
+_DIR_HINT = "选择包含 Excel/CSV 的目录，导入时会递归读取。"
+_DB_HINT = "当前 SQLite 数据库文件路径，可手动切换。"
+_TUSHARE_HINT = "基础积分：每分钟 500 次请求，每次 6000 条日线数据。默认增量补齐，如无本地数据则拉取近两年。"
+_TIPS = (
+    "首选先设置数据目录与数据库，再启动导入任务；",
+    "导入完成后可点击“刷新标的列表”同步到行情页；",
+    "如需重建，请确保数据库文件有备份或可覆盖。",
+)
+_TIPS_HTML = "<br>".join(f"· {html.escape(tip)}" for tip in _TIPS)
+
+# (host 上的 QAction 属性名, 按钮提示)
+_DATA_ACTIONS: Tuple[Tuple[str, str], ...] = (
+    ("action_choose_dir", "选择 Excel/CSV 目录用于批量导入"),
+    ("action_choose_db", "指定或创建 SQLite 数据库文件"),
+    ("action_import_append", "将新数据追加至现有表"),
+    ("action_import_replace", "重建表并覆盖旧数据"),
+    ("action_refresh_symbols", "刷新标的列表缓存"),
+)
+
+
+class SnowDataPage(QtWidgets.QWidget):
+    """Snow 风格的数据管理页。"""
+
+    _CARD_MARGINS = QtCore.QMargins(16, 16, 16, 16)
+    _CARD_SPACING = 8
+
+    def __init__(self, *, host: "MainWindow", parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self._host = host
+        self._built = False
+        self._apply_styles()
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(24, 24, 24, 24)
+        layout.setSpacing(20)
+        self._layout = layout
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:  # type: ignore[override]
+        # 卡片与控件在首次显示时才构建，启动阶段只创建外层布局。
+        self.ensure_built()
+        super().showEvent(event)
+
+    def ensure_built(self) -> None:
+        if self._built:
+            return
+        self._built = True
+        controls = self._build_controls_panel()
+        self._layout.addWidget(controls, 0)
+
+        content = self._build_content_panel()
+        self._layout.addWidget(content, 1)
+        self._host._refresh_data_page_labels()
+
+    def _apply_styles(self) -> None:
+        # 给数据页单独的卡片和按钮样式，避免影响其他页面。
+        self.setStyleSheet(_SNOW_DATA_QSS)
 
     # --- panels -----------------------------------------------------------
     def _build_controls_panel(self) -> QtWidgets.QWidget:
@@ -101,30 +149,25 @@ QToolButton[class~="snowAction"]:hover {
         layout.setSpacing(10)
         layout.addWidget(self._create_section_label("数据操作", panel))
 
-        actions_card = QtWidgets.QFrame(panel)
-        actions_card.setObjectName("snowDataActionCard")
-        actions_layout = QtWidgets.QVBoxLayout(actions_card)
-        actions_layout.setContentsMargins(14, 14, 14, 14)
-        actions_layout.setSpacing(8)
-
-        data_actions = [
-            (host.action_choose_dir, "选择 Excel/CSV 目录用于批量导入"),
-            (host.action_choose_db, "指定或创建 SQLite 数据库文件"),
-            (host.action_import_append, "将新数据追加至现有表"),
-            (host.action_import_replace, "重建表并覆盖旧数据"),
-            (host.action_refresh_symbols, "刷新标的列表缓存"),
-        ]
-        for action, tooltip in data_actions:
-            if action is None:
-                continue
-            button = self._create_action_button(actions_card, action=action)
-            button.setProperty("class", "snowAction")
-            button.setToolTip(tooltip)
-            actions_layout.addWidget(button)
-
-        layout.addWidget(actions_card)
-
-        hint = QtWidgets.QLabel("操作前先确认目录与数据库路径，导入过程可随时打开日志查看详情。", panel)
+        actions: List[Tuple[QtWidgets.QAction, str]] = []
+        for action_attr, tooltip in _DATA_ACTIONS:
+            action = getattr(host, action_attr, None)
+            if action is not None:
+                actions.append((action, tooltip))
+        if actions:
+            actions_card = QtWidgets.QFrame(panel)
+            actions_card.setObjectName("snowDataActionCard")
+            actions_layout = QtWidgets.QVBoxLayout(actions_card)
+            actions_layout.setContentsMargins(14, 14, 14, 14)
+            actions_layout.setSpacing(8)
+            for action, tooltip in actions:
+                button = self._create_action_button(actions_card, action=action)
+                button.setProperty("class", "snowAction")
+                button.setToolTip(tooltip)
+                actions_layout.addWidget(button)
+            layout.addWidget(actions_card)
+
+        hint = QtWidgets.QLabel(_CONTROLS_HINT, panel)
         hint.setObjectName("snowDataHint")
         hint.setWordWrap(True)
         layout.addWidget(hint)
@@ -146,35 +189,33 @@ QToolButton[class~="snowAction"]:hover {
         summary_row.setContentsMargins(0, 0, 0, 0)
         summary_row.setSpacing(12)
 
-        dir_body = QtWidgets.QWidget(panel)
-        dir_layout = QtWidgets.QVBoxLayout(dir_body)
-        dir_layout.setContentsMargins(0, 0, 0, 0)
-        dir_layout.setSpacing(6)
-        host.data_dir_value_label = QtWidgets.QLabel(host._format_path(host.data_dir), dir_body)
+        host.data_dir_value_label = QtWidgets.QLabel(host._format_path(host.data_dir), panel)
         host.data_dir_value_label.setObjectName("snowDataValue")
-        host.data_dir_value_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        host.data_dir_value_label.setTextInteractionFlags(_TEXT_SELECTABLE)
         host.data_dir_value_label.setWordWrap(True)
-        dir_layout.addWidget(host.data_dir_value_label)
-        dir_hint = QtWidgets.QLabel("选择包含 Excel/CSV 的目录，导入时会递归读取。", dir_body)
-        dir_hint.setObjectName("snowDataHint")
-        dir_hint.setWordWrap(True)
-        dir_layout.addWidget(dir_hint)
-        summary_row.addWidget(self._create_data_card("数据目录", dir_body, panel), 1)
-
-        db_body = QtWidgets.QWidget(panel)
-        db_layout = QtWidgets.QVBoxLayout(db_body)
-        db_layout.setContentsMargins(0, 0, 0, 0)
-        db_layout.setSpacing(6)
-        host.data_db_value_label = QtWidgets.QLabel(host._format_path(host.db_path), db_body)
+        summary_row.addWidget(
+            self._create_data_card(
+                "数据目录",
+                host.data_dir_value_label,
+                panel,
+                hint=_DIR_HINT,
+            ),
+            1,
+        )
+
+        host.data_db_value_label = QtWidgets.QLabel(host._format_path(host.db_path), panel)
         host.data_db_value_label.setObjectName("snowDataValue")
-        host.data_db_value_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        host.data_db_value_label.setTextInteractionFlags(_TEXT_SELECTABLE)
         host.data_db_value_label.setWordWrap(True)
-        db_layout.addWidget(host.data_db_value_label)
-        db_hint = QtWidgets.QLabel("当前 SQLite 数据库文件路径，可手动切换。", db_body)
-        db_hint.setObjectName("snowDataHint")
-        db_hint.setWordWrap(True)
-        db_layout.addWidget(db_hint)
-        summary_row.addWidget(self._create_data_card("数据库信息", db_body, panel), 1)
+        summary_row.addWidget(
+            self._create_data_card(
+                "数据库信息",
+                host.data_db_value_label,
+                panel,
+                hint=_DB_HINT,
+            ),
+            1,
+        )
 
         layout.addLayout(summary_row)
 
@@ -200,30 +241,25 @@ QToolButton[class~="snowAction"]:hover {
         host.data_page_progress.setRange(0, 1)
         status_layout.addWidget(host.data_page_progress)
         log_button = QtWidgets.QPushButton("查看导入日志", status_body)
-        log_button.clicked.connect(lambda: host.show_log_console(show=True))
+        log_button.clicked.connect(self._show_import_log)
         status_layout.addWidget(log_button)
         layout.addWidget(self._create_data_card("导入任务", status_body, panel))
 
-        tips_body = QtWidgets.QWidget(panel)
-        tips_layout = QtWidgets.QVBoxLayout(tips_body)
-        tips_layout.setContentsMargins(0, 0, 0, 0)
-        tips_layout.setSpacing(6)
-        tips = [
-            "首选先设置数据目录与数据库，再启动导入任务；",
-            "导入完成后可点击“刷新标的列表”同步到行情页；",
-            "如需重建，请确保数据库文件有备份或可覆盖。",
-        ]
-        for tip in tips:
-            label = QtWidgets.QLabel(f"· {tip}", tips_body)
-            label.setObjectName("snowDataHint")
-            label.setWordWrap(True)
-            tips_layout.addWidget(label)
+        # 多条提示合并进一个富文本标签，避免逐条创建 QLabel 与布局。
+        tips_body = QtWidgets.QLabel(_TIPS_HTML, panel)
+        tips_body.setObjectName("snowDataHint")
+        tips_body.setTextFormat(_RICH_TEXT)
+        tips_body.setWordWrap(True)
         layout.addWidget(self._create_data_card("小贴士", tips_body, panel))
 
         layout.addStretch(1)
         return panel
 
     # --- helpers ---------------------------------------------------------
+    @QtCore.pyqtSlot()
+    def _show_import_log(self) -> None:
+        self._host.show_log_console(show=True)
+
     def _create_tushare_card(self, parent: QtWidgets.QWidget) -> QtWidgets.QFrame:
         host = self._host
         body = QtWidgets.QWidget(parent)
@@ -240,14 +276,15 @@ QToolButton[class~="snowAction"]:hover {
             token_input.setText(host.tushare_token)
         layout.addWidget(token_input)
 
-        hint = QtWidgets.QLabel("基础积分：每分钟 500 次请求，每次 6000 条日线数据。默认增量补齐，如无本地数据则拉取近两年。", body)
+        hint = QtWidgets.QLabel(_TUSHARE_HINT, body)
         hint.setObjectName("snowDataHint")
         hint.setWordWrap(True)
         layout.addWidget(hint)
 
-        date_row = QtWidgets.QHBoxLayout()
-        date_row.setContentsMargins(0, 0, 0, 0)
-        date_row.setSpacing(8)
+        date_form = QtWidgets.QFormLayout()
+        date_form.setContentsMargins(0, 0, 0, 0)
+        date_form.setHorizontalSpacing(8)
+        date_form.setVerticalSpacing(6)
         start_edit = QtWidgets.QDateEdit(body)
         start_edit.setCalendarPopup(True)
         start_edit.setDisplayFormat("yyyy-MM-dd")
@@ -259,11 +296,9 @@ QToolButton[class~="snowAction"]:hover {
         end_edit.setDate(today)
         host.tushare_start_date = start_edit
         host.tushare_end_date = end_edit
-        date_row.addWidget(QtWidgets.QLabel("开始日期", body))
-        date_row.addWidget(start_edit)
-        date_row.addWidget(QtWidgets.QLabel("结束日期", body))
-        date_row.addWidget(end_edit)
-        layout.addLayout(date_row)
+        date_form.addRow("开始日期", start_edit)
+        date_form.addRow("结束日期", end_edit)
+        layout.addLayout(date_form)
 
         buttons_row = QtWidgets.QHBoxLayout()
         buttons_row.setContentsMargins(0, 0, 0, 0)
@@ -290,7 +325,7 @@ QToolButton[class~="snowAction"]:hover {
     def _create_section_label(self, text: str, parent: QtWidgets.QWidget) -> QtWidgets.QLabel:
         label = QtWidgets.QLabel(text, parent)
         label.setObjectName("snowNavSectionLabel")
-        label.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+        label.setAlignment(_ALIGN_LEFT_VCENTER)
         return label
 
     def _create_action_button(
@@ -300,8 +335,8 @@ QToolButton[class~="snowAction"]:hover {
         action: QtWidgets.QAction,
     ) -> QtWidgets.QToolButton:
         button = QtWidgets.QToolButton(parent)
-        button.setToolButtonStyle(QtCore.Qt.ToolButtonTextOnly)
-        button.setCursor(QtCore.Qt.PointingHandCursor)
+        button.setToolButtonStyle(_TOOL_BUTTON_TEXT_ONLY)
+        button.setCursor(_CURSOR_HAND)
         button.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         button.setDefaultAction(action)
         return button
@@ -311,18 +346,30 @@ QToolButton[class~="snowAction"]:hover {
         title: str,
         body: QtWidgets.QWidget,
         parent: QtWidgets.QWidget,
+        *,
+        hint: Optional[str] = None,
     ) -> QtWidgets.QFrame:
         card = QtWidgets.QFrame(parent)
         card.setObjectName("snowDataCard")
-        layout = QtWidgets.QVBoxLayout(card)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(8)
+        layout = self._apply_card_layout(card)
         title_label = QtWidgets.QLabel(title, card)
         title_label.setObjectName("snowDataCardTitle")
         layout.addWidget(title_label)
         layout.addWidget(body)
+        if hint:
+            # 提示直接挂在卡片布局上，省去额外的容器控件。
+            hint_label = QtWidgets.QLabel(hint, card)
+            hint_label.setObjectName("snowDataHint")
+            hint_label.setWordWrap(True)
+            layout.addWidget(hint_label)
         return card
 
+    def _apply_card_layout(self, card: QtWidgets.QFrame) -> QtWidgets.QVBoxLayout:
+        layout = QtWidgets.QVBoxLayout(card)
+        layout.setContentsMargins(self._CARD_MARGINS)
+        layout.setSpacing(self._CARD_SPACING)
+        return layout
+
     def _create_header(self, parent: QtWidgets.QWidget) -> QtWidgets.QWidget:
         header = QtWidgets.QFrame(parent)
         header_layout = QtWidgets.QVBoxLayout(header)
@@ -330,7 +377,7 @@ QToolButton[class~="snowAction"]:hover {
         header_layout.setSpacing(4)
         title = QtWidgets.QLabel("数据管理中心", header)
         title.setObjectName("snowDataHeader")
-        subtitle = QtWidgets.QLabel("选择数据目录与数据库，启动导入并跟踪进度；导入完成后刷新标的列表。", header)
+        subtitle = QtWidgets.QLabel(_HEADER_SUBTITLE, header)
         subtitle.setObjectName("snowDataSubHeader")
         subtitle.setWordWrap(True)
         header_layout.addWidget(title)
@@ -340,5 +387,8 @@ QToolButton[class~="snowAction"]:hover {
     def _create_badge(self, text: str, parent: QtWidgets.QWidget) -> QtWidgets.QLabel:
         badge = QtWidgets.QLabel(text, parent)
         badge.setObjectName("snowDataBadge")
-        badge.setAlignment(QtCore.Qt.AlignCenter)
+        badge.setAlignment(_ALIGN_CENTER)
         return badge
+
+
+__all__ = ["SnowDataPage"]
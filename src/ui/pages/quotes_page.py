@@ -1,12 +1,115 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional, List, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, List, Tuple
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtCore, QtGui, QtWidgets
 from ..controllers.symbol_list_manager import SymbolListManager
 
 if TYPE_CHECKING:  # pragma: no cover
     from ...main_ui import MainWindow
+
+
+# 页面构建时反复用到的 Qt 枚举值，模块加载时解析一次。
+_ALIGN_LEFT_VCENTER = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+_ALIGN_RIGHT_VCENTER = QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
+_ALIGN_CENTER = QtCore.Qt.AlignCenter
+_CUSTOM_CONTEXT_MENU = QtCore.Qt.CustomContextMenu
+_ELIDE_RIGHT = QtCore.Qt.ElideRight
+_NO_FOCUS = QtCore.Qt.NoFocus
+_ENTRY_ROLE = QtCore.Qt.UserRole + 1
+
+_WATCHLIST_CACHE_SIZE = 8
+_WATCHLIST_REFRESH_DEBOUNCE_MS = 200
+
+
+# 行情页各区块样式合并为一份，在页面构造时统一安装一次。
+_QUOTES_QSS = """
+QFrame#snowStockPanel {
+    background: #ffffff;
+    border-radius: 0;
+}
+QFrame#snowSymbolTabsContainer {
+    background: #ffffff;
+    border-top: 1px solid #e5e8f1;
+    border-bottom: 1px solid #e5e8f1;
+}
+QTabBar#snowCategoryTabs {
+    background: transparent;
+    qproperty-drawBase: 0;
+    padding-left: 6px;
+    border-bottom: 1px solid #e5e8f1;
+}
+QTabBar#snowCategoryTabs::tab {
+    color: #6f7b95;
+    padding: 4px 0;
+    margin-right: 26px;
+    font-size: 15px;
+    font-weight: 500;
+    border-bottom: 3px solid transparent;
+    background: transparent;
+}
+QTabBar#snowCategoryTabs::tab:selected {
+    color: #1f6dff;
+    font-weight: 600;
+}
+QTabBar#snowCategoryTabs::tab:hover {
+    color: #1f6dff;
+}
+QTabBar#snowWatchlistTabs {
+    background: transparent;
+    padding-left: 4px;
+}
+QTabBar#snowWatchlistTabs::tab {
+    color: #6f7b95;
+    padding: 2px 6px;
+    margin-right: 10px;
+    font-size: 13px;
+    border: none;
+    background: transparent;
+}
+QTabBar#snowWatchlistTabs::tab:selected {
+    color: #1f6dff;
+    font-weight: 600;
+}
+QTabBar#snowWatchlistTabs::tab:hover {
+    color: #1f6dff;
+}
+"""
+
+_MENU_QSS = """
+QMenu {
+    background: #ffffff;
+    border: 1px solid #e2e8f0;
+    padding: 6px 4px;
+    border-radius: 8px;
+}
+QMenu::item {
+    padding: 6px 14px;
+    border-radius: 6px;
+}
+QMenu::item:selected {
+    background: #e6f0ff;
+    color: #0f172a;
+}
+QMenu::separator {
+    height: 1px;
+    margin: 4px 8px;
+    background: #e2e8f0;
+}
+"""
+
+
+@contextmanager
+def _blocked(obj: QtCore.QObject) -> Iterator[None]:
+    """临时屏蔽 obj 的信号，异常时也恢复原先的屏蔽状态。"""
+    previous = obj.blockSignals(True)
+    try:
+        yield
+    finally:
+        obj.blockSignals(previous)
 
 
 class SnowQuotesPage(QtWidgets.QWidget):
@@ -15,6 +118,23 @@ class SnowQuotesPage(QtWidgets.QWidget):
     def __init__(self, *, host: "MainWindow", parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self._host = host
+        # (symbol_entries 列表对象, 长度, 代码 -> 条目索引)；持有列表引用并用 is 比较，避免 id 复用误判
+        self._meta_index_cache: Optional[Tuple[List[Dict[str, Any]], int, Dict[str, Dict[str, Any]]]] = None
+        # 最近访问的自选分组条目缓存: wid -> (行情列表对象, entries)
+        self._watchlist_cache: OrderedDict[int, Tuple[Any, List[Dict[str, Any]]]] = OrderedDict()
+        # 自选分组 id -> 标签页下标，仅在 _init_watchlists 重建标签时更新。
+        self._wid_to_tab_index: Dict[int, int] = {}
+        # 快速切换分组时只在最后一次切换后刷新列表。
+        self._watchlist_refresh_timer = QtCore.QTimer(self)
+        self._watchlist_refresh_timer.setSingleShot(True)
+        self._watchlist_refresh_timer.setInterval(_WATCHLIST_REFRESH_DEBOUNCE_MS)
+        self._watchlist_refresh_timer.timeout.connect(self._flush_watchlist_refresh)
+        # 最近一次由标签切换触发的下标，刷新时据此跳过标签栏同步。
+        self._pending_tab_index: Optional[int] = None
+        # 右键菜单按视图各建一次，之后 clear() 复用，避免每次右键重新解析 QSS。
+        self._all_menu: Optional[QtWidgets.QMenu] = None
+        self._watchlist_menu: Optional[QtWidgets.QMenu] = None
+        self.setStyleSheet(_QUOTES_QSS)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -27,39 +147,52 @@ class SnowQuotesPage(QtWidgets.QWidget):
         self.stock_panel = self._create_stock_panel(self.body_splitter)
         self.body_splitter.addWidget(self.stock_panel)
 
+        # 图表面板只是包装宿主已创建的 web_view/进度条，同步装入，避免它们作为主窗口
+        # 的无布局子控件先露出再被重新挂接。
         self.chart_panel = self._create_chart_panel(self.body_splitter)
         self.body_splitter.addWidget(self.chart_panel)
+        QtCore.QTimer.singleShot(0, self._deferred_init)
 
-        self.strategy_sidebar = self._create_strategy_sidebar(self.body_splitter)
-        self.body_splitter.addWidget(self.strategy_sidebar)
-        if self.strategy_sidebar:
-            self.strategy_sidebar.setVisible(False)
+        # 策略侧栏默认隐藏，首次展开时再由 ensure_strategy_sidebar 构建。
+        self.strategy_sidebar: Optional[QtWidgets.QWidget] = None
 
         self.body_splitter.setStretchFactor(0, 0)
         self.body_splitter.setStretchFactor(1, 1)
-        self.body_splitter.setStretchFactor(2, 0)
 
         self._bind_host()
 
+    def ensure_strategy_sidebar(self) -> QtWidgets.QWidget:
+        if self.strategy_sidebar is None:
+            sidebar = self._create_strategy_sidebar(self.body_splitter)
+            sidebar.setVisible(False)
+            self.body_splitter.addWidget(sidebar)
+            self.body_splitter.setStretchFactor(self.body_splitter.indexOf(sidebar), 0)
+            self.strategy_sidebar = sidebar
+            self._host.strategy_sidebar = sidebar
+        return self.strategy_sidebar
+
+    def _deferred_init(self) -> None:
+        """首帧之后的延迟初始化。"""
+        self._host._ensure_sample_symbols()
+
     def _bind_host(self) -> None:
         host = self._host
         host.body_splitter = self.body_splitter
         host.stock_panel = self.stock_panel
         host.chart_panel = self.chart_panel
         host.strategy_sidebar = self.strategy_sidebar
+        self.rebind_host()
+
+    def rebind_host(self) -> None:
+        """缓存宿主上的常用引用；宿主替换 store/控制器后需再次调用。"""
+        host = self._host
+        self._store = getattr(host, "watchlist_store", None)
+        self._kline_controller = getattr(host, "kline_controller", None)
 
     def _create_stock_panel(self, parent: QtWidgets.QWidget) -> QtWidgets.QWidget:
         panel = QtWidgets.QFrame(parent)
         panel.setObjectName("snowStockPanel")
         panel.setMinimumWidth(280)
-        panel.setStyleSheet(
-            """
-QFrame#snowStockPanel {
-    background: #ffffff;
-    border-radius: 0;
-}
-"""
-        )
         layout = QtWidgets.QVBoxLayout(panel)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(12)
@@ -70,15 +203,6 @@ QFrame#snowStockPanel {
 
         tabs_container = QtWidgets.QFrame(panel)
         tabs_container.setObjectName("snowSymbolTabsContainer")
-        tabs_container.setStyleSheet(
-            """
-QFrame#snowSymbolTabsContainer {
-    background: #ffffff;
-    border-top: 1px solid #e5e8f1;
-    border-bottom: 1px solid #e5e8f1;
-}
-"""
-        )
         tabs_layout = QtWidgets.QVBoxLayout(tabs_container)
         tabs_layout.setContentsMargins(0, 0, 0, 0)
         tabs_layout.setSpacing(10)
@@ -88,37 +212,11 @@ QFrame#snowSymbolTabsContainer {
         category_bar.setDrawBase(False)
         category_bar.setExpanding(False)
         category_bar.setUsesScrollButtons(False)
-        category_bar.setElideMode(QtCore.Qt.ElideRight)
-        category_bar.setFocusPolicy(QtCore.Qt.NoFocus)
+        category_bar.setElideMode(_ELIDE_RIGHT)
+        category_bar.setFocusPolicy(_NO_FOCUS)
         for label in ("全部", "自选"):
             category_bar.addTab(label)
         category_bar.setCurrentIndex(0)
-        category_bar.setStyleSheet(
-            """
-QTabBar#snowCategoryTabs {
-    background: transparent;
-    qproperty-drawBase: 0;
-    padding-left: 6px;
-    border-bottom: 1px solid #e5e8f1;
-}
-QTabBar#snowCategoryTabs::tab {
-    color: #6f7b95;
-    padding: 4px 0;
-    margin-right: 26px;
-    font-size: 15px;
-    font-weight: 500;
-    border-bottom: 3px solid transparent;
-    background: transparent;
-}
-QTabBar#snowCategoryTabs::tab:selected {
-    color: #1f6dff;
-    font-weight: 600;
-}
-QTabBar#snowCategoryTabs::tab:hover {
-    color: #1f6dff;
-}
-"""
-        )
         tabs_layout.addWidget(category_bar)
         self._host.symbol_tabs = category_bar
 
@@ -131,18 +229,11 @@ QTabBar#snowCategoryTabs::tab:hover {
         all_layout.setContentsMargins(0, 0, 0, 0)
         all_layout.setSpacing(6)
         all_layout.addWidget(self._create_symbol_list_header(all_tab))
-        all_list = QtWidgets.QListView(all_tab)
-        all_list.setObjectName("snowAllSymbols")
-        all_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
-        all_list.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        all_list.setSelectionRectVisible(True)
-        all_list.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
-        all_list.setSpacing(2)
-        all_list.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-        all_list.customContextMenuRequested.connect(self._show_all_list_menu)
+        all_list = self._make_symbol_list_view(all_tab, "snowAllSymbols", self._show_all_list_menu)
         all_layout.addWidget(all_list, 1)
         stack.addWidget(all_tab)
         self._host.all_symbol_list = all_list
+        self._all_list = all_list
 
         fav_tab = QtWidgets.QWidget(stack)
         fav_layout = QtWidgets.QVBoxLayout(fav_tab)
@@ -157,32 +248,9 @@ QTabBar#snowCategoryTabs::tab:hover {
         watchlist_tabs.setDrawBase(False)
         watchlist_tabs.setExpanding(False)
         watchlist_tabs.setUsesScrollButtons(True)
-        watchlist_tabs.setElideMode(QtCore.Qt.ElideRight)
-        watchlist_tabs.setFocusPolicy(QtCore.Qt.NoFocus)
+        watchlist_tabs.setElideMode(_ELIDE_RIGHT)
+        watchlist_tabs.setFocusPolicy(_NO_FOCUS)
         watchlist_tabs.currentChanged.connect(self._on_watchlist_tab_changed)
-        watchlist_tabs.setStyleSheet(
-            """
-QTabBar#snowWatchlistTabs {
-    background: transparent;
-    padding-left: 4px;
-}
-QTabBar#snowWatchlistTabs::tab {
-    color: #6f7b95;
-    padding: 2px 6px;
-    margin-right: 10px;
-    font-size: 13px;
-    border: none;
-    background: transparent;
-}
-QTabBar#snowWatchlistTabs::tab:selected {
-    color: #1f6dff;
-    font-weight: 600;
-}
-QTabBar#snowWatchlistTabs::tab:hover {
-    color: #1f6dff;
-}
-"""
-        )
         tabs_row.addWidget(watchlist_tabs, 1)
         manage_btn = QtWidgets.QToolButton(fav_tab)
         manage_btn.setText("…")
@@ -193,15 +261,7 @@ QTabBar#snowWatchlistTabs::tab:hover {
 
         fav_layout.addWidget(self._create_symbol_list_header(fav_tab))
 
-        fav_list = QtWidgets.QListView(fav_tab)
-        fav_list.setObjectName("snowFavoriteSymbols")
-        fav_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
-        fav_list.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        fav_list.setSelectionRectVisible(True)
-        fav_list.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
-        fav_list.setSpacing(2)
-        fav_list.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-        fav_list.customContextMenuRequested.connect(self._show_watchlist_menu)
+        fav_list = self._make_symbol_list_view(fav_tab, "snowFavoriteSymbols", self._show_watchlist_menu)
         fav_layout.addWidget(fav_list, 1)
         stack.addWidget(fav_tab)
         self._host.favorite_symbol_list = fav_list
@@ -214,14 +274,28 @@ QTabBar#snowWatchlistTabs::tab:hover {
         # 行情页显示市场标签，自选页不需要隐藏它们以保持布局稳定
         stack.setCurrentIndex(category_bar.currentIndex())
 
-        QtCore.QTimer.singleShot(0, self._init_watchlists)
+        # 自选分组与列表在首次切换到“自选”时才加载，启动阶段不查询自选库。
+        self._watchlists_loaded = False
 
         layout.addWidget(tabs_container, 1)
 
-        QtCore.QTimer.singleShot(0, self._host._ensure_sample_symbols)
-
         return panel
 
+    def _make_symbol_list_view(
+        self, parent: QtWidgets.QWidget, object_name: str, menu_slot: Callable[[QtCore.QPoint], None]
+    ) -> QtWidgets.QListView:
+        """创建全部/自选共用的多选股票列表；行高、分批布局等由 SymbolListManager 统一设置。"""
+        view = QtWidgets.QListView(parent)
+        view.setObjectName(object_name)
+        view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        view.setSelectionRectVisible(True)
+        view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        view.setSpacing(2)
+        view.setContextMenuPolicy(_CUSTOM_CONTEXT_MENU)
+        view.customContextMenuRequested.connect(menu_slot)
+        return view
+
     def _create_symbol_list_header(self, parent: QtWidgets.QWidget) -> QtWidgets.QWidget:
         header = QtWidgets.QFrame(parent)
         header.setObjectName("snowSymbolListHeader")
@@ -235,13 +309,13 @@ QTabBar#snowWatchlistTabs::tab:hover {
 
         price_label = QtWidgets.QLabel("最新价", header)
         price_label.setObjectName("snowSymbolHeaderPrice")
-        price_label.setAlignment(QtCore.Qt.AlignCenter)
+        price_label.setAlignment(_ALIGN_CENTER)
         price_label.setFixedWidth(72)
         layout.addWidget(price_label)
 
         change_label = QtWidgets.QLabel("涨跌幅", header)
         change_label.setObjectName("snowSymbolHeaderChange")
-        change_label.setAlignment(QtCore.Qt.AlignCenter)
+        change_label.setAlignment(_ALIGN_CENTER)
         change_label.setFixedWidth(72)
         layout.addWidget(change_label)
 
@@ -255,11 +329,11 @@ QTabBar#snowWatchlistTabs::tab:hover {
         layout.setSpacing(4)
 
         name_label = QtWidgets.QLabel("名称", header)
-        name_label.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+        name_label.setAlignment(_ALIGN_LEFT_VCENTER)
         layout.addWidget(name_label, 1)
 
         code_label = QtWidgets.QLabel("代码", header)
-        code_label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        code_label.setAlignment(_ALIGN_RIGHT_VCENTER)
         code_label.setFixedWidth(96)
         layout.addWidget(code_label)
         return header
@@ -299,7 +373,7 @@ QTabBar#snowWatchlistTabs::tab:hover {
         container_layout.setSpacing(0)
         placeholder = QtWidgets.QLabel("正在初始化策略工作台...", container)
         placeholder.setObjectName("snowStrategyPlaceholder")
-        placeholder.setAlignment(QtCore.Qt.AlignCenter)
+        placeholder.setAlignment(_ALIGN_CENTER)
         container_layout.addWidget(placeholder, 1)
         layout.addWidget(container, 1)
 
@@ -311,45 +385,53 @@ QTabBar#snowWatchlistTabs::tab:hover {
     # --- Watchlist management -----------------------------------------
     def _selected_watchlist_items(self) -> List[Dict[str, Any]]:
         """Return selected entries from the watchlist view."""
-        view = getattr(self, "_watchlist_view", None)
-        if view is None:
-            return []
-        selection = view.selectedIndexes()
-        entries: List[Dict[str, Any]] = []
-        for idx in selection:
-            entry = idx.data(QtCore.Qt.UserRole + 1)
-            if isinstance(entry, dict):
-                entries.append(entry)
-        return entries
+        return self._selected_entries(getattr(self, "_watchlist_view", None))
 
     def _lookup_symbol_meta(self, symbol: str) -> Dict[str, Any]:
         """Find cached latest价/涨跌幅数据 from the main symbol list."""
-        kc = getattr(self._host, "kline_controller", None)
+        kc = self._kline_controller
         if kc is None:
             return {}
-        target = (symbol or "").strip().upper()
-        for entry in getattr(kc, "symbol_entries", []):
-            entry_symbol = str(entry.get("symbol") or entry.get("table") or "").upper()
-            if entry_symbol == target:
-                return entry
-        return {}
+        entries = getattr(kc, "symbol_entries", [])
+        cache = self._meta_index_cache
+        if cache is None or cache[0] is not entries or cache[1] != len(entries):
+            # 刷新时 symbol_entries 整体替换，加载过程中也会原地追加：对象身份或长度变化即重建索引。
+            index: Dict[str, Dict[str, Any]] = {}
+            for entry in entries:
+                index.setdefault(str(entry.get("symbol") or entry.get("table") or "").upper(), entry)
+            cache = (entries, len(entries), index)
+            self._meta_index_cache = cache
+        if not symbol:
+            return {}
+        # 索引键已是大写；自选库中的代码通常已规范化，先直接命中再回退到 strip/upper。
+        index = cache[2]
+        hit = index.get(symbol)
+        if hit is not None:
+            return hit
+        return index.get(symbol.strip().upper(), {})
 
     def _selected_all_items(self) -> List[Dict[str, Any]]:
         """Return selected entries from the '全部'列表."""
-        view = getattr(self._host, "all_symbol_list", None)
+        return self._selected_entries(self._all_list)
+
+    @staticmethod
+    def _selected_entries(view: Optional[QtWidgets.QAbstractItemView]) -> List[Dict[str, Any]]:
         if view is None:
             return []
-        selection = view.selectedIndexes()
+        selection_model = view.selectionModel()
+        if selection_model is None or not selection_model.hasSelection():
+            return []
+        # selectedRows() 每行只返回一个索引，不随列数成倍增加 data() 调用。
         entries: List[Dict[str, Any]] = []
-        for idx in selection:
-            entry = idx.data(QtCore.Qt.UserRole + 1)
+        for idx in selection_model.selectedRows():
+            entry = idx.data(_ENTRY_ROLE)
             if isinstance(entry, dict):
                 entries.append(entry)
         return entries
 
     def _show_all_list_menu(self, pos: QtCore.QPoint) -> None:
-        view = getattr(self._host, "all_symbol_list", None)
-        store = getattr(self._host, "watchlist_store", None)
+        view = self._all_list
+        store = self._store
         if view is None or store is None:
             return
         index = view.indexAt(pos)
@@ -369,17 +451,25 @@ QTabBar#snowWatchlistTabs::tab:hover {
             QtWidgets.QMessageBox.information(self, "缺少分组", "请先在自选页创建分组后再添加股票。")
             return
 
-        menu = self._styled_menu(view)
+        if self._all_menu is None:
+            self._all_menu = self._styled_menu(view)
+        else:
+            self._reset_menu(self._all_menu)
+        menu = self._all_menu
         add_menu = menu.addMenu("加入自选分组")
         for wid, name in groups:
             action = add_menu.addAction(str(name))
-            action.triggered.connect(lambda _checked=False, gid=int(wid): self._add_selected_all_to_watchlist(gid))
+            action.triggered.connect(partial(self._add_selected_all_to_watchlist, int(wid), entries))
         manage_action = menu.addAction("管理/新建分组...")
         manage_action.triggered.connect(self._open_watchlist_manager)
         menu.exec_(view.viewport().mapToGlobal(pos))
 
-    def _add_selected_all_to_watchlist(self, target_id: Optional[int]) -> None:
-        entries = self._selected_all_items()
+    def _add_selected_all_to_watchlist(
+        self, target_id: Optional[int], entries: Optional[List[Dict[str, Any]]] = None, *_: Any
+    ) -> None:
+        # 右键菜单已取过选中条目时直接复用，避免再遍历一次 selectedIndexes()。
+        if entries is None:
+            entries = self._selected_all_items()
         if not entries:
             QtWidgets.QMessageBox.information(self, "未选择", "请先选择要加入自选的股票。")
             return
@@ -400,11 +490,10 @@ QTabBar#snowWatchlistTabs::tab:hover {
             # Switch tab to the target group after adding for immediate feedback
             tabs = getattr(self, "_watchlist_tabs", None)
             if tabs:
-                idx = next((i for i in range(tabs.count()) if tabs.tabData(i) == int(target_id)), -1)
+                idx = self._wid_to_tab_index.get(int(target_id), -1)
                 if idx >= 0:
-                    tabs.blockSignals(True)
-                    tabs.setCurrentIndex(idx)
-                    tabs.blockSignals(False)
+                    with _blocked(tabs):
+                        tabs.setCurrentIndex(idx)
             self._host.current_watchlist_id = int(target_id)
             self.refresh_watchlist_view(int(target_id))
         except Exception as exc:
@@ -412,40 +501,30 @@ QTabBar#snowWatchlistTabs::tab:hover {
 
     def _styled_menu(self, parent: QtWidgets.QWidget) -> QtWidgets.QMenu:
         menu = QtWidgets.QMenu(parent)
-        menu.setStyleSheet(
-            """
-            QMenu {
-                background: #ffffff;
-                border: 1px solid #e2e8f0;
-                padding: 6px 4px;
-                border-radius: 8px;
-            }
-            QMenu::item {
-                padding: 6px 14px;
-                border-radius: 6px;
-            }
-            QMenu::item:selected {
-                background: #e6f0ff;
-                color: #0f172a;
-            }
-            QMenu::separator {
-                height: 1px;
-                margin: 4px 8px;
-                background: #e2e8f0;
-            }
-            """
-        )
+        menu.setStyleSheet(_MENU_QSS)
         return menu
 
+    @staticmethod
+    def _reset_menu(menu: QtWidgets.QMenu) -> None:
+        """清空复用菜单：clear() 删除动作及其槽，子菜单需单独释放。"""
+        menu.clear()
+        for submenu in menu.findChildren(QtWidgets.QMenu, options=QtCore.Qt.FindDirectChildrenOnly):
+            submenu.deleteLater()
+
     def _on_category_changed(self, index: int) -> None:
-        if index == 1:
-            self.refresh_watchlist_view()
+        if index != 1:
+            return
+        if not self._watchlists_loaded:
+            self._init_watchlists()
+            return
+        self._watchlist_refresh_timer.start()
 
     def _init_watchlists(self) -> None:
         tabs = getattr(self, "_watchlist_tabs", None)
-        store = getattr(self._host, "watchlist_store", None)
+        store = self._store
         if tabs is None or store is None:
             return
+        self._watchlists_loaded = True
         if self._favorite_manager is None and self._watchlist_view is not None:
             self._favorite_manager = SymbolListManager(
                 list_view=self._watchlist_view,
@@ -455,13 +534,20 @@ QTabBar#snowWatchlistTabs::tab:hover {
                 selection_mode=QtWidgets.QAbstractItemView.ExtendedSelection,
             )
         lists = self._load_watchlists(store)
-        tabs.blockSignals(True)
-        while tabs.count():
-            tabs.removeTab(0)
-        for wid, name in lists:
-            tabs.addTab(str(name))
-            tabs.setTabData(tabs.count() - 1, int(wid))
-        tabs.blockSignals(False)
+        with _blocked(tabs):
+            # 只修补有变化的标签，避免每次新建/重命名/删除都清空重建整个标签栏。
+            for i, (wid, name) in enumerate(lists):
+                if i < tabs.count():
+                    if tabs.tabData(i) != int(wid):
+                        tabs.setTabData(i, int(wid))
+                    if tabs.tabText(i) != str(name):
+                        tabs.setTabText(i, str(name))
+                else:
+                    tabs.addTab(str(name))
+                    tabs.setTabData(i, int(wid))
+            for i in range(tabs.count() - 1, len(lists) - 1, -1):
+                tabs.removeTab(i)
+        self._wid_to_tab_index = {int(wid): i for i, (wid, _name) in enumerate(lists)}
         if not lists:
             self._host.current_watchlist_id = None
             self.refresh_watchlist_view()
@@ -473,7 +559,7 @@ QTabBar#snowWatchlistTabs::tab:hover {
         if target_id is None:
             target_id = int(lists[0][0])
 
-        idx = next((i for i in range(tabs.count()) if tabs.tabData(i) == int(target_id)), -1)
+        idx = self._wid_to_tab_index.get(int(target_id), -1)
         if idx >= 0:
             tabs.setCurrentIndex(idx)
             self._host.current_watchlist_id = int(target_id)
@@ -494,11 +580,18 @@ QTabBar#snowWatchlistTabs::tab:hover {
             return
         wid = tabs.tabData(index)
         self._host.current_watchlist_id = int(wid) if wid else None
-        self.refresh_watchlist_view()
+        self._pending_tab_index = index
+        self._watchlist_refresh_timer.start()
 
-    def refresh_watchlist_view(self, watchlist_id: Optional[int] = None) -> None:
+    def _flush_watchlist_refresh(self) -> None:
+        known_tab_index, self._pending_tab_index = self._pending_tab_index, None
+        self.refresh_watchlist_view(known_tab_index=known_tab_index)
+
+    def refresh_watchlist_view(
+        self, watchlist_id: Optional[int] = None, *, known_tab_index: Optional[int] = None
+    ) -> None:
         view = getattr(self, "_watchlist_view", None)
-        store = getattr(self._host, "watchlist_store", None)
+        store = self._store
         manager = getattr(self, "_favorite_manager", None)
         if view is None or store is None or manager is None:
             return
@@ -507,12 +600,18 @@ QTabBar#snowWatchlistTabs::tab:hover {
             manager.populate([], is_sample=False)
             return
         tabs = getattr(self, "_watchlist_tabs", None)
-        if tabs and wid:
-            idx = next((i for i in range(tabs.count()) if tabs.tabData(i) == int(wid)), -1)
+        # 由切换标签触发时标签栏已在目标位置，无需再同步下标。
+        if tabs and known_tab_index is None:
+            idx = self._wid_to_tab_index.get(int(wid), -1)
             if idx >= 0:
-                tabs.blockSignals(True)
-                tabs.setCurrentIndex(idx)
-                tabs.blockSignals(False)
+                with _blocked(tabs):
+                    tabs.setCurrentIndex(idx)
+        meta_version = self._symbol_meta_version()
+        cached = self._watchlist_cache.get(int(wid))
+        if cached is not None and self._same_meta_version(cached[0], meta_version):
+            self._watchlist_cache.move_to_end(int(wid))
+            manager.populate(cached[1], is_sample=False)
+            return
         try:
             symbols = store.list_symbols(int(wid)) if wid else []
         except Exception:
@@ -530,7 +629,37 @@ QTabBar#snowWatchlistTabs::tab:hover {
                     "change_percent": market_meta.get("change_percent"),
                 }
             )
+        self._watchlist_cache[int(wid)] = (meta_version, entries)
+        self._watchlist_cache.move_to_end(int(wid))
+        while len(self._watchlist_cache) > _WATCHLIST_CACHE_SIZE:
+            self._watchlist_cache.popitem(last=False)
         manager.populate(entries, is_sample=False)
+
+    def invalidate_watchlist_cache(self, *watchlist_ids: Optional[int]) -> None:
+        """Drop cached entries for the given groups, or all groups when none are given."""
+        if not watchlist_ids:
+            self._watchlist_cache.clear()
+            return
+        for wid in watchlist_ids:
+            if wid:
+                self._watchlist_cache.pop(int(wid), None)
+
+    def _symbol_meta_version(self) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        # 返回列表对象本身而非 id()：缓存持有引用，旧列表不会被回收后让新列表复用同一 id
+        kc = self._kline_controller
+        if kc is None:
+            return None
+        entries = getattr(kc, "symbol_entries", [])
+        return entries, len(entries)
+
+    @staticmethod
+    def _same_meta_version(
+        left: Optional[Tuple[List[Dict[str, Any]], int]],
+        right: Optional[Tuple[List[Dict[str, Any]], int]],
+    ) -> bool:
+        if left is None or right is None:
+            return left is right
+        return left[0] is right[0] and left[1] == right[1]
 
     def _prompt_watchlist_name(self, title: str, default: str = "") -> Optional[str]:
         text, ok = QtWidgets.QInputDialog.getText(self, title, "输入自选分组名称:", text=default)
@@ -540,7 +669,7 @@ QTabBar#snowWatchlistTabs::tab:hover {
         return name
 
     def _create_watchlist(self) -> None:
-        store = getattr(self._host, "watchlist_store", None)
+        store = self._store
         if store is None:
             return
         name = self._prompt_watchlist_name("新建自选分组", "自选分组")
@@ -554,7 +683,7 @@ QTabBar#snowWatchlistTabs::tab:hover {
             QtWidgets.QMessageBox.warning(self, "创建失败", str(exc))
 
     def _rename_watchlist(self) -> None:
-        store = getattr(self._host, "watchlist_store", None)
+        store = self._store
         tabs = getattr(self, "_watchlist_tabs", None)
         if store is None or tabs is None:
             return
@@ -573,7 +702,7 @@ QTabBar#snowWatchlistTabs::tab:hover {
             QtWidgets.QMessageBox.warning(self, "重命名失败", str(exc))
 
     def _delete_watchlist(self) -> None:
-        store = getattr(self._host, "watchlist_store", None)
+        store = self._store
         tabs = getattr(self, "_watchlist_tabs", None)
         if store is None or tabs is None:
             return
@@ -588,13 +717,14 @@ QTabBar#snowWatchlistTabs::tab:hover {
             return
         try:
             store.delete_watchlist(int(watchlist_id))
+            self.invalidate_watchlist_cache(watchlist_id)
             self._host.current_watchlist_id = None
             self._init_watchlists()
         except Exception as exc:
             QtWidgets.QMessageBox.warning(self, "删除失败", str(exc))
 
     def _add_current_symbol_to_watchlist(self) -> None:
-        controller = getattr(self._host, "kline_controller", None)
+        controller = self._kline_controller
         if controller is None:
             return
         symbol = getattr(controller, "current_symbol", None) or getattr(controller, "current_table", None)
@@ -610,34 +740,28 @@ QTabBar#snowWatchlistTabs::tab:hover {
 
     def _remove_selected_from_watchlist(self) -> None:
         view = getattr(self, "_watchlist_view", None)
-        store = getattr(self._host, "watchlist_store", None)
+        store = self._store
         if view is None or store is None:
             return
-        selection = view.selectedIndexes()
-        if not selection:
+        entries = self._selected_entries(view)
+        if not entries:
             QtWidgets.QMessageBox.information(self, "未选择", "请先在列表中选择要移除的股票。")
             return
-        symbols = []
-        for idx in selection:
-            entry = idx.data(QtCore.Qt.UserRole + 1)
-            if isinstance(entry, dict):
-                sym = entry.get("symbol")
-                if sym:
-                    symbols.append(sym)
+        symbols = [entry["symbol"] for entry in entries if entry.get("symbol")]
         watchlist_id = self._host.current_watchlist_id
         if not symbols or not watchlist_id:
             QtWidgets.QMessageBox.information(self, "缺少分组", "请先选择或创建自选分组。")
             return
         try:
-            for sym in symbols:
-                store.remove_symbol(int(watchlist_id), sym)
+            store.remove_symbols(int(watchlist_id), symbols)
+            self.invalidate_watchlist_cache(watchlist_id)
             self.refresh_watchlist_view()
         except Exception as exc:
             QtWidgets.QMessageBox.warning(self, "移除失败", str(exc))
 
     def _show_watchlist_menu(self, pos: QtCore.QPoint) -> None:
         view = getattr(self, "_watchlist_view", None)
-        store = getattr(self._host, "watchlist_store", None)
+        store = self._store
         tabs = getattr(self, "_watchlist_tabs", None)
         if view is None or store is None or tabs is None:
             return
@@ -652,7 +776,11 @@ QTabBar#snowWatchlistTabs::tab:hover {
             return
 
         current_id = self._host.current_watchlist_id
-        menu = self._styled_menu(view)
+        if self._watchlist_menu is None:
+            self._watchlist_menu = self._styled_menu(view)
+        else:
+            self._reset_menu(self._watchlist_menu)
+        menu = self._watchlist_menu
         remove_action = menu.addAction("移除选中")
         remove_action.triggered.connect(self._remove_selected_from_watchlist)
         menu.addSeparator()
@@ -667,17 +795,20 @@ QTabBar#snowWatchlistTabs::tab:hover {
             move_menu = menu.addMenu("移动到分组")
             for wid, name in target_groups:
                 action = move_menu.addAction(str(name))
-                action.triggered.connect(lambda _checked=False, gid=int(wid): self._move_selected_to_watchlist(gid))
+                action.triggered.connect(partial(self._move_selected_to_watchlist, int(wid), entries))
         manage_action = menu.addAction("管理/新建分组...")
         manage_action.triggered.connect(self._open_watchlist_manager)
         menu.exec_(view.viewport().mapToGlobal(pos))
 
-    def _move_selected_to_watchlist(self, target_id: int) -> None:
-        store = getattr(self._host, "watchlist_store", None)
+    def _move_selected_to_watchlist(
+        self, target_id: int, entries: Optional[List[Dict[str, Any]]] = None, *_: Any
+    ) -> None:
+        store = self._store
         current_id = self._host.current_watchlist_id
         if store is None or current_id is None or target_id == current_id:
             return
-        entries = self._selected_watchlist_items()
+        if entries is None:
+            entries = self._selected_watchlist_items()
         if not entries:
             QtWidgets.QMessageBox.information(self, "未选择", "请先选择要移动的股票。")
             return
@@ -691,30 +822,131 @@ QTabBar#snowWatchlistTabs::tab:hover {
             return
         try:
             store.add_symbols(int(target_id), items)
-            for sym, _ in items:
-                store.remove_symbol(int(current_id), sym)
+            store.remove_symbols(int(current_id), [sym for sym, _ in items])
+            self.invalidate_watchlist_cache(target_id, current_id)
             # Switch to target group after moving
             tabs = getattr(self, "_watchlist_tabs", None)
             if tabs:
-                idx = next((i for i in range(tabs.count()) if tabs.tabData(i) == int(target_id)), -1)
+                idx = self._wid_to_tab_index.get(int(target_id), -1)
                 if idx >= 0:
-                    tabs.blockSignals(True)
-                    tabs.setCurrentIndex(idx)
-                    tabs.blockSignals(False)
+                    with _blocked(tabs):
+                        tabs.setCurrentIndex(idx)
             self._host.current_watchlist_id = int(target_id)
             self.refresh_watchlist_view(int(target_id))
         except Exception as exc:
             QtWidgets.QMessageBox.warning(self, "移动失败", str(exc))
 
     def _open_watchlist_manager(self) -> None:
-        store = getattr(self._host, "watchlist_store", None)
+        store = self._store
         if store is None:
             return
         dialog = WatchlistManageDialog(store=store, current_id=self._host.current_watchlist_id, parent=self)
         dialog.exec_()
+        self.invalidate_watchlist_cache()
         self._init_watchlists()
 
 
+class _WatchlistGroupModel(QtCore.QAbstractTableModel):
+    """分组列表模型：第 0 列为名称，第 1 列由 _GroupActionDelegate 绘制操作按钮。"""
+
+    GroupRole = QtCore.Qt.UserRole + 1
+    _HEADERS = ("我的分组", "操作")
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: List[Tuple[int, str]] = []
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        wid, name = self._rows[index.row()]
+        if role == QtCore.Qt.DisplayRole and index.column() == 0:
+            return str(name)
+        if role == self.GroupRole:
+            return int(wid), str(name)
+        return None
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal and 0 <= section < len(self._HEADERS):
+            return self._HEADERS[section]
+        return None
+
+    def set_groups(self, groups: List[Tuple[int, str]]) -> None:
+        self.beginResetModel()
+        self._rows = [(int(wid), str(name)) for wid, name in groups]
+        self.endResetModel()
+
+    def row_for_id(self, wid: Optional[int]) -> int:
+        for row, (gid, _name) in enumerate(self._rows):
+            if gid == wid:
+                return row
+        return -1
+
+
+class _GroupActionDelegate(QtWidgets.QStyledItemDelegate):
+    """直接绘制 ✎/🗑 两个按钮并在点击时发出信号，代替每行一个按钮控件。"""
+
+    rename_requested = QtCore.pyqtSignal(int, str)
+    delete_requested = QtCore.pyqtSignal(int, str)
+
+    _BUTTON_SIZE = QtCore.QSize(26, 22)
+    _SPACING = 4
+    _GLYPHS = ("✎", "🗑")
+
+    def _button_rects(self, rect: QtCore.QRect) -> List[QtCore.QRect]:
+        size = self._BUTTON_SIZE
+        top = rect.top() + (rect.height() - size.height()) // 2
+        left = rect.left() + self._SPACING
+        return [
+            QtCore.QRect(left + i * (size.width() + self._SPACING), top, size.width(), size.height())
+            for i in range(len(self._GLYPHS))
+        ]
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:  # type: ignore[override]
+        super().paint(painter, option, index)
+        widget = option.widget
+        style = widget.style() if widget is not None else QtWidgets.QApplication.style()
+        for rect, glyph in zip(self._button_rects(option.rect), self._GLYPHS):
+            button = QtWidgets.QStyleOptionButton()
+            button.rect = rect
+            button.text = glyph
+            button.state = QtWidgets.QStyle.State_Enabled
+            style.drawControl(QtWidgets.QStyle.CE_PushButton, button, painter, widget)
+
+    def editorEvent(  # type: ignore[override]
+        self,
+        event: QtCore.QEvent,
+        model: QtCore.QAbstractItemModel,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> bool:
+        if event.type() != QtCore.QEvent.MouseButtonRelease or not isinstance(event, QtGui.QMouseEvent):
+            return False
+        if event.button() != QtCore.Qt.LeftButton:
+            return False
+        group = index.data(_WatchlistGroupModel.GroupRole)
+        if not group:
+            return False
+        rename_rect, delete_rect = self._button_rects(option.rect)
+        if rename_rect.contains(event.pos()):
+            self.rename_requested.emit(*group)
+            return True
+        if delete_rect.contains(event.pos()):
+            self.delete_requested.emit(*group)
+            return True
+        return False
+
+
 class WatchlistManageDialog(QtWidgets.QDialog):
     """弹出式自选分组管理，仿雪球风格."""
 
@@ -728,9 +960,13 @@ class WatchlistManageDialog(QtWidgets.QDialog):
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(8)
 
-        self.table = QtWidgets.QTableWidget(self)
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["我的分组", "操作"])
+        self.model = _WatchlistGroupModel(self)
+        self.table = QtWidgets.QTableView(self)
+        self.table.setModel(self.model)
+        action_delegate = _GroupActionDelegate(self.table)
+        action_delegate.rename_requested.connect(self._rename_group)
+        action_delegate.delete_requested.connect(self._delete_group)
+        self.table.setItemDelegateForColumn(1, action_delegate)
         self.table.verticalHeader().setVisible(False)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
@@ -739,7 +975,7 @@ class WatchlistManageDialog(QtWidgets.QDialog):
 
         add_btn = QtWidgets.QPushButton("+ 新建分组", self)
         add_btn.clicked.connect(self._create_group)
-        layout.addWidget(add_btn, alignment=QtCore.Qt.AlignCenter)
+        layout.addWidget(add_btn, alignment=_ALIGN_CENTER)
 
         self._refresh()
 
@@ -748,27 +984,11 @@ class WatchlistManageDialog(QtWidgets.QDialog):
             groups = self.store.list_watchlists()
         except Exception:
             groups = []
-        self.table.setRowCount(len(groups))
-        for row, (wid, name) in enumerate(groups):
-            item = QtWidgets.QTableWidgetItem(str(name))
-            self.table.setItem(row, 0, item)
-            rename_btn = QtWidgets.QToolButton(self.table)
-            rename_btn.setText("✎")
-            rename_btn.clicked.connect(lambda _checked=False, gid=wid, gname=name: self._rename_group(gid, gname))
-            del_btn = QtWidgets.QToolButton(self.table)
-            del_btn.setText("🗑")
-            del_btn.clicked.connect(lambda _checked=False, gid=wid, gname=name: self._delete_group(gid, gname))
-            btn_widget = QtWidgets.QWidget(self.table)
-            btn_layout = QtWidgets.QHBoxLayout(btn_widget)
-            btn_layout.setContentsMargins(0, 0, 0, 0)
-            btn_layout.setSpacing(4)
-            btn_layout.addWidget(rename_btn)
-            btn_layout.addWidget(del_btn)
-            btn_layout.addStretch(1)
-            self.table.setCellWidget(row, 1, btn_widget)
-            if wid == self.current_id:
-                self.table.selectRow(row)
-        if groups and self.current_id is None:
+        self.model.set_groups(groups)
+        row = self.model.row_for_id(self.current_id)
+        if row >= 0:
+            self.table.selectRow(row)
+        elif groups and self.current_id is None:
             self.table.selectRow(0)
 
     def _create_group(self) -> None:
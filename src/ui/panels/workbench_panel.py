@@ -10,13 +10,16 @@ if __package__ in (None, ""):
         sys.path.insert(0, str(project_root))
     __package__ = "src.ui.panels"
 
-import csv
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
 import math
+import os
 from pathlib import Path
 import re
-from typing import Any, Callable, Dict, List, Optional, Tuple
-
-import os
+import time
+import zlib
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Optional, Tuple
 
 from PyQt5 import QtCore, QtGui, QtWidgets  # type: ignore[import-not-found]
 
@@ -34,6 +37,361 @@ from ...research import (
 from ...rendering.render_utils import render_backtest_equity
 from ..echarts_preview_dialog import EChartsPreviewDialog
 
+# 回测净值图模板；路径解析在导入时做一次，不随面板实例重复。
+_BACKTEST_EQUITY_TEMPLATE = Path(__file__).resolve().parent.parent / 'rendering' / 'templates' / 'backtest_equity.html'
+
+# 最近选股结果缓存条数（按策略/日期/参数区分，股票池随条目记录）。
+_SCAN_CACHE_CAP = 8
+# 缓存有效期：一个自然日；数据库文件更新（mtime 变化）时立即失效。
+_SCAN_CACHE_TTL = 24 * 60 * 60
+
+# 缓存条目：(结果, 扫描时间, 数据库 mtime, 扫描时的股票池)
+_ScanCacheEntry = Tuple[List[ScanResult], float, Optional[float], FrozenSet[str]]
+
+# 策略图标底色；按 key 的 CRC32 取色，跨进程稳定（内置 hash 对字符串随机化）。
+_ICON_PALETTE = ('#1f5eff', '#0bbadf', '#64c5b1', '#ff915c', '#8c7bff')
+_ICON_SIZE = 72
+# 单张图集最多容纳的图标数，避免超出 QPixmap 的最大宽度。
+_ICON_ATLAS_COLUMNS = 256
+
+# 数据库路径与存在性检查的复用时长（秒）。
+_DB_CACHE_SECONDS = 1.0
+
+# 后台进度日志先入缓冲，按固定间隔合并写入日志面板；面板最多保留的行数。
+_LOG_FLUSH_INTERVAL_MS = 50
+_LOG_BUFFER_LIMIT = 500
+_LOG_MAX_BLOCKS = 2000
+
+# 搜索框输入防抖间隔（毫秒）：连续键入合并为一次卡片刷新。
+_CARD_SEARCH_DEBOUNCE_MS = 150
+
+# 扫描进行中进度标签的刷新间隔（毫秒）；进度信号本身只更新计数。
+_PROGRESS_REFRESH_MS = 200
+# 双击选股结果后延迟触发预览（毫秒），确保K线已切换；连续切换只预览最后一只。
+_ROW_PREVIEW_DELAY_MS = 80
+# 双击回测成交后合并跳转（加载标的 + 标记 + 聚焦）的等待时间（毫秒）。
+_BACKTEST_NAV_DELAY_MS = 50
+# 扫描进度消息中的 "(已处理/总数)"。
+_PROGRESS_RE = re.compile(r"\((\d+)/(\d+)\)")
+
+# 去掉代码中的非数字字符（如 "SZ300750" / "300750.SZ"）。
+_NONDIGIT_RE = re.compile(r'\D+')
+
+# 选股结果导出图片的网格布局（列数、卡片尺寸、间距、外边距）。
+_EXPORT_COLS = 4
+_EXPORT_CELL_W = 260
+_EXPORT_CELL_H = 90
+_EXPORT_GAP = 14
+_EXPORT_MARGIN = 16
+
+# 板块过滤：按代码数字部分的前缀识别板块。
+_BOARD_PREFIXES: Dict[str, Tuple[str, ...]] = {
+    '创业板': ('300', '301'),
+    '科创板': ('688', '689'),
+    '北交所': ('8', '4', '920'),
+    '新三板': ('43', '83', '87'),
+}
+
+# 扫描批大小上下限；批内股票分发给线程池，目标是大股票池约 16 批、每批至少让每个线程分到两只。
+_SCAN_BATCH_MIN = 32
+_SCAN_BATCH_MAX = 512
+_SCAN_TARGET_BATCHES = 16
+
+
+def _fmt_money(value: Any) -> str:
+    """价格类数值保留两位小数；缺失或非数值返回空串。"""
+    return f"{value:.2f}" if isinstance(value, (int, float)) else ''
+
+
+def _set_label_text(label: QtWidgets.QLabel, text: str) -> None:
+    """仅在文本变化时 setText：相同文本也会让 QLabel 重新计算尺寸并重绘。"""
+    if label.text() != text:
+        label.setText(text)
+
+
+class _ScanResultsModel(QtCore.QAbstractTableModel):
+    """选股结果表模型：直接持有 ScanResult 列表，只为可见单元格按需格式化文本。"""
+
+    HEADERS = ('股票', '代码', '买入日期', '买入价', '得分', '备注')
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: List[ScanResult] = []
+        self._texts: Dict[int, Tuple[str, ...]] = {}
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        if not (0 <= row < len(self._rows)):
+            return None
+        texts = self._texts.get(row)
+        if texts is None:
+            texts = self._format_row(self._rows[row])
+            self._texts[row] = texts
+        return texts[index.column()]
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    # ------------------------------------------------------------------
+    def set_rows(self, results: List[ScanResult]) -> None:
+        self.beginResetModel()
+        self._rows = list(results)
+        self._texts.clear()
+        self.endResetModel()
+
+    def append_rows(self, results: List[ScanResult]) -> None:
+        if not results:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(results) - 1)
+        self._rows.extend(results)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.set_rows([])
+
+    def result_at(self, row: int) -> Optional[ScanResult]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    @staticmethod
+    def _format_row(result: ScanResult) -> Tuple[str, ...]:
+        display_name = result.name or result.symbol
+        price_text = _fmt_money(result.entry_price)
+        score_text = f"{result.score:.2f}" if isinstance(result.score, (int, float)) else str(result.score)
+        remark = result.metadata.get('note') or result.metadata.get('status', '')
+        return display_name, result.symbol, result.entry_date or '', price_text, score_text, remark
+
+
+class _BacktestTradesModel(QtCore.QAbstractTableModel):
+    """回测成交明细表模型：持有成交字典列表，按需格式化并为收益列着色。"""
+
+    HEADERS = ('股票', '买入日', '卖出日', '仓位(股)', '买入价', '卖出价', '收益%', '收益额')
+    # 收益列（收益%、收益额）：正收益红色、负收益绿色。
+    _SIGNED_COLUMNS = {6: 'return_pct', 7: 'pnl'}
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._trades: List[Dict[str, Any]] = []
+        self._texts: Dict[int, Tuple[str, ...]] = {}
+        self._positive_brush = QtGui.QBrush(QtGui.QColor('#ef4444'))
+        self._negative_brush = QtGui.QBrush(QtGui.QColor('#16a34a'))
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._trades)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = index.row()
+        if not (0 <= row < len(self._trades)):
+            return None
+        column = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            texts = self._texts.get(row)
+            if texts is None:
+                texts = self._format_row(self._trades[row])
+                self._texts[row] = texts
+            return texts[column]
+        if role == QtCore.Qt.ForegroundRole and column in self._SIGNED_COLUMNS:
+            value = self._trades[row].get(self._SIGNED_COLUMNS[column])
+            if isinstance(value, (int, float)):
+                return self._positive_brush if value >= 0 else self._negative_brush
+        return None
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    # ------------------------------------------------------------------
+    def set_trades(self, trades: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._trades = list(trades)
+        self._texts.clear()
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.set_trades([])
+
+    @staticmethod
+    def _format_row(trade: Dict[str, Any]) -> Tuple[str, ...]:
+        return_pct = trade.get('return_pct')
+        pnl = trade.get('pnl') or 0.0
+        return (
+            str(trade.get('symbol', '')),
+            str(trade.get('entry_date', '')),
+            str(trade.get('exit_date', '')),
+            f"{trade.get('shares', 0.0):.2f}",
+            _fmt_money(trade.get('entry_price')),
+            _fmt_money(trade.get('exit_price')),
+            f"{(return_pct or 0) * 100:.2f}%",
+            f"{pnl:.2f}",
+        )
+
+
+class _ExportSignals(QtCore.QObject):
+    """线程池导出任务回传结果用；QRunnable 本身不能发信号。"""
+
+    finished = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+
+
+class _CsvExportTask(QtCore.QRunnable):
+    """在线程池中写出选股 CSV；行数据在 UI 线程预先快照为元组，任务内不访问界面对象。"""
+
+    HEADER = ('排名', '股票', '买入日期', '买入价', '得分', '备注')
+
+    def __init__(self, file_path: str, rows: List[Tuple[Any, ...]], signals: _ExportSignals) -> None:
+        super().__init__()
+        self.file_path = file_path
+        self.rows = rows
+        self.signals = signals
+
+    def run(self) -> None:
+        import csv  # 仅导出时需要，不放在模块顶层
+
+        try:
+            with open(self.file_path, 'w', encoding='utf-8-sig', newline='') as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(self.HEADER)
+                writer.writerows(self.rows)
+        except Exception as exc:  # pragma: no cover - file errors
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(self.file_path)
+
+
+def _render_scan_band(results: List[ScanResult], width: int) -> QtGui.QImage:
+    """把一段连续的选股卡片画到透明 QImage 上；只用 QImage/QPainter，可在工作线程调用。"""
+    cols = _EXPORT_COLS
+    step = _EXPORT_CELL_H + _EXPORT_GAP
+    band_rows = math.ceil(len(results) / cols)
+    image = QtGui.QImage(width, max(1, band_rows * step), QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+
+    title_font = QtGui.QFont()
+    title_font.setWeight(QtGui.QFont.DemiBold)
+    title_font.setPointSize(title_font.pointSize() + 1)
+    meta_font = QtGui.QFont()
+    meta_font.setPointSize(meta_font.pointSize() - 1)
+    # 画笔、画刷与对齐方式在循环外构造一次，每张卡片只做绘制。
+    border_pen = QtGui.QPen(QtGui.QColor('#e2e8f0'))
+    card_brush = QtGui.QBrush(QtGui.QColor('#ffffff'))
+    title_pen = QtGui.QPen(QtGui.QColor('#0f172a'))
+    meta_pen = QtGui.QPen(QtGui.QColor('#475569'))
+    align_left = QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop
+    align_right = QtCore.Qt.AlignRight | QtCore.Qt.AlignTop
+
+    for idx, result in enumerate(results):
+        col = idx % cols
+        row = idx // cols
+        x = _EXPORT_MARGIN + col * (_EXPORT_CELL_W + _EXPORT_GAP)
+        y = row * step
+        rect = QtCore.QRectF(x, y, _EXPORT_CELL_W, _EXPORT_CELL_H)
+
+        painter.setPen(border_pen)
+        painter.setBrush(card_brush)
+        painter.drawRoundedRect(rect, 8, 8)
+
+        # Text content
+        symbol = str(result.symbol or result.table_name or '').strip()
+        name = str(result.name or '').strip()
+        header = f"{symbol}  {name}" if name else symbol
+        score = f"得分 {result.score:.2f}" if isinstance(result.score, (int, float)) else f"得分 {result.score}"
+        entry_date = f"买入日: {result.entry_date or '--'}"
+        price_val = ''
+        if isinstance(result.entry_price, (int, float)):
+            price_val = f"买入价: {result.entry_price:.2f}"
+        elif result.entry_price:
+            price_val = f"买入价: {result.entry_price}"
+
+        painter.setFont(title_font)
+        painter.setPen(title_pen)
+        painter.drawText(rect.adjusted(12, 10, -12, -10), align_left, header)
+
+        painter.setFont(meta_font)
+        painter.setPen(meta_pen)
+        painter.drawText(rect.adjusted(12, 36, -12, -10), align_left, entry_date)
+        painter.drawText(rect.adjusted(12, 56, -12, -10), align_left, price_val)
+        painter.drawText(rect.adjusted(12, 10, -12, -10), align_right, score)
+
+    painter.end()
+    return image
+
+
+def _render_scan_image(results: List[ScanResult]) -> QtGui.QImage:
+    """按网格行切成若干横条并行绘制，再拼成整张图片；全程只用 QImage，可在工作线程调用。"""
+    cols = _EXPORT_COLS
+    step = _EXPORT_CELL_H + _EXPORT_GAP
+    rows = math.ceil(len(results) / cols)
+    width = _EXPORT_MARGIN * 2 + cols * _EXPORT_CELL_W + (cols - 1) * _EXPORT_GAP
+    height = _EXPORT_MARGIN * 2 + rows * _EXPORT_CELL_H + (rows - 1) * _EXPORT_GAP
+
+    band_count = max(1, min(rows, os.cpu_count() or 1))
+    rows_per_band = max(1, math.ceil(rows / band_count))
+    bands: List[Tuple[int, List[ScanResult]]] = []
+    for first_row in range(0, rows, rows_per_band):
+        bands.append((first_row, results[first_row * cols:(first_row + rows_per_band) * cols]))
+    if len(bands) <= 1:
+        images = [_render_scan_band(band, width) for _, band in bands]
+    else:
+        with ThreadPoolExecutor(max_workers=len(bands)) as executor:
+            images = list(executor.map(lambda band: _render_scan_band(band[1], width), bands))
+
+    image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtGui.QColor('#f8fafc'))
+    painter = QtGui.QPainter(image)
+    for (first_row, _), band_image in zip(bands, images):
+        painter.drawImage(0, _EXPORT_MARGIN + first_row * step, band_image)
+    painter.end()
+    return image
+
+
+class _ScanImageExportTask(QtCore.QRunnable):
+    """在线程池中绘制并保存选股结果图片。"""
+
+    def __init__(self, file_path: str, results: List[ScanResult], signals: _ExportSignals) -> None:
+        super().__init__()
+        self.file_path = file_path
+        self.results = results
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            saved = _render_scan_image(self.results).save(self.file_path, 'PNG')
+        except Exception as exc:  # pragma: no cover - render/file errors
+            self.signals.failed.emit(str(exc))
+            return
+        if not saved:
+            self.signals.failed.emit('无法保存图片，请检查路径或权限。')
+            return
+        self.signals.finished.emit(self.file_path)
+
 
 class StrategyWorkbenchPanel(QtWidgets.QWidget):
     '''Strategy research workbench inspired by professional terminals.'''
@@ -53,6 +411,8 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
     ) -> None:
         super().__init__(parent)
         self.setObjectName('StrategyWorkbench')
+        # 构建期间忽略筛选控件的信号，由 __init__ 末尾统一刷新一次策略卡片。
+        self._initialising = True
         self.registry = registry
         self.universe_provider = universe_provider
         self.selected_symbol_provider = selected_symbol_provider
@@ -65,21 +425,28 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
 
         self.current_strategy_key: Optional[str] = None
         self.param_widgets: Dict[str, QtWidgets.QWidget] = {}
+        # 参数表单控件池：切换策略时回收旧行控件，按类型复用而不是销毁重建。
+        self._widget_pool: Dict[str, List[QtWidgets.QWidget]] = {'label': [], 'number': [], 'select': [], 'text': []}
         self.scan_results: List[ScanResult] = []
         self.backtest_results: List[Dict[str, Any]] = []
-        initial_symbol = self.selected_symbol_provider() if selected_symbol_provider else None
-        self._current_selected_symbol: Optional[str] = initial_symbol
+        # 当前选中标的在首次显示时才向 provider 查询，隐藏的工作台不触发查询。
+        self._current_selected_symbol: Optional[str] = None
+        self._initial_sync_done = False
         self.latest_backtest_result: Optional[BacktestResult] = None
-        base_dir = Path(__file__).resolve().parent.parent
-        self.backtest_equity_template = base_dir / 'rendering' / 'templates' / 'backtest_equity.html'
+        self.backtest_equity_template = _BACKTEST_EQUITY_TEMPLATE
         self._equity_dialog: Optional[EChartsPreviewDialog] = None
-
-        # Faster scan defaults: larger并发。根据CPU动态提升线程数，力求更快扫描
-        cpu_cnt = os.cpu_count() or 8
-        # 更激进的并发，目标尽量压满 CPU（最高 512 线程）
-        max_workers = min(512, max(8, cpu_cnt * 16))
-        self.scanner = StrategyScanner(registry, batch_size=128, max_workers=max_workers, rows_per_symbol=800)
-        self.scanner.progress.connect(self._append_scan_log)
+        # 策略图标只取决于 key 与标题首字，按 (key, title) 缓存，筛选刷新时不再重绘。
+        self._icon_cache: Dict[Tuple[str, str], QtGui.QIcon] = {}
+        # 上次渲染的可见策略 key 序列，用于跳过无变化的刷新并做增量更新。
+        self._last_card_sig: Optional[Tuple[str, ...]] = None
+        # 每个策略一张常驻卡片（按注册顺序），筛选时只切换显隐。
+        self._card_items: Dict[str, QtWidgets.QListWidgetItem] = {}
+        self._db_cache: Optional[Tuple[float, Optional[Path], bool]] = None
+        self._card_match_cache: Dict[str, Tuple[StrategyDefinition, FrozenSet[str], str]] = {}
+
+        # 扫描以批量读库为主，按 I/O 型负载取线程数（最多 64）；上百线程只会增加切换与栈内存开销。
+        self.scanner = StrategyScanner(registry, worker_mode='io', rows_per_symbol=800)
+        # 进度信号只连一个槽：同一次分发里既入日志缓冲又更新计数。
         self.scanner.progress.connect(self._on_scan_progress)
         self.scanner.result.connect(self._on_scan_result)
         self.scanner.finished.connect(self._on_scan_finished)
@@ -91,16 +458,65 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         self.engine.failed.connect(self._on_backtest_failed)
         self.engine.cancelled.connect(self._on_backtest_cancelled)
 
+        self._scan_log_buffer: Deque[str] = deque(maxlen=_LOG_BUFFER_LIMIT)
+        self._backtest_log_buffer: Deque[str] = deque(maxlen=_LOG_BUFFER_LIMIT)
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(_LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        self._card_search_timer = QtCore.QTimer(self)
+        self._card_search_timer.setSingleShot(True)
+        self._card_search_timer.setInterval(_CARD_SEARCH_DEBOUNCE_MS)
+        self._card_search_timer.timeout.connect(self._on_card_filter_changed)
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setInterval(_PROGRESS_REFRESH_MS)
+        self._progress_timer.timeout.connect(self._update_scan_progress_label)
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(_ROW_PREVIEW_DELAY_MS)
+        self._preview_timer.timeout.connect(self._preview_current_strategy)
+        # 上次由选股结果触发的预览 (标的, 策略, 参数)，相同组合不重复预览。
+        self._preview_table: Optional[str] = None
+        self._last_preview_key: Optional[Tuple[Any, ...]] = None
+        self._backtest_nav_timer = QtCore.QTimer(self)
+        self._backtest_nav_timer.setSingleShot(True)
+        self._backtest_nav_timer.setInterval(_BACKTEST_NAV_DELAY_MS)
+        self._backtest_nav_timer.timeout.connect(self._apply_pending_backtest_nav)
+        # 待执行的回测成交跳转 (标的, 标记)；快速连续双击只执行最后一次。
+        self._pending_backtest_nav: Optional[Tuple[str, List[Dict[str, Any]]]] = None
+
         self.scan_kpis: Dict[str, QtWidgets.QLabel] = {}
         self.backtest_kpis: Dict[str, QtWidgets.QLabel] = {}
         self.scan_running = False
         self.backtest_running = False
+        # 正在运行的扫描/回测请求标识，用于合并重复触发。
+        self._scan_pending_key: Optional[Tuple[Any, ...]] = None
+        self._backtest_pending_key: Optional[Tuple[Any, ...]] = None
+        self._scan_cache: "OrderedDict[Tuple[Any, ...], _ScanCacheEntry]" = OrderedDict()
+        # 运行中扫描完成后写缓存所需信息：(缓存 key, 完整股票池, 数据库 mtime, 增量合并的旧结果)
+        self._scan_pending_cache: Optional[
+            Tuple[Tuple[Any, ...], FrozenSet[str], Optional[float], Optional[List[ScanResult]]]
+        ] = None
         self.scan_progress_label: Optional[QtWidgets.QLabel] = None
         self.scan_total_count = 0
         self.scan_processed_count = 0
+        # 流式结果先进 scan_results，表格插入与 KPI 刷新合并到下一轮事件循环统一处理。
+        self._scan_rows_flush_scheduled = False
+        # 选股 KPI 的累计量：流式结果只做增量累加，整体替换结果时才全量重算。
+        self._scan_score_sum = 0.0
+        self._scan_score_max = -math.inf
 
         self._build_ui()
+        self._initialising = False
         self.refresh_strategy_items()
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        if self._initial_sync_done:
+            return
+        self._initial_sync_done = True
+        if self._current_selected_symbol is None and self.selected_symbol_provider:
+            self._current_selected_symbol = self.selected_symbol_provider()
         self._apply_auto_universe_symbol()
 
     # ------------------------------------------------------------------
@@ -144,14 +560,15 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         title_row.addStretch(1)
         self.card_filter = QtWidgets.QComboBox(frame)
         self.card_filter.addItems(['全部', '波动策略', '形态识别', '趋势跟踪'])
-        self.card_filter.currentIndexChanged.connect(lambda _: self.refresh_strategy_items())
+        self.card_filter.currentIndexChanged.connect(self._on_card_filter_changed)
         title_row.addWidget(self.card_filter)
         header_layout.addLayout(title_row)
 
         self.card_search = QtWidgets.QLineEdit(frame)
         self.card_search.setPlaceholderText('搜索策略 / 关键词')
         self.card_search.setClearButtonEnabled(True)
-        self.card_search.textChanged.connect(lambda _: self.refresh_strategy_items())
+        # 不直接连 QTimer.start：textChanged(str) 会匹配到 start(int) 重载。
+        self.card_search.textChanged.connect(lambda _text: self._card_search_timer.start())
         header_layout.addWidget(self.card_search)
         frame_layout.addLayout(header_layout)
 
@@ -160,8 +577,10 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         self.card_view.setViewMode(QtWidgets.QListView.ListMode)
         self.card_view.setMovement(QtWidgets.QListView.Static)
         self.card_view.setSpacing(6)
-        self.card_view.setUniformItemSizes(False)
-        self.card_view.setWordWrap(True)
+        # 所有卡片共用同一尺寸（260x68），统一尺寸让布局和滚动不必逐项测量；
+        # 副标题在 _create_card_item 中截断为一行，完整描述放在 tooltip。
+        self.card_view.setUniformItemSizes(True)
+        self.card_view.setWordWrap(False)
         self.card_view.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.card_view.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.card_view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
@@ -203,10 +622,52 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         self.result_tabs = QtWidgets.QTabWidget(self)
         self.result_tabs.setObjectName('WorkbenchTabs')
         self.result_tabs.addTab(self._build_preview_tab(), '策略预览')
-        self.result_tabs.addTab(self._build_scan_tab(), '策略选股')
-        self.result_tabs.addTab(self._build_backtest_tab(), '策略回测')
+        # 选股页与回测页先放占位，首次切换过去时再构建，冷启动只付出预览页的开销。
+        self._scan_placeholder: Optional[QtWidgets.QWidget] = QtWidgets.QWidget(self.result_tabs)
+        self.result_tabs.addTab(self._scan_placeholder, '策略选股')
+        self._backtest_placeholder: Optional[QtWidgets.QWidget] = QtWidgets.QWidget(self.result_tabs)
+        self.result_tabs.addTab(self._backtest_placeholder, '策略回测')
+        self.result_tabs.currentChanged.connect(self._on_result_tab_changed)
         return self.result_tabs
 
+    @QtCore.pyqtSlot(int)
+    def _on_result_tab_changed(self, index: int) -> None:
+        widget = self.result_tabs.widget(index)
+        if widget is None:
+            return
+        if widget is self._scan_placeholder:
+            self._ensure_scan_tab()
+        elif widget is self._backtest_placeholder:
+            self._ensure_backtest_tab()
+
+    def _replace_placeholder(self, placeholder: QtWidgets.QWidget, tab: QtWidgets.QWidget, label: str) -> None:
+        index = self.result_tabs.indexOf(placeholder)
+        was_current = self.result_tabs.currentIndex() == index
+        self.result_tabs.blockSignals(True)
+        self.result_tabs.removeTab(index)
+        self.result_tabs.insertTab(index, tab, label)
+        if was_current:
+            self.result_tabs.setCurrentIndex(index)
+        self.result_tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _ensure_scan_tab(self) -> None:
+        placeholder = self._scan_placeholder
+        if placeholder is None:
+            return
+        self._scan_placeholder = None
+        self._replace_placeholder(placeholder, self._build_scan_tab(), '策略选股')
+        self._update_scan_action_state()
+
+    def _ensure_backtest_tab(self) -> None:
+        placeholder = self._backtest_placeholder
+        if placeholder is None:
+            return
+        self._backtest_placeholder = None
+        self._replace_placeholder(placeholder, self._build_backtest_tab(), '策略回测')
+        self._toggle_backtest_controls(self.backtest_running)
+        self._apply_auto_universe_symbol()
+
     def _build_scan_tab(self) -> QtWidgets.QWidget:
         tab = QtWidgets.QWidget(self)
         tab.setObjectName('ScanTab')
@@ -216,6 +677,9 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
 
         strip, labels = self._create_kpi_strip(['候选数', '平均得分', '最高得分'])
         self.scan_kpis = labels
+        self.kpi_scan_count = labels['候选数']
+        self.kpi_scan_avg = labels['平均得分']
+        self.kpi_scan_best = labels['最高得分']
         layout.addWidget(strip)
 
         form = QtWidgets.QFormLayout()
@@ -226,10 +690,13 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
 
         self.scan_board_filter = QtWidgets.QListWidget(tab)
         self.scan_board_filter.setSelectionMode(QtWidgets.QAbstractItemView.MultiSelection)
-        for name in ['创业板', '科创板', '北交所', '新三板']:
+        # 板块选项构建后不再变化，保留条目引用，过滤时直接读勾选状态。
+        self._board_filter_items: List[QtWidgets.QListWidgetItem] = []
+        for name in _BOARD_PREFIXES:
             item = QtWidgets.QListWidgetItem(name)
             item.setCheckState(QtCore.Qt.Unchecked)
             self.scan_board_filter.addItem(item)
+            self._board_filter_items.append(item)
         form.addRow('板块过滤:', self.scan_board_filter)
 
         self.scan_start = QtWidgets.QDateEdit(tab)
@@ -283,23 +750,29 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         self.scan_copy_button.setEnabled(False)
         self.scan_copy_button.clicked.connect(self._copy_scan_symbols)
         action_row.addWidget(self.scan_copy_button)
+
+        self.scan_clear_cache_button = QtWidgets.QPushButton('清空缓存', tab)
+        self.scan_clear_cache_button.setProperty('class', 'ghost')
+        self.scan_clear_cache_button.clicked.connect(self.clear_scan_cache)
+        action_row.addWidget(self.scan_clear_cache_button)
         layout.addLayout(action_row)
 
-        self.scan_table = QtWidgets.QTableWidget(tab)
+        self.scan_model = _ScanResultsModel(tab)
+        self.scan_table = QtWidgets.QTableView(tab)
         self.scan_table.setProperty('class', 'data-table')
-        self.scan_table.setColumnCount(6)
-        self.scan_table.setHorizontalHeaderLabels(['股票', '代码', '买入日期', '买入价', '得分', '备注'])
+        self.scan_table.setModel(self.scan_model)
         self.scan_table.horizontalHeader().setStretchLastSection(True)
         self.scan_table.verticalHeader().setVisible(False)
         self.scan_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.scan_table.doubleClicked.connect(self._on_scan_row_activated)
-        self.scan_table.itemSelectionChanged.connect(self._update_scan_action_state)
+        self.scan_table.selectionModel().selectionChanged.connect(self._update_scan_action_state)
         layout.addWidget(self.scan_table, 1)
 
         self.scan_log = QtWidgets.QTextEdit(tab)
         self.scan_log.setObjectName('LogPanel')
         self.scan_log.setReadOnly(True)
         self.scan_log.setMaximumHeight(120)
+        self.scan_log.document().setMaximumBlockCount(_LOG_MAX_BLOCKS)
         layout.addWidget(self.scan_log)
         return tab
 
@@ -312,6 +785,10 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
 
         strip, labels = self._create_kpi_strip(['净利润', '总收益%', '最大回撤', '胜率'])
         self.backtest_kpis = labels
+        self.kpi_backtest_net = labels['净利润']
+        self.kpi_backtest_return = labels['总收益%']
+        self.kpi_backtest_drawdown = labels['最大回撤']
+        self.kpi_backtest_win_rate = labels['胜率']
         layout.addWidget(strip)
 
         form = QtWidgets.QFormLayout()
@@ -386,12 +863,10 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         action_row.addStretch(1)
         layout.addLayout(action_row)
 
-        self.backtest_table = QtWidgets.QTableWidget(tab)
+        self.backtest_model = _BacktestTradesModel(tab)
+        self.backtest_table = QtWidgets.QTableView(tab)
         self.backtest_table.setProperty('class', 'data-table')
-        self.backtest_table.setColumnCount(8)
-        self.backtest_table.setHorizontalHeaderLabels([
-            '股票', '买入日', '卖出日', '仓位(股)', '买入价', '卖出价', '收益%', '收益额',
-        ])
+        self.backtest_table.setModel(self.backtest_model)
         self.backtest_table.verticalHeader().setVisible(False)
         self.backtest_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.backtest_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
@@ -405,6 +880,7 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         self.backtest_log.setObjectName('LogPanel')
         self.backtest_log.setReadOnly(True)
         self.backtest_log.setMaximumHeight(200)
+        self.backtest_log.document().setMaximumBlockCount(_LOG_MAX_BLOCKS)
         layout.addWidget(self.backtest_log)
         return tab
 
@@ -435,54 +911,135 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
     # ------------------------------------------------------------------
     def refresh_strategy_items(self) -> None:
         definitions = self.registry.all()
-        self.card_view.blockSignals(True)
-        self.card_view.clear()
         filter_text = self.card_filter.currentText() if hasattr(self, 'card_filter') else '全部'
         search_text = self.card_search.text().strip().lower() if hasattr(self, 'card_search') else ''
 
+        visible: List[StrategyDefinition] = []
         for definition in definitions:
-            if filter_text != '全部' and filter_text not in definition.tags:
+            tag_set, haystack = self._card_match_index(definition)
+            if filter_text != '全部' and filter_text not in tag_set:
                 continue
-            haystack = ' '.join(filter(None, [definition.title, definition.description, ' '.join(definition.tags)])).lower()
             if search_text and search_text not in haystack:
                 continue
-            snippet = (definition.description or '').replace('\n', ' ').strip()
-            if len(snippet) > 48:
-                snippet = snippet[:45] + '…'
-            meta = ' / '.join(definition.tags[:3])
-            secondary = meta or snippet
-            if not secondary:
-                secondary = '--'
-            display_text = f"{definition.title}\n{secondary}"
-            item = QtWidgets.QListWidgetItem(display_text)
-            item.setData(QtCore.Qt.UserRole, definition.key)
-            item.setToolTip(definition.description or '')
-            item.setIcon(self._build_strategy_icon(definition))
-            item.setSizeHint(QtCore.QSize(260, 68))
-            self.card_view.addItem(item)
-
-        self.card_view.blockSignals(False)
-        if self.card_view.count():
-            self.card_view.setCurrentRow(0)
+            visible.append(definition)
+
+        # 可见策略集合未变时无需触碰列表。
+        signature = tuple(definition.key for definition in visible)
+        if signature == self._last_card_sig:
+            return
+        self._last_card_sig = signature
+
+        # 卡片只在策略集合变化时创建；筛选只切换显隐，保留滚动位置与条目对象。
+        self.card_view.setUpdatesEnabled(False)
+        try:
+            self._sync_card_items(definitions)
+            wanted = set(signature)
+            for key, item in self._card_items.items():
+                hidden = key not in wanted
+                if item.isHidden() != hidden:
+                    item.setHidden(hidden)
+        finally:
+            self.card_view.setUpdatesEnabled(True)
+
+        if self.current_strategy_key in wanted:
+            current = self._card_items[self.current_strategy_key]
+            if self.card_view.currentItem() is not current:
+                self.card_view.blockSignals(True)
+                self.card_view.setCurrentItem(current)
+                self.card_view.blockSignals(False)
+        elif visible:
+            self.card_view.setCurrentItem(self._card_items[visible[0].key])
         else:
+            self.card_view.blockSignals(True)
+            self.card_view.setCurrentItem(None)
+            self.card_view.blockSignals(False)
             self._set_current_strategy(None)
 
-    def _build_strategy_icon(self, definition: StrategyDefinition) -> QtGui.QIcon:
-        colors = ['#1f5eff', '#0bbadf', '#64c5b1', '#ff915c', '#8c7bff']
-        color = colors[hash(definition.key) % len(colors)]
-        pix = QtGui.QPixmap(72, 72)
-        pix.fill(QtCore.Qt.transparent)
-        painter = QtGui.QPainter(pix)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        painter.setBrush(QtGui.QBrush(QtGui.QColor(color)))
-        painter.setPen(QtCore.Qt.NoPen)
-        painter.drawRoundedRect(QtCore.QRectF(4, 4, 64, 64), 12, 12)
-        painter.setPen(QtGui.QPen(QtGui.QColor('#111')))
-        painter.setFont(QtGui.QFont('Segoe UI', 18, QtGui.QFont.Bold))
-        painter.drawText(pix.rect(), QtCore.Qt.AlignCenter, definition.title[:1].upper())
-        painter.end()
-        return QtGui.QIcon(pix)
+    def _sync_card_items(self, definitions: List[StrategyDefinition]) -> None:
+        """策略 key 序列与现有卡片一致时直接返回，否则按注册顺序重建全部卡片。"""
+        keys = [definition.key for definition in definitions]
+        if keys == list(self._card_items):
+            return
+        self._prebuild_icons(definitions)
+        self.card_view.blockSignals(True)
+        try:
+            self.card_view.clear()
+            self._card_items = {}
+            for definition in definitions:
+                item = self._create_card_item(definition)
+                self.card_view.addItem(item)
+                self._card_items[definition.key] = item
+        finally:
+            self.card_view.blockSignals(False)
+
+    def _card_match_index(self, definition: StrategyDefinition) -> Tuple[FrozenSet[str], str]:
+        """按策略缓存标签集合与小写检索文本；定义对象被替换时重新计算。"""
+        cached = self._card_match_cache.get(definition.key)
+        if cached is not None and cached[0] is definition:
+            return cached[1], cached[2]
+        tag_set = frozenset(definition.tags)
+        haystack = ' '.join(filter(None, [definition.title, definition.description, ' '.join(definition.tags)])).lower()
+        self._card_match_cache[definition.key] = (definition, tag_set, haystack)
+        return tag_set, haystack
+
+    @QtCore.pyqtSlot()
+    def _on_card_filter_changed(self) -> None:
+        # 分类切换立即刷新，同时取消尚未触发的搜索防抖。
+        self._card_search_timer.stop()
+        if self._initialising:
+            return
+        self.refresh_strategy_items()
+
+    def _create_card_item(self, definition: StrategyDefinition) -> QtWidgets.QListWidgetItem:
+        snippet = (definition.description or '').replace('\n', ' ').strip()
+        if len(snippet) > 48:
+            snippet = snippet[:45] + '…'
+        meta = ' / '.join(definition.tags[:3])
+        secondary = meta or snippet
+        if not secondary:
+            secondary = '--'
+        elif len(secondary) > 48:
+            secondary = secondary[:45] + '…'
+        display_text = f"{definition.title}\n{secondary}"
+        item = QtWidgets.QListWidgetItem(display_text)
+        item.setData(QtCore.Qt.UserRole, definition.key)
+        item.setToolTip(definition.description or '')
+        item.setIcon(self._build_strategy_icon(definition))
+        item.setSizeHint(QtCore.QSize(260, 68))
+        return item
 
+    def _build_strategy_icon(self, definition: StrategyDefinition) -> QtGui.QIcon:
+        cache_key = (definition.key, definition.title)
+        icon = self._icon_cache.get(cache_key)
+        if icon is None:
+            self._prebuild_icons([definition])
+            icon = self._icon_cache[cache_key]
+        return icon
+
+    def _prebuild_icons(self, definitions: List[StrategyDefinition]) -> None:
+        """把缺失的策略图标画进同一张图集，只开一次 QPainter，再按格子切成各自的图标。"""
+        missing = [d for d in definitions if (d.key, d.title) not in self._icon_cache]
+        size = _ICON_SIZE
+        for start in range(0, len(missing), _ICON_ATLAS_COLUMNS):
+            batch = missing[start:start + _ICON_ATLAS_COLUMNS]
+            atlas = QtGui.QPixmap(size * len(batch), size)
+            atlas.fill(QtCore.Qt.transparent)
+            painter = QtGui.QPainter(atlas)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.setFont(QtGui.QFont('Segoe UI', 18, QtGui.QFont.Bold))
+            for i, definition in enumerate(batch):
+                cell = QtCore.QRectF(i * size, 0, size, size)
+                color = _ICON_PALETTE[zlib.crc32(definition.key.encode('utf-8')) % len(_ICON_PALETTE)]
+                painter.setBrush(QtGui.QBrush(QtGui.QColor(color)))
+                painter.setPen(QtCore.Qt.NoPen)
+                painter.drawRoundedRect(cell.adjusted(4, 4, -4, -4), 12, 12)
+                painter.setPen(QtGui.QPen(QtGui.QColor('#111')))
+                painter.drawText(cell, QtCore.Qt.AlignCenter, definition.title[:1].upper())
+            painter.end()
+            for i, definition in enumerate(batch):
+                self._icon_cache[(definition.key, definition.title)] = QtGui.QIcon(atlas.copy(i * size, 0, size, size))
+
+    @QtCore.pyqtSlot()
     def _on_card_selection_changed(self) -> None:
         row = self.card_view.currentRow()
         if row < 0:
@@ -507,38 +1064,75 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         return self.registry.get(self.current_strategy_key)
 
     def _rebuild_param_form(self, definition: Optional[StrategyDefinition]) -> None:
-        while self.param_form.rowCount():
-            self.param_form.removeRow(0)
-        self.param_widgets.clear()
+        # 重建期间暂停参数区重绘，并从末行开始取出，避免每删一行都重排剩余行。
+        self.param_group.setUpdatesEnabled(False)
+        try:
+            for row in range(self.param_form.rowCount() - 1, -1, -1):
+                taken = self.param_form.takeRow(row)
+                for layout_item in (taken.labelItem, taken.fieldItem):
+                    widget = layout_item.widget() if layout_item is not None else None
+                    if widget is not None:
+                        self._release_param_widget(widget)
+            self.param_widgets.clear()
+            self._fill_param_form(definition)
+        finally:
+            self.param_group.setUpdatesEnabled(True)
+
+    def _release_param_widget(self, widget: QtWidgets.QWidget) -> None:
+        widget.hide()
+        if isinstance(widget, QtWidgets.QDoubleSpinBox):
+            kind = 'number'
+        elif isinstance(widget, QtWidgets.QComboBox):
+            kind = 'select'
+        elif isinstance(widget, QtWidgets.QLineEdit):
+            kind = 'text'
+        elif isinstance(widget, QtWidgets.QLabel):
+            kind = 'label'
+        else:
+            widget.deleteLater()
+            return
+        self._widget_pool[kind].append(widget)
+
+    def _acquire_label(self, text: str, tooltip: str = '') -> QtWidgets.QLabel:
+        pool = self._widget_pool['label']
+        label = pool.pop() if pool else QtWidgets.QLabel(self)
+        label.setText(text)
+        label.setToolTip(tooltip)
+        label.show()
+        return label  # type: ignore[return-value]
 
+    def _fill_param_form(self, definition: Optional[StrategyDefinition]) -> None:
         if not definition or not definition.parameters:
-            self.param_form.addRow(QtWidgets.QLabel('该策略暂无可配置参数', self))
+            self.param_form.addRow(self._acquire_label('该策略暂无可配置参数'))
             return
 
+        pool = self._widget_pool
         for param in definition.parameters:
             widget: QtWidgets.QWidget
             if param.type == 'number':
-                spin = QtWidgets.QDoubleSpinBox(self)
-                spin.setRange(-1_000_000, 1_000_000)
-                spin.setDecimals(4)
+                if pool['number']:
+                    spin = pool['number'].pop()
+                else:
+                    spin = QtWidgets.QDoubleSpinBox(self)
+                    spin.setRange(-1_000_000, 1_000_000)
+                    spin.setDecimals(4)
                 spin.setValue(float(param.default or 0.0))
                 widget = spin
             elif param.type == 'select' and param.options:
-                combo = QtWidgets.QComboBox(self)
+                combo = pool['select'].pop() if pool['select'] else QtWidgets.QComboBox(self)
+                combo.clear()
                 for option in param.options:
                     combo.addItem(str(option), option)
                 widget = combo
             else:
-                edit = QtWidgets.QLineEdit(self)
-                if param.default is not None:
-                    edit.setText(str(param.default))
+                edit = pool['text'].pop() if pool['text'] else QtWidgets.QLineEdit(self)
+                edit.setText('' if param.default is None else str(param.default))
                 widget = edit
 
             helper = param.description or ''
-            row_label = QtWidgets.QLabel(param.label, self)
-            if helper:
-                row_label.setToolTip(helper)
-                widget.setToolTip(helper)
+            row_label = self._acquire_label(param.label, helper)
+            widget.setToolTip(helper)
+            widget.show()
             self.param_form.addRow(row_label, widget)
             self.param_widgets[param.key] = widget
 
@@ -585,6 +1179,7 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
 
         return []
 
+    @QtCore.pyqtSlot()
     def _run_preview(self) -> None:
         definition = self._current_definition()
         if not definition:
@@ -619,6 +1214,7 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
                 pass
             self.preview_status.setText('未生成标记')
 
+    @QtCore.pyqtSlot()
     def _run_scan(self) -> None:
         definition = self._current_definition()
         if not definition:
@@ -629,16 +1225,11 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         if not universe:
             QtWidgets.QMessageBox.warning(self, '股票池为空', '请先加载股票列表')
             return
-        db_path = self.db_path_provider()
-        if not db_path or not Path(db_path).exists():
+        db_path, db_exists = self._resolve_db()
+        if not db_exists:
             QtWidgets.QMessageBox.warning(self, '缺少数据库', '请先选择数据库文件')
             return
 
-        self.scan_total_count = len(universe)
-        self.scan_processed_count = 0
-        self.scan_results = []
-        self.scan_table.setRowCount(0)
-        self._update_scan_progress_label()
         request = ScanRequest(
             strategy_key=definition.key,
             universe=universe,
@@ -646,93 +1237,126 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
             end_date=self.scan_end.date().toPyDate(),
             params=self._collect_params(),
         )
+        key = self._request_key(request)
+        if self.scan_running:
+            # 同一任务仍在执行时直接沿用其结果，不重复启动扫描。
+            if key == self._scan_pending_key:
+                self._flush_logs()
+                self.scan_log.append('相同的选股任务正在运行，等待其完成...')
+            return
+        cache_key = key[:1] + key[2:]
+        wanted = frozenset(universe)
+        db_mtime = self._db_mtime(db_path)
+        merge_base: Optional[List[ScanResult]] = None
+        entry = self._scan_cache.get(cache_key)
+        if entry is not None:
+            cached_results, scanned_at, cached_mtime, cached_universe = entry
+            if cached_mtime != db_mtime or time.time() - scanned_at >= _SCAN_CACHE_TTL:
+                # 数据已更新或缓存过期：整体重新扫描。
+                del self._scan_cache[cache_key]
+            elif wanted <= cached_universe:
+                self._scan_cache.move_to_end(cache_key)
+                self.scan_total_count = self.scan_processed_count = len(universe)
+                self._update_scan_progress_label()
+                self._flush_logs()  # 先写出缓冲的进度日志，保证顺序
+                self.scan_log.append('参数未变，使用缓存的选股结果')
+                self._populate_scan_results(
+                    [r for r in cached_results if r.table_name in wanted or r.symbol in wanted]
+                )
+                return
+            elif cached_universe <= wanted:
+                # 股票池只新增了代码：仅扫描新增部分，完成后与缓存结果合并。
+                merge_base = list(cached_results)
+                request = dataclasses.replace(request, universe=[sym for sym in universe if sym not in cached_universe])
+                self._flush_logs()
+                self.scan_log.append(f'增量选股：仅扫描新增的 {len(request.universe)} 只股票')
+        self._scan_pending_key = key
+        self._scan_pending_cache = (cache_key, wanted, db_mtime, merge_base)
+
+        self.scan_total_count = len(request.universe)
+        self.scan_processed_count = 0
+        self.scan_results = []
+        self._scan_score_sum = 0.0
+        self._scan_score_max = -math.inf
+        self.scan_model.clear()
+        self._update_scan_progress_label()
         self.scan_log.append('开始选股...')
         self._toggle_scan_controls(True)
+        total = len(request.universe)
+        self.scanner.set_batch_size(min(
+            _SCAN_BATCH_MAX,
+            max(_SCAN_BATCH_MIN, self.scanner.max_workers * 2, math.ceil(total / _SCAN_TARGET_BATCHES)),
+        ))
         try:
             self.scanner.run_async(request, db_path)
         except Exception as exc:  # pragma: no cover
             self._toggle_scan_controls(False)
             QtWidgets.QMessageBox.critical(self, '扫描启动失败', str(exc))
 
+    def _resolve_db(self) -> Tuple[Optional[Path], bool]:
+        """返回 (数据库路径, 是否存在)，1 秒内的重复点击复用上次结果。"""
+        now = time.monotonic()
+        cached = self._db_cache
+        if cached is not None and now - cached[0] < _DB_CACHE_SECONDS:
+            return cached[1], cached[2]
+        raw = self.db_path_provider()
+        path = Path(raw) if raw else None
+        exists = bool(path and path.exists())
+        self._db_cache = (now, path, exists)
+        return path, exists
+
+    @staticmethod
+    def _request_key(request: Any) -> Tuple[Any, ...]:
+        """扫描/回测请求的可哈希标识，参数值统一取 repr 以兼容不可哈希的选项。"""
+        params = tuple(sorted((str(k), repr(v)) for k, v in (request.params or {}).items()))
+        extras = tuple(
+            getattr(request, name, None)
+            for name in ('initial_cash', 'max_positions', 'position_pct', 'commission_rate', 'slippage')
+        )
+        return (request.strategy_key, tuple(request.universe), request.start_date, request.end_date, params, extras)
+
+    @QtCore.pyqtSlot()
     def _cancel_scan(self) -> None:
         if not self.scan_running:
             return
+        self._flush_logs()
         self.scan_log.append('正在取消选股...')
         self.scanner.cancel_async()
 
     def _populate_scan_results(self, results: List[ScanResult]) -> None:
         self.scan_results = results
-        self.scan_table.setRowCount(len(results))
-        for row, result in enumerate(results):
-            display_name = result.name or result.symbol
-            self.scan_table.setItem(row, 0, QtWidgets.QTableWidgetItem(display_name))
-            self.scan_table.setItem(row, 1, QtWidgets.QTableWidgetItem(result.symbol))
-            self.scan_table.setItem(row, 2, QtWidgets.QTableWidgetItem(result.entry_date or ''))
-            price_text = f"{result.entry_price:.2f}" if isinstance(result.entry_price, (int, float)) else ''
-            self.scan_table.setItem(row, 3, QtWidgets.QTableWidgetItem(price_text))
-            score_text = f"{result.score:.2f}" if isinstance(result.score, (int, float)) else str(result.score)
-            self.scan_table.setItem(row, 4, QtWidgets.QTableWidgetItem(score_text))
-            remark = result.metadata.get('note') or result.metadata.get('status', '')
-            self.scan_table.setItem(row, 5, QtWidgets.QTableWidgetItem(remark))
+        # 模型一次 reset 替换全部结果，视图只为可见行取数。
+        self.scan_model.set_rows(results)
         self.scan_log.append(f'选股完成，共 {len(results)} 条结果')
         self._update_scan_kpis(results)
         self._update_scan_action_state()
 
-    def _append_scan_result_row(self, result: ScanResult) -> None:
-        row = self.scan_table.rowCount()
-        self.scan_table.insertRow(row)
-        display_name = result.name or result.symbol
-        self.scan_table.setItem(row, 0, QtWidgets.QTableWidgetItem(display_name))
-        self.scan_table.setItem(row, 1, QtWidgets.QTableWidgetItem(result.symbol))
-        self.scan_table.setItem(row, 2, QtWidgets.QTableWidgetItem(result.entry_date or ''))
-        price_text = f"{result.entry_price:.2f}" if isinstance(result.entry_price, (int, float)) else ''
-        self.scan_table.setItem(row, 3, QtWidgets.QTableWidgetItem(price_text))
-        score_text = f"{result.score:.2f}" if isinstance(result.score, (int, float)) else str(result.score)
-        self.scan_table.setItem(row, 4, QtWidgets.QTableWidgetItem(score_text))
-        remark = result.metadata.get('note') or result.metadata.get('status', '')
-        self.scan_table.setItem(row, 5, QtWidgets.QTableWidgetItem(remark))
-
+    @QtCore.pyqtSlot(object)
     def _on_scan_result(self, result: object) -> None:
         if not isinstance(result, ScanResult):
             return
         self.scan_results.append(result)
-        self._append_scan_result_row(result)
-        self._update_scan_kpis(self.scan_results)
+        if not self._scan_rows_flush_scheduled:
+            self._scan_rows_flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self._flush_scan_rows)
+
+    @QtCore.pyqtSlot()
+    def _flush_scan_rows(self) -> None:
+        """把尚未进入表格模型的流式结果一次性插入，并只刷新一次 KPI 与按钮状态。"""
+        self._scan_rows_flush_scheduled = False
+        pending = self.scan_results[self.scan_model.rowCount():]
+        if not pending:
+            return
+        self.scan_model.append_rows(pending)
+        self._accumulate_scan_kpis(pending)
         self._update_scan_action_state()
 
     def _populate_backtest_table(self, trades: List[Dict[str, Any]]) -> None:
         self.backtest_results = trades
-        self.backtest_table.setRowCount(len(trades))
-        for row, trade in enumerate(trades):
-            symbol_item = QtWidgets.QTableWidgetItem(str(trade.get('symbol', '')))
-            entry_date_item = QtWidgets.QTableWidgetItem(str(trade.get('entry_date', '')))
-            exit_date_item = QtWidgets.QTableWidgetItem(str(trade.get('exit_date', '')))
-            shares_value = trade.get('shares', 0.0)
-            shares_item = QtWidgets.QTableWidgetItem(f"{shares_value:.2f}")
-            entry_price = trade.get('entry_price')
-            exit_price = trade.get('exit_price')
-            entry_price_item = QtWidgets.QTableWidgetItem(f"{entry_price:.2f}" if isinstance(entry_price, (int, float)) else '')
-            exit_price_item = QtWidgets.QTableWidgetItem(f"{exit_price:.2f}" if isinstance(exit_price, (int, float)) else '')
-            return_pct = trade.get('return_pct')
-            return_item = QtWidgets.QTableWidgetItem(f"{(return_pct or 0) * 100:.2f}%")
-            pnl = trade.get('pnl') or 0.0
-            pnl_item = QtWidgets.QTableWidgetItem(f"{pnl:.2f}")
-            color_positive = QtGui.QColor('#ef4444')
-            color_negative = QtGui.QColor('#16a34a')
-            if pnl_item and isinstance(pnl, (int, float)):
-                pnl_item.setForeground(QtGui.QBrush(color_positive if pnl >= 0 else color_negative))
-            if return_item and isinstance(return_pct, (int, float)):
-                return_item.setForeground(QtGui.QBrush(color_positive if return_pct >= 0 else color_negative))
-
-            self.backtest_table.setItem(row, 0, symbol_item)
-            self.backtest_table.setItem(row, 1, entry_date_item)
-            self.backtest_table.setItem(row, 2, exit_date_item)
-            self.backtest_table.setItem(row, 3, shares_item)
-            self.backtest_table.setItem(row, 4, entry_price_item)
-            self.backtest_table.setItem(row, 5, exit_price_item)
-            self.backtest_table.setItem(row, 6, return_item)
-            self.backtest_table.setItem(row, 7, pnl_item)
+        # 模型一次 reset 替换全部成交，视图只为可见行取数。
+        self.backtest_model.set_trades(trades)
 
+    @QtCore.pyqtSlot(QtCore.QModelIndex)
     def _on_backtest_row_activated(self, index: QtCore.QModelIndex) -> None:
         row = index.row()
         if not (0 <= row < len(self.backtest_results)):
@@ -741,10 +1365,6 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         symbol = str(trade.get('symbol') or '').strip()
         if not symbol:
             return
-        try:
-            self.load_symbol_handler(symbol)
-        except Exception:
-            pass
         markers: List[Dict[str, Any]] = []
         entry_date = trade.get('entry_date') or trade.get('entryTime')
         exit_date = trade.get('exit_date') or trade.get('exitTime')
@@ -770,6 +1390,19 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
                 'text': f'回测卖出 {exit_price:.2f}' if isinstance(exit_price, (int, float)) else '回测卖出',
                 'price': exit_price,
             })
+        self._pending_backtest_nav = (symbol, markers)
+        self._backtest_nav_timer.start()
+
+    @QtCore.pyqtSlot()
+    def _apply_pending_backtest_nav(self) -> None:
+        pending, self._pending_backtest_nav = self._pending_backtest_nav, None
+        if pending is None:
+            return
+        symbol, markers = pending
+        try:
+            self.load_symbol_handler(symbol)
+        except Exception:
+            pass
         if self.render_markers_handler:
             try:
                 self.render_markers_handler(symbol, markers, [])
@@ -783,6 +1416,8 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
 
     def update_selected_symbol(self, symbol: Optional[str]) -> None:
         self._current_selected_symbol = symbol
+        # K线切换标的会重载图表并清空标记，之前的预览已不在图上，允许再次预览
+        self._last_preview_key = None
         self._apply_auto_universe_symbol()
 
     def _apply_auto_universe_symbol(self) -> None:
@@ -830,60 +1465,128 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         dialog.show_html(title, html)
 
     def _update_scan_kpis(self, results: List[ScanResult]) -> None:
-        total = len(results)
-        avg_score = sum(r.score for r in results) / total if total else 0.0
-        best = max((r.score for r in results), default=0.0)
-        self._assign_kpi_values(self.scan_kpis, {
-            '候选数': f'{total}',
-            '平均得分': f'{avg_score:.2f}',
-            '最高得分': f'{best:.2f}',
-        })
-
+        self._scan_score_sum = 0.0
+        self._scan_score_max = -math.inf
+        self._accumulate_scan_kpis(results)
+
+    def _accumulate_scan_kpis(self, new_results: List[ScanResult]) -> None:
+        """把新增结果并入累计的得分和与最高分，再按 scan_results 总数刷新 KPI。"""
+        score_sum = self._scan_score_sum
+        best = self._scan_score_max
+        for result in new_results:
+            score = result.score
+            score_sum += score
+            if score > best:
+                best = score
+        self._scan_score_sum = score_sum
+        self._scan_score_max = best
+        total = len(self.scan_results)
+        avg_score = score_sum / total if total else 0.0
+        if not total:
+            best = 0.0
+        _set_label_text(self.kpi_scan_count, f'{total}')
+        _set_label_text(self.kpi_scan_avg, f'{avg_score:.2f}')
+        _set_label_text(self.kpi_scan_best, f'{best:.2f}')
+
+    @QtCore.pyqtSlot(QtCore.QModelIndex)
     def _on_scan_row_activated(self, index: QtCore.QModelIndex) -> None:
         row = index.row()
         if 0 <= row < len(self.scan_results):
             table_name = self.scan_results[row].table_name
             self.load_symbol_handler(table_name)
-            # 延迟触发预览，确保K线已切换到选中标的
-            QtCore.QTimer.singleShot(80, self._preview_current_strategy)
+            # 延迟触发预览，确保K线已切换到选中标的；重复启动计时器即合并连续切换。
+            self._preview_table = table_name
+            self._preview_timer.start()
 
+    @QtCore.pyqtSlot(str)
     def _append_scan_log(self, message: str) -> None:
-        self.scan_log.append(message)
-
+        self._scan_log_buffer.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    @QtCore.pyqtSlot()
+    def _flush_logs(self) -> None:
+        """把缓冲的进度日志一次性写入面板；任务状态变化前调用以保证日志顺序。"""
+        self._log_flush_timer.stop()
+        scan_log = getattr(self, 'scan_log', None)
+        backtest_log = getattr(self, 'backtest_log', None)
+        for buffer, panel in ((self._scan_log_buffer, scan_log), (self._backtest_log_buffer, backtest_log)):
+            if buffer and panel is not None:
+                panel.append('\n'.join(buffer))
+                buffer.clear()
+
+    @QtCore.pyqtSlot(str)
     def _on_scan_progress(self, message: str) -> None:
-        match = re.search(r"\((\d+)/(\d+)\)", message)
+        self._append_scan_log(message)
+        # 计数总在消息末尾（"扫描 xxx (i/n)"），从最后一个括号起匹配，不扫描表名部分。
+        match = _PROGRESS_RE.search(message, max(message.rfind('('), 0))
         if match:
             try:
                 self.scan_processed_count = int(match.group(1))
                 self.scan_total_count = int(match.group(2))
-                self._update_scan_progress_label()
             except ValueError:
                 pass
 
+    @QtCore.pyqtSlot(object)
     def _on_scan_finished(self, results: object) -> None:
+        self._flush_logs()
         parsed = list(results or [])
         self.scan_processed_count = self.scan_total_count or len(parsed)
+        pending, self._scan_pending_cache = self._scan_pending_cache, None
+        if pending is not None:
+            cache_key, universe, db_mtime, merge_base = pending
+            if merge_base:
+                parsed = sorted(merge_base + parsed, key=lambda r: r.score, reverse=True)
+            self._scan_cache[cache_key] = (list(parsed), time.time(), db_mtime, universe)
+            self._scan_cache.move_to_end(cache_key)
+            while len(self._scan_cache) > _SCAN_CACHE_CAP:
+                self._scan_cache.popitem(last=False)
         self._populate_scan_results(parsed)
         self._toggle_scan_controls(False)
 
+    @staticmethod
+    def _db_mtime(db_path: Any) -> Optional[float]:
+        try:
+            return Path(db_path).stat().st_mtime
+        except OSError:
+            return None
+
+    @QtCore.pyqtSlot()
+    def clear_scan_cache(self) -> None:
+        self._scan_cache.clear()
+        self.scan_log.append('选股缓存已清空')
+
+    @QtCore.pyqtSlot(str)
     def _on_scan_failed(self, message: str) -> None:
+        self._scan_pending_cache = None
         QtWidgets.QMessageBox.critical(self, '选股失败', message)
         self._toggle_scan_controls(False)
 
+    @QtCore.pyqtSlot()
     def _on_scan_cancelled(self) -> None:
+        self._flush_logs()
+        self._scan_pending_cache = None
         self.scan_log.append('选股已取消')
         self._toggle_scan_controls(False)
 
     def _toggle_scan_controls(self, running: bool) -> None:
+        self._flush_logs()
+        if not running:
+            self._flush_scan_rows()
         self.scan_running = running
         self.scan_button.setEnabled(not running)
         self.scan_cancel_button.setVisible(running)
         self.scan_cancel_button.setEnabled(running)
         self._update_scan_action_state()
-        if not running and self.scan_total_count:
+        if running:
+            self._progress_timer.start()
+            return
+        self._progress_timer.stop()
+        if self.scan_total_count:
             self.scan_processed_count = min(self.scan_processed_count, self.scan_total_count)
-            self._update_scan_progress_label()
+        self._update_scan_progress_label()
 
+    @QtCore.pyqtSlot()
     def _preview_current_strategy(self) -> None:
         if not self.preview_handler:
             return
@@ -891,9 +1594,15 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         if not definition:
             return
         params = self._collect_params()
+        key = (self._preview_table, definition.key, repr(sorted(params.items())))
+        if key == self._last_preview_key:
+            return
+        self._last_preview_key = key
         try:
             self.preview_handler(definition.key, params)
         except Exception as exc:  # pragma: no cover - runtime diagnostics
+            self._last_preview_key = None  # 失败后允许对同一组合重试
+            self._ensure_scan_tab()
             self.scan_log.append(f'预览失败: {exc}')
 
     def _filter_universe_by_board(self, universe: List[str]) -> List[str]:
@@ -902,53 +1611,48 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         # 勾选的板块视为要过滤掉的板块
         selected_boards = [
             item.text()
-            for item in self.scan_board_filter.findItems('*', QtCore.Qt.MatchWrap | QtCore.Qt.MatchWildcard)
+            for item in self._board_filter_items
             if item.checkState() == QtCore.Qt.Checked
         ]
-        if not selected_boards:
+        # 所有勾选板块的前缀合并成一个元组，每个代码只提取一次数字、做一次 startswith。
+        excluded = tuple(prefix for board in selected_boards for prefix in _BOARD_PREFIXES.get(board, ()))
+        if not excluded:
             return universe
         filtered: List[str] = []
         for code in universe:
             # 若代码属于勾选板块，则跳过；未命中勾选板块的保留
-            if any(self._matches_board(code, board) for board in selected_boards):
+            if self._code_digits(code).startswith(excluded):
                 continue
             filtered.append(code)
         return filtered
 
     @staticmethod
-    def _matches_board(code: str, board: str) -> bool:
+    def _code_digits(code: str) -> str:
+        # 取纯数字部分开头判断；A 股代码多为纯数字，直接返回。
         code_str = (code or "").strip()
-        if not code_str:
-            return False
-        # 取纯数字部分开头判断
-        digits = "".join(ch for ch in code_str if ch.isdigit())
-        prefix = digits[:3] if len(digits) >= 3 else digits
-
-        if board == "创业板":
-            return prefix.startswith("300") or prefix.startswith("301")
-        if board == "科创板":
-            return prefix.startswith("688") or prefix.startswith("689")
-        if board == "北交所":
-            return prefix.startswith("8") or prefix.startswith("4") or prefix.startswith("920")
-        if board == "新三板":
-            return prefix.startswith("43") or prefix.startswith("83") or prefix.startswith("87")
-        return False
+        if code_str.isdigit():
+            return code_str
+        return _NONDIGIT_RE.sub('', code_str)
 
+    @QtCore.pyqtSlot()
     def _update_scan_progress_label(self) -> None:
         if self.scan_progress_label is None:
             return
         total = max(self.scan_total_count, 0)
         processed = min(self.scan_processed_count, total) if total else self.scan_processed_count
-        self.scan_progress_label.setText(f'进度 {processed}/{total}')
+        _set_label_text(self.scan_progress_label, f'进度 {processed}/{total}')
 
+    @QtCore.pyqtSlot()
     def _update_scan_action_state(self) -> None:
+        if not hasattr(self, 'scan_export_button'):
+            return  # 选股页尚未构建
         has_results = bool(self.scan_results)
         enabled = has_results and not self.scan_running
         self.scan_export_button.setEnabled(enabled)
         if hasattr(self, 'scan_export_image_button'):
             self.scan_export_image_button.setEnabled(enabled)
         self.scan_copy_button.setEnabled(enabled)
-        has_selection = bool(self.scan_table.selectedItems()) if hasattr(self, 'scan_table') else False
+        has_selection = self.scan_table.selectionModel().hasSelection() if hasattr(self, 'scan_table') else False
         if hasattr(self, 'scan_add_watchlist_button'):
             self.scan_add_watchlist_button.setEnabled(
                 enabled and has_selection and self.add_to_watchlist is not None
@@ -966,26 +1670,34 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         )
         if not file_path:
             return
-        try:
-            with open(file_path, 'w', encoding='utf-8-sig', newline='') as csv_file:
-                writer = csv.writer(csv_file)
-                writer.writerow(['排名', '股票', '买入日期', '买入价', '得分', '备注'])
-                for idx, result in enumerate(self.scan_results, start=1):
-                    price = f"{result.entry_price:.2f}" if isinstance(result.entry_price, (int, float)) else ''
-                    remark = result.metadata.get('note') or result.metadata.get('status', '')
-                    writer.writerow([
-                        idx,
-                        result.symbol,
-                        result.entry_date or '',
-                        price,
-                        result.score,
-                        remark,
-                    ])
-        except Exception as exc:  # pragma: no cover - file errors
-            QtWidgets.QMessageBox.critical(self, '导出失败', str(exc))
-            return
+        # 在 UI 线程一次性快照为元组，任务线程里用 writer.writerows 整批写出。
+        rows: List[Tuple[Any, ...]] = [
+            (
+                idx,
+                result.symbol,
+                result.entry_date or '',
+                _fmt_money(result.entry_price),
+                result.score,
+                result.metadata.get('note') or result.metadata.get('status', ''),
+            )
+            for idx, result in enumerate(self.scan_results, start=1)
+        ]
+        # 文件写入放到线程池，完成/失败通过信号回到 UI 线程。
+        signals = _ExportSignals(self)
+        signals.finished.connect(self._on_csv_export_finished)
+        signals.failed.connect(self._on_csv_export_failed)
+        signals.finished.connect(signals.deleteLater)
+        signals.failed.connect(signals.deleteLater)
+        QtCore.QThreadPool.globalInstance().start(_CsvExportTask(file_path, rows, signals))
+
+    @QtCore.pyqtSlot(str)
+    def _on_csv_export_finished(self, file_path: str) -> None:
         self.scan_log.append(f'已导出到 {file_path}')
 
+    @QtCore.pyqtSlot(str)
+    def _on_csv_export_failed(self, message: str) -> None:
+        QtWidgets.QMessageBox.critical(self, '导出失败', message)
+
     def _copy_scan_symbols(self) -> None:
         if not self.scan_results:
             QtWidgets.QMessageBox.information(self, '无数据', '当前没有可复制的选股结果。')
@@ -1009,84 +1721,40 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         if not file_path:
             return
 
-        cols = 4
-        cell_w = 260
-        cell_h = 90
-        gap = 14
-        margin = 16
-        rows = math.ceil(len(self.scan_results) / cols)
-        width = margin * 2 + cols * cell_w + (cols - 1) * gap
-        height = margin * 2 + rows * cell_h + (rows - 1) * gap
-
-        pixmap = QtGui.QPixmap(width, height)
-        pixmap.fill(QtGui.QColor('#f8fafc'))
-        painter = QtGui.QPainter(pixmap)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-
-        title_font = QtGui.QFont()
-        title_font.setWeight(QtGui.QFont.DemiBold)
-        title_font.setPointSize(title_font.pointSize() + 1)
-        meta_font = QtGui.QFont()
-        meta_font.setPointSize(meta_font.pointSize() - 1)
-
-        for idx, result in enumerate(self.scan_results):
-            col = idx % cols
-            row = idx // cols
-            x = margin + col * (cell_w + gap)
-            y = margin + row * (cell_h + gap)
-            rect = QtCore.QRectF(x, y, cell_w, cell_h)
-
-            painter.setPen(QtGui.QPen(QtGui.QColor('#e2e8f0')))
-            painter.setBrush(QtGui.QColor('#ffffff'))
-            painter.drawRoundedRect(rect, 8, 8)
-
-            # Text content
-            symbol = str(result.symbol or result.table_name or '').strip()
-            name = str(result.name or '').strip()
-            header = f"{symbol}  {name}" if name else symbol
-            score = f"得分 {result.score:.2f}" if isinstance(result.score, (int, float)) else f"得分 {result.score}"
-            entry_date = f"买入日: {result.entry_date or '--'}"
-            price_val = ''
-            if isinstance(result.entry_price, (int, float)):
-                price_val = f"买入价: {result.entry_price:.2f}"
-            elif result.entry_price:
-                price_val = f"买入价: {result.entry_price}"
-
-            painter.setFont(title_font)
-            painter.setPen(QtGui.QColor('#0f172a'))
-            painter.drawText(rect.adjusted(12, 10, -12, -10), QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, header)
-
-            painter.setFont(meta_font)
-            painter.setPen(QtGui.QColor('#475569'))
-            painter.drawText(rect.adjusted(12, 36, -12, -10), QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, entry_date)
-            painter.drawText(rect.adjusted(12, 56, -12, -10), QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, price_val)
-            painter.drawText(rect.adjusted(12, 10, -12, -10), QtCore.Qt.AlignRight | QtCore.Qt.AlignTop, score)
-
-        painter.end()
-
-        saved = pixmap.save(file_path, 'PNG')
-        if not saved:
-            QtWidgets.QMessageBox.warning(self, '导出失败', '无法保存图片，请检查路径或权限。')
-            return
+        # 绘制与保存都在线程池中完成，UI 线程只负责弹框。
+        signals = _ExportSignals(self)
+        signals.finished.connect(self._on_image_export_finished)
+        signals.failed.connect(self._on_image_export_failed)
+        signals.finished.connect(signals.deleteLater)
+        signals.failed.connect(signals.deleteLater)
+        QtCore.QThreadPool.globalInstance().start(_ScanImageExportTask(file_path, list(self.scan_results), signals))
+
+    @QtCore.pyqtSlot(str)
+    def _on_image_export_finished(self, file_path: str) -> None:
         self.scan_log.append(f'已导出图片到 {file_path}')
         QtWidgets.QMessageBox.information(self, '导出完成', f'图片已保存到:\n{file_path}')
 
+    @QtCore.pyqtSlot(str)
+    def _on_image_export_failed(self, message: str) -> None:
+        QtWidgets.QMessageBox.warning(self, '导出失败', message)
+
     def _add_selected_to_watchlist(self) -> None:
         if self.add_to_watchlist is None:
             QtWidgets.QMessageBox.information(self, '未启用自选', '未检测到自选股存储，无法加入自选。')
             return
         if not hasattr(self, 'scan_table') or self.scan_table is None:
             return
-        rows = {idx.row() for idx in self.scan_table.selectedIndexes()}
+        rows = sorted(idx.row() for idx in self.scan_table.selectionModel().selectedRows())
         if not rows:
             QtWidgets.QMessageBox.information(self, '无选中', '请先在列表中选择要加入自选的股票。')
             return
         items: List[Tuple[str, str]] = []
         for row in rows:
-            code_item = self.scan_table.item(row, 1)
-            name_item = self.scan_table.item(row, 0)
-            symbol = code_item.text().strip() if code_item else ''
-            name = name_item.text().strip() if name_item else ''
+            result = self.scan_model.result_at(row)
+            if result is None:
+                continue
+            symbol = (result.symbol or '').strip()
+            name = (result.name or result.symbol or '').strip()
             if symbol:
                 items.append((symbol, name))
         if not items:
@@ -1096,6 +1764,7 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         self.scan_log.append(f'已将 {len(items)} 只股票加入自选')
 
     def _toggle_backtest_controls(self, running: bool) -> None:
+        self._flush_logs()
         self.backtest_running = running
         if hasattr(self, 'backtest_button'):
             self.backtest_button.setEnabled(not running)
@@ -1106,6 +1775,7 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
             can_show = bool(self.latest_backtest_result) and not running
             self.backtest_equity_button.setEnabled(can_show)
 
+    @QtCore.pyqtSlot()
     def _run_backtest(self) -> None:
         definition = self._current_definition()
         if not definition:
@@ -1115,8 +1785,8 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
         if not universe:
             QtWidgets.QMessageBox.warning(self, '股票池为空', '请先加载股票列表')
             return
-        db_path = self.db_path_provider()
-        if not db_path or not Path(db_path).exists():
+        db_path, db_exists = self._resolve_db()
+        if not db_exists:
             QtWidgets.QMessageBox.warning(self, '缺少数据库', '请先选择数据库文件')
             return
 
@@ -1132,9 +1802,16 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
             commission_rate=float(self.backtest_commission.value()) / 100.0,
             slippage=float(self.backtest_slippage.value()) / 100.0,
         )
+        key = self._request_key(request)
+        if self.backtest_running:
+            if key == self._backtest_pending_key:
+                self._flush_logs()
+                self.backtest_log.append('相同的回测任务正在运行，等待其完成...')
+            return
+        self._backtest_pending_key = key
         self.latest_backtest_result = None
         self.backtest_log.append('开始回测...')
-        self.backtest_table.setRowCount(0)
+        self.backtest_model.clear()
         self._toggle_backtest_controls(True)
         try:
             self.engine.run_async(request, db_path)
@@ -1142,15 +1819,21 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
             self._toggle_backtest_controls(False)
             QtWidgets.QMessageBox.critical(self, '回测失败', str(exc))
 
+    @QtCore.pyqtSlot()
     def _cancel_backtest(self) -> None:
         if not self.backtest_running:
             return
+        self._flush_logs()
         self.backtest_log.append('正在取消回测...')
         self.engine.cancel_async()
 
+    @QtCore.pyqtSlot(str)
     def _append_backtest_log(self, message: str) -> None:
-        self.backtest_log.append(message)
+        self._backtest_log_buffer.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
 
+    @QtCore.pyqtSlot(object)
     def _on_backtest_finished(self, result: BacktestResult) -> None:
         self.latest_backtest_result = result
         self._toggle_backtest_controls(False)
@@ -1169,21 +1852,17 @@ class StrategyWorkbenchPanel(QtWidgets.QWidget):
             wins = sum(1 for trade in trades if trade.get('pnl', 0) > 0)
             win_rate = wins / len(trades) if trades else 0.0
         ret_pct = result.metrics.get('return_pct', 0.0)
-        self._assign_kpi_values(self.backtest_kpis, {
-            '净利润': f'{net:.2f}',
-            '总收益%': f'{ret_pct:.2f}%',
-            '最大回撤': f'{drawdown:.2f}',
-            '胜率': f'{win_rate * 100:.1f}%',
-        })
-
-    def _assign_kpi_values(self, kpis: Dict[str, QtWidgets.QLabel], values: Dict[str, str]) -> None:
-        for key, widget in kpis.items():
-            widget.setText(values.get(key, '--'))
+        _set_label_text(self.kpi_backtest_net, f'{net:.2f}')
+        _set_label_text(self.kpi_backtest_return, f'{ret_pct:.2f}%')
+        _set_label_text(self.kpi_backtest_drawdown, f'{drawdown:.2f}')
+        _set_label_text(self.kpi_backtest_win_rate, f'{win_rate * 100:.1f}%')
 
+    @QtCore.pyqtSlot(str)
     def _on_backtest_failed(self, message: str) -> None:
         self._toggle_backtest_controls(False)
         QtWidgets.QMessageBox.critical(self, '回测失败', message)
 
+    @QtCore.pyqtSlot()
     def _on_backtest_cancelled(self) -> None:
         self._toggle_backtest_controls(False)
         self.backtest_log.append('回测已取消')
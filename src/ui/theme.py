@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import logging
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from PyQt5 import QtWidgets  # type: ignore[import-not-found]
 
+_LOG = logging.getLogger("ui.theme")
+
+_THEME_VERSION = "snowying-desktop-2025.12"
+# 日志路径在导入时解析一次，避免每次记录都 resolve()
+_LOG_PATH = Path(__file__).resolve().parents[1] / "theme_debug.log"
+
 _LIGHT_STYLE = r"""
 /* SnowYing desktop-inspired palette */
 * {
@@ -266,26 +274,55 @@ QToolBar {
 QToolBar QWidget {
     color: #1b2236;
 }
+
+#snowLeftNav {
+    background-color: #f2f4f8;
+    border: none;
+    border-radius: 0;
+    border-right: 1px solid #e0e3eb;
+}
 """
 
 
+def _minify_qss(style: str) -> str:
+    """Strip comments and redundant whitespace so Qt parses a compact stylesheet."""
+    style = re.sub(r"/\*.*?\*/", "", style, flags=re.S)
+    style = re.sub(r"\s+", " ", style)
+    style = re.sub(r"\s*([{};,])\s*", r"\1", style)
+    # 只收紧声明里的冒号，避免把 "QToolBar :hover" 之类的选择器语义改掉
+    style = re.sub(r":\s+", ":", style)
+    return style.strip()
+
+
+# 导入时压缩一次，apply_app_theme 直接交给 Qt
+_LIGHT_STYLE_MIN = _minify_qss(_LIGHT_STYLE)
+
+
 def _log_theme_event(message: str) -> None:
     try:
-        log_path = Path(__file__).resolve().parents[1] / "theme_debug.log"
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with log_path.open("a", encoding="utf-8") as fh:
+        with _LOG_PATH.open("a", encoding="utf-8") as fh:
             fh.write(f"[{timestamp}] {message}\n")
     except Exception:
         pass
 
 
-def apply_app_theme(app: QtWidgets.QApplication, *, source: Optional[str] = None) -> None:
-    """Apply the SnowYing desktop-inspired light theme."""
-    app.setStyleSheet(_LIGHT_STYLE)
-    app.setProperty("snow_theme_version", "snowying-desktop-2025.12")
+def apply_app_theme(app: QtWidgets.QApplication, *, source: Optional[str] = None, force: bool = False) -> None:
+    """Apply the SnowYing desktop-inspired light theme.
+
+    Re-applying an app-wide stylesheet re-polishes every widget, so repeat calls are
+    skipped once the current theme version is installed unless ``force`` is set.
+    """
     origin = source or "unknown"
+    if not force and app.property("snow_theme_version") == _THEME_VERSION and app.styleSheet():
+        _log_theme_event(f"Theme already applied, skipping (source={origin}, app_id={id(app)})")
+        return
+    app.setStyleSheet(_LIGHT_STYLE_MIN)
+    app.setProperty("snow_theme_version", _THEME_VERSION)
+    app.setProperty("snow_theme_applied", True)
     msg = f"Applied SnowYing desktop theme (source={origin}, app_id={id(app)})"
-    print(f"[UI] {msg}")
+    # 无控制台的打包环境下 stdout 可能不可用，交给 logging 按级别过滤
+    _LOG.info("%s", msg)
     _log_theme_event(msg)
 
 
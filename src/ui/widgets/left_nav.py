@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+# 导航项 -> 标准图标
+_NAV_ICON_ROLES: Dict[str, "QtWidgets.QStyle.StandardPixmap"] = {
+    "行情": QtWidgets.QStyle.SP_DesktopIcon,
+    "数据": QtWidgets.QStyle.SP_FileDialogContentsView,
+    "策略": QtWidgets.QStyle.SP_ComputerIcon,
+}
+
 
 class SnowLeftNav(QtWidgets.QFrame):
     def __init__(
@@ -16,17 +23,10 @@ class SnowLeftNav(QtWidgets.QFrame):
         super().__init__(parent)
         self.setObjectName("snowLeftNav")
         self.setFixedWidth(92)
-        self.setStyleSheet(
-            """
-#snowLeftNav {
-    background-color: #f2f4f8;
-    border: none;
-    border-radius: 0;
-    border-right: 1px solid #e0e3eb;
-}
-"""
-        )
+        # 样式见 theme._LIGHT_STYLE 中的 #snowLeftNav，随全局样式表一次解析
         self.buttons: Dict[str, QtWidgets.QToolButton] = {}
+        # (样式名, role) -> QIcon；缓存随导航实例释放，切换样式后按新样式名重新查询
+        self._icon_cache: Dict[Tuple[str, int], QtGui.QIcon] = {}
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 18, 0, 18)
@@ -60,23 +60,29 @@ class SnowLeftNav(QtWidgets.QFrame):
         return button
 
     def set_active(self, key: str) -> None:
+        # 只重绘状态真正变化的按钮（旧选中 + 新选中），setChecked 本身会安排重绘
         for nav_key, button in self.buttons.items():
             is_active = nav_key == key
-            button.setChecked(is_active)
-            button.update()
+            if button.isChecked() != is_active:
+                button.setChecked(is_active)
 
     def _resolve_icon(self, key: str) -> QtGui.QIcon:
         style = QtWidgets.QApplication.style()
-        mapping = {
-            "行情": QtWidgets.QStyle.SP_DesktopIcon,
-            "数据": QtWidgets.QStyle.SP_FileDialogContentsView,
-            "策略": QtWidgets.QStyle.SP_ComputerIcon,
-        }
-        role = mapping.get(key)
-        return style.standardIcon(role) if role is not None else style.standardIcon(QtWidgets.QStyle.SP_FileIcon)
+        role = _NAV_ICON_ROLES.get(key, QtWidgets.QStyle.SP_FileIcon)
+        cache_key = (style.objectName(), int(role))
+        icon = self._icon_cache.get(cache_key)
+        if icon is None:
+            icon = style.standardIcon(role)
+            self._icon_cache[cache_key] = icon
+        return icon
 
 
 class _NavButton(QtWidgets.QAbstractButton):
+    # (图标底色, 图标前景色, 文字颜色)；QColor 不依赖 QApplication，导入时解析一次。
+    _COLORS_IDLE = (QtGui.QColor("#e7eaf1"), QtGui.QColor("#7a849f"), QtGui.QColor("#7a849f"))
+    _COLORS_HOVER = (QtGui.QColor("#dbe5ff"), QtGui.QColor("#1f6dff"), QtGui.QColor("#1f6dff"))
+    _COLORS_ACTIVE = (QtGui.QColor("#1f6dff"), QtGui.QColor("#ffffff"), QtGui.QColor("#1f6dff"))
+
     def __init__(
         self,
         *,
@@ -87,6 +93,9 @@ class _NavButton(QtWidgets.QAbstractButton):
     ) -> None:
         super().__init__(parent)
         self._icon = icon
+        # 图标在构造后不再变化：空图标判断只做一次，着色后的 pixmap 按颜色缓存（仅闲置/悬停/选中三种）。
+        self._icon_null = icon.isNull()
+        self._pixmap_cache: Dict[int, QtGui.QPixmap] = {}
         self._hovered = False
         self.setText(text)
         self.setCheckable(checkable)
@@ -99,12 +108,15 @@ class _NavButton(QtWidgets.QAbstractButton):
 
     def enterEvent(self, event: QtCore.QEvent) -> None:  # type: ignore[override]
         self._hovered = True
-        self.update()
+        # 选中态的配色与悬停无关，无需重绘；_hovered 仍照常记录，取消选中后可正确绘制
+        if not self.isChecked():
+            self.update()
         super().enterEvent(event)
 
     def leaveEvent(self, event: QtCore.QEvent) -> None:  # type: ignore[override]
         self._hovered = False
-        self.update()
+        if not self.isChecked():
+            self.update()
         super().leaveEvent(event)
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # type: ignore[override]
@@ -112,19 +124,12 @@ class _NavButton(QtWidgets.QAbstractButton):
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
         painter.fillRect(self.rect(), QtCore.Qt.transparent)
 
-        is_active = self.isChecked()
-        icon_bg = QtGui.QColor("#e7eaf1")
-        icon_fg = QtGui.QColor("#7a849f")
-        text_color = QtGui.QColor("#7a849f")
-
-        if is_active:
-            icon_bg = QtGui.QColor("#1f6dff")
-            icon_fg = QtGui.QColor("#ffffff")
-            text_color = QtGui.QColor("#1f6dff")
+        if self.isChecked():
+            icon_bg, icon_fg, text_color = self._COLORS_ACTIVE
         elif self._hovered:
-            icon_bg = QtGui.QColor("#dbe5ff")
-            icon_fg = QtGui.QColor("#1f6dff")
-            text_color = QtGui.QColor("#1f6dff")
+            icon_bg, icon_fg, text_color = self._COLORS_HOVER
+        else:
+            icon_bg, icon_fg, text_color = self._COLORS_IDLE
 
         icon_rect = QtCore.QRect(0, 4, 40, 40)
         icon_rect.moveCenter(QtCore.QPoint(self.width() // 2, 30))
@@ -132,7 +137,7 @@ class _NavButton(QtWidgets.QAbstractButton):
         painter.setBrush(icon_bg)
         painter.drawRoundedRect(icon_rect, 12, 12)
 
-        if not self._icon.isNull():
+        if not self._icon_null:
             pixmap = self._render_icon(icon_fg)
             if not pixmap.isNull():
                 target = icon_rect.adjusted(8, 8, -8, -8)
@@ -146,6 +151,10 @@ class _NavButton(QtWidgets.QAbstractButton):
         painter.drawText(text_rect, QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop, self.text())
 
     def _render_icon(self, color: QtGui.QColor) -> QtGui.QPixmap:
+        key = color.rgba()
+        cached = self._pixmap_cache.get(key)
+        if cached is not None:
+            return cached
         size = 20
         pixmap = QtGui.QPixmap(size, size)
         pixmap.fill(QtCore.Qt.transparent)
@@ -155,4 +164,5 @@ class _NavButton(QtWidgets.QAbstractButton):
         icon_painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceIn)
         icon_painter.fillRect(pixmap.rect(), color)
         icon_painter.end()
+        self._pixmap_cache[key] = pixmap
         return pixmap
\ No newline at end of file
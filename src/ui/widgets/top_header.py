@@ -1,10 +1,33 @@
 from __future__ import annotations
 
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 
+def _hbox(
+    parent: QtWidgets.QWidget,
+    margins: Tuple[int, int, int, int] = (0, 0, 0, 0),
+    spacing: int = 0,
+) -> QtWidgets.QHBoxLayout:
+    layout = QtWidgets.QHBoxLayout(parent)
+    layout.setContentsMargins(*margins)
+    layout.setSpacing(spacing)
+    return layout
+
+
+def _make_action_button(
+    parent: QtWidgets.QWidget,
+    text: str,
+    cursor: QtCore.Qt.CursorShape = QtCore.Qt.PointingHandCursor,
+) -> QtWidgets.QToolButton:
+    button = QtWidgets.QToolButton(parent)
+    button.setAutoRaise(True)
+    button.setCursor(cursor)
+    button.setText(text)
+    return button
+
+
 class SnowTopHeader(QtWidgets.QFrame):
     def __init__(
         self,
@@ -19,16 +42,12 @@ class SnowTopHeader(QtWidgets.QFrame):
     ) -> None:
         super().__init__(parent)
         self.setObjectName("snowTopHeader")
-        layout = QtWidgets.QHBoxLayout(self)
-        layout.setContentsMargins(24, 10, 24, 10)
-        layout.setSpacing(12)
+        layout = _hbox(self, (24, 10, 24, 10), 12)
 
         logo = QtWidgets.QFrame(self)
         logo.setObjectName("snowHeaderLogo")
         logo.setFixedSize(36, 36)
-        logo_layout = QtWidgets.QHBoxLayout(logo)
-        logo_layout.setContentsMargins(0, 0, 0, 0)
-        logo_layout.setSpacing(0)
+        logo_layout = _hbox(logo)
         logo_label = QtWidgets.QLabel(logo_text, logo)
         logo_label.setObjectName("snowHeaderLogoText")
         logo_label.setAlignment(QtCore.Qt.AlignCenter)
@@ -37,9 +56,7 @@ class SnowTopHeader(QtWidgets.QFrame):
 
         search_frame = QtWidgets.QFrame(self)
         search_frame.setObjectName("snowSearchFrame")
-        search_layout = QtWidgets.QHBoxLayout(search_frame)
-        search_layout.setContentsMargins(12, 4, 12, 4)
-        search_layout.setSpacing(8)
+        search_layout = _hbox(search_frame, (12, 4, 12, 4), 8)
         search_label = QtWidgets.QLabel("代码/名称/拼音", search_frame)
         search_label.setObjectName("snowSearchLabel")
         search_layout.addWidget(search_label)
@@ -60,22 +77,14 @@ class SnowTopHeader(QtWidgets.QFrame):
 
         right_container = QtWidgets.QFrame(self)
         right_container.setObjectName("snowHeaderActions")
-        right_layout = QtWidgets.QHBoxLayout(right_container)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_layout.setSpacing(4)
+        right_layout = _hbox(right_container, spacing=4)
         for text in ("反馈", "客服", "设置"):
-            btn = QtWidgets.QToolButton(right_container)
-            btn.setAutoRaise(True)
-            btn.setCursor(QtCore.Qt.PointingHandCursor)
-            btn.setText(text)
-            right_layout.addWidget(btn)
+            right_layout.addWidget(_make_action_button(right_container, text))
 
         self.strategy_button: Optional[QtWidgets.QToolButton] = None
 
         controls_container = QtWidgets.QFrame(right_container)
-        controls_layout = QtWidgets.QHBoxLayout(controls_container)
-        controls_layout.setContentsMargins(0, 0, 0, 0)
-        controls_layout.setSpacing(0)
+        controls_layout = _hbox(controls_container)
 
         self.min_button = self._create_window_button(
             parent=controls_container,